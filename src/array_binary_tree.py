@@ -0,0 +1,651 @@
+from array import array
+from typing import Any, Iterator, List, Optional, Tuple
+
+
+class ArrayBinaryTree:
+    """
+    Binary search tree stored in parallel arrays instead of TreeNode objects.
+
+    Every node lives in an integer slot: its value is kept in a Python list,
+    or in a typed array when a typecode such as "q" or "d" is given, and its
+    children, parent, height and subtree size are kept in typed arrays of
+    32-bit slot numbers, which limits a tree to 2**31 - 1 nodes. Slot 0
+    is a sentinel standing for "no node", with height and size 0, so links to
+    a missing child are 0 and need no special case. Slots released by remove
+    are chained into a free list through the right links and reused by the
+    following insertions.
+
+    A node costs 20 bytes in the arrays plus its value, 8 more bytes in a
+    list or a typed array, instead of a full Python object per node, and
+    walking the tree reads contiguous memory. Trees built by from_sorted or
+    rebalance place the values in inorder slots, so iterating them reads the
+    arrays front to back.
+
+    The public methods mirror BinaryTree, including the self balancing (AVL)
+    mode and the order statistics, but since there are no nodes to hand out,
+    search returns the slot of the value.
+
+    Attributes:
+        root (int): The slot of the root, or 0 if the tree is empty.
+        size (int): The number of values in the tree.
+        self_balancing (bool): Whether the tree rebalances itself on insert and remove.
+        values (list | array): The value stored in each slot.
+        lefts (array): The slot of the left child of each slot.
+        rights (array): The slot of the right child of each slot, or the next
+            free slot for released slots.
+        parents (array): The slot of the parent of each slot.
+        heights (array): The height of the subtree rooted at each slot, only
+            kept up to date by self balancing trees.
+        sizes (array): The number of nodes of the subtree rooted at each slot.
+        free_slot (int): The first released slot, or 0 if there is none.
+    """
+    __slots__ = (
+        "root", "size", "self_balancing", "typecode", "values", "lefts",
+        "rights", "parents", "heights", "sizes", "free_slot"
+    )
+
+    def __init__(self, self_balancing: bool = False, typecode: Optional[str] = None) -> None:
+        """
+        Initializes an empty tree holding only the sentinel slot.
+
+        Args:
+            self_balancing (bool): Whether the tree rebalances itself on insert and remove.
+            typecode (str | None): The array typecode of the values, e.g. "q"
+                or "d", or None to store any comparable value in a list.
+        """
+        self.root = 0
+        self.size = 0
+        self.self_balancing = self_balancing
+        self.typecode = typecode
+        self._allocate(0)
+
+    def _allocate(self, count: int) -> None:
+        """
+        Replaces the arrays with zeroed ones holding the sentinel and count slots.
+        """
+        slots = count + 1
+
+        if self.typecode is None:
+            self.values = [None] * slots
+        else:
+            self.values = array(self.typecode, [0]) * slots
+
+        self.lefts = array("i", [0]) * slots
+        self.rights = array("i", [0]) * slots
+        self.parents = array("i", [0]) * slots
+        self.heights = array("i", [0]) * slots
+        self.sizes = array("i", [0]) * slots
+        self.free_slot = 0
+
+    def _new_slot(self, value: Any, parent: int) -> int:
+        """
+        Stores a value in a released slot, or in a new one, as a leaf.
+
+        Returns: The slot of the value.
+        """
+        slot = self.free_slot
+
+        if slot:
+            self.free_slot = self.rights[slot]
+            self.values[slot] = value
+            self.lefts[slot] = 0
+            self.rights[slot] = 0
+            self.parents[slot] = parent
+            self.heights[slot] = 1
+            self.sizes[slot] = 1
+        else:
+            slot = len(self.values)
+            self.values.append(value)
+            self.lefts.append(0)
+            self.rights.append(0)
+            self.parents.append(parent)
+            self.heights.append(1)
+            self.sizes.append(1)
+
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """
+        Puts a slot back in the free list.
+        """
+        if self.typecode is None:
+            self.values[slot] = None
+
+        self.rights[slot] = self.free_slot
+        self.free_slot = slot
+
+    @classmethod
+    def from_sorted(cls, iterable, self_balancing: bool = False,
+                    typecode: Optional[str] = None) -> "ArrayBinaryTree":
+        """
+        Builds a perfectly balanced tree from values in ascending order, in
+        linear time. The values take slots 1 to n in order.
+
+        Args:
+            iterable: The values, in ascending order.
+            self_balancing (bool): Whether the new tree rebalances itself on insert and remove.
+            typecode (str | None): The array typecode of the values, as in __init__.
+        Returns:
+            ArrayBinaryTree: The new tree.
+        Raises:
+            Exception: If the values are not in ascending order.
+        """
+        values = list(iterable)
+
+        if any(previous > value for previous, value in zip(values, values[1:])):
+            raise Exception("Values must be sorted.")
+
+        tree = cls(self_balancing, typecode)
+        tree._link(values)
+
+        return tree
+
+    def rebalance(self) -> None:
+        """
+        Rebuilds the tree in place as a perfectly balanced tree. The values
+        are moved to slots 1 to n in order and the free list is dropped.
+        """
+        self._link(self.inorder())
+
+    def _link(self, values: list) -> None:
+        """
+        Replaces the whole tree with a perfectly balanced one holding values,
+        which are in inorder.
+        """
+        self._allocate(len(values))
+        self.values[1:] = values if self.typecode is None else array(self.typecode, values)
+        self.size = len(values)
+        self.root = self._build(1, len(values) + 1, 0)
+
+    def _build(self, start: int, end: int, parent: int) -> int:
+        """
+        Links the slots from start to end - 1 into a perfectly balanced
+        subtree, rooted at the middle slot. The recursion is only O(log n) deep.
+
+        Returns: The root of the subtree, or 0 if the range is empty.
+        """
+        if start >= end:
+            return 0
+
+        middle = (start + end) // 2
+        left = self._build(start, middle, middle)
+
+        self.parents[middle] = parent
+        self.lefts[middle] = left
+        self.rights[middle] = self._build(middle + 1, end, middle)
+        # The left half is never smaller than the right one, so it is never lower.
+        self.heights[middle] = self.heights[left] + 1
+        self.sizes[middle] = end - start
+
+        return middle
+
+    def insert(self, value: Any) -> None:
+        """
+        Inserts a value into the tree, walking down from the root in a loop
+        and counting the new value in the size of every node on the way.
+
+        Args:
+            value: The value to be inserted into the tree.
+        """
+        self.size += 1
+
+        if not self.root:
+            self.root = self._new_slot(value, 0)
+            return
+
+        values = self.values
+        lefts = self.lefts
+        rights = self.rights
+        sizes = self.sizes
+        node = self.root
+
+        while True:
+            sizes[node] += 1
+
+            if value <= values[node]:
+                child = lefts[node]
+                if not child:
+                    lefts[node] = self._new_slot(value, node)
+                    break
+            else:
+                child = rights[node]
+                if not child:
+                    rights[node] = self._new_slot(value, node)
+                    break
+
+            node = child
+
+        if self.self_balancing:
+            self._retrace(node)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values in the tree.
+        """
+        return self.size
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Checks if a value is in the tree.
+        """
+        return self.search(value) is not None
+
+    def search(self, value: Any) -> Optional[int]:
+        """
+        Searches for a value in the tree.
+
+        Args:
+            value: The value to be searched in the tree.
+        Returns: The slot holding the value, or None if the value is not found.
+        """
+        values = self.values
+        lefts = self.lefts
+        rights = self.rights
+        node = self.root
+
+        while node and values[node] != value:
+            node = rights[node] if value > values[node] else lefts[node]
+
+        return node or None
+
+    def remove(self, value: Any) -> None:
+        """
+        Removes a value from the tree. A node with two children is replaced
+        by its successor, the smallest node of its right subtree.
+
+        Args:
+            value: The value to be removed from the tree.
+        Raises:
+            Exception: If the value is not in the tree.
+        """
+        node = self.search(value)
+
+        if node is None:
+            raise Exception("Value doesn't exist in the tree.")
+
+        lefts = self.lefts
+        rights = self.rights
+        parents = self.parents
+
+        self.size -= 1
+
+        if not lefts[node] or not rights[node]:
+            # The lowest node whose subtree changed, where the retrace starts.
+            changed = parents[node]
+            self._shrink_path(changed, 0)
+            self._replace_child(node, lefts[node] or rights[node])
+        else:
+            successor = rights[node]
+            while lefts[successor]:
+                successor = lefts[successor]
+
+            # The successor leaves its own path and takes the place of node.
+            self._shrink_path(parents[successor], node)
+            self._shrink_path(parents[node], 0)
+            self.sizes[successor] = self.sizes[node] - 1
+
+            if parents[successor] == node:
+                changed = successor
+            else:
+                changed = parents[successor]
+                self._replace_child(successor, rights[successor])
+                rights[successor] = rights[node]
+                parents[rights[successor]] = successor
+
+            self._replace_child(node, successor)
+            lefts[successor] = lefts[node]
+            parents[lefts[successor]] = successor
+
+        self._release(node)
+
+        if self.self_balancing:
+            self._retrace(changed)
+
+    def _shrink_path(self, node: int, stop: int) -> None:
+        """
+        Subtracts one from the size of every node from node up to, but not
+        including, stop, which is 0 to go up to the root.
+        """
+        sizes = self.sizes
+        parents = self.parents
+
+        while node != stop:
+            sizes[node] -= 1
+            node = parents[node]
+
+    def _replace_child(self, node: int, new_node: int) -> None:
+        """
+        Puts new_node, with its subtree, in the place of node under the
+        parent of node. A new_node of 0 detaches node.
+        """
+        parent = self.parents[node]
+
+        if not parent:
+            self.root = new_node
+        elif self.lefts[parent] == node:
+            self.lefts[parent] = new_node
+        else:
+            self.rights[parent] = new_node
+
+        if new_node:
+            self.parents[new_node] = parent
+
+    def _update(self, node: int) -> None:
+        """
+        Recomputes the height and the size of a node from those of its children.
+        """
+        left = self.lefts[node]
+        right = self.rights[node]
+
+        self.heights[node] = 1 + max(self.heights[left], self.heights[right])
+        self.sizes[node] = 1 + self.sizes[left] + self.sizes[right]
+
+    def _rotate_left(self, node: int) -> int:
+        """
+        Rotates a node down to the left, lifting its right child into its place.
+
+        Returns: The new root of the subtree.
+        """
+        pivot = self.rights[node]
+        self._replace_child(node, pivot)
+
+        inner = self.lefts[pivot]
+        self.rights[node] = inner
+        if inner:
+            self.parents[inner] = node
+
+        self.lefts[pivot] = node
+        self.parents[node] = pivot
+
+        self._update(node)
+        self._update(pivot)
+
+        return pivot
+
+    def _rotate_right(self, node: int) -> int:
+        """
+        Rotates a node down to the right, lifting its left child into its place.
+
+        Returns: The new root of the subtree.
+        """
+        pivot = self.lefts[node]
+        self._replace_child(node, pivot)
+
+        inner = self.rights[pivot]
+        self.lefts[node] = inner
+        if inner:
+            self.parents[inner] = node
+
+        self.rights[pivot] = node
+        self.parents[node] = pivot
+
+        self._update(node)
+        self._update(pivot)
+
+        return pivot
+
+    def _rebalance(self, node: int) -> int:
+        """
+        Updates a node and rotates it if its subtrees differ in height by
+        more than one.
+
+        Returns: The node now at the position of the given node.
+        """
+        heights = self.heights
+        left = self.lefts[node]
+        right = self.rights[node]
+
+        self._update(node)
+        balance = heights[left] - heights[right]
+
+        if balance > 1:
+            if heights[self.lefts[left]] < heights[self.rights[left]]:
+                self._rotate_left(left)
+            return self._rotate_right(node)
+
+        if balance < -1:
+            if heights[self.rights[right]] < heights[self.lefts[right]]:
+                self._rotate_right(right)
+            return self._rotate_left(node)
+
+        return node
+
+    def _retrace(self, node: int) -> None:
+        """
+        Updates the height and the size of every node from the given node up
+        to the root, rebalancing them. Only self balancing trees retrace.
+        """
+        while node:
+            node = self.parents[self._rebalance(node)]
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yields the values of the tree in ascending order, keeping only the
+        path to the current node in memory.
+        """
+        values = self.values
+        lefts = self.lefts
+        rights = self.rights
+        stack: List[int] = []
+        node = self.root
+
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = lefts[node]
+
+            node = stack.pop()
+            yield values[node]
+            node = rights[node]
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Yields the values of the tree in descending order, keeping only the
+        path to the current node in memory.
+        """
+        values = self.values
+        lefts = self.lefts
+        rights = self.rights
+        stack: List[int] = []
+        node = self.root
+
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = rights[node]
+
+            node = stack.pop()
+            yield values[node]
+            node = lefts[node]
+
+    def irange(self, lo: Any = None, hi: Any = None,
+               inclusive: Tuple[bool, bool] = (True, True)) -> Iterator[Any]:
+        """
+        Yields, in ascending order, the values between lo and hi. The walk
+        starts at the lower bound and stops at the upper bound.
+
+        Args:
+            lo: The lower bound, or None for no lower bound.
+            hi: The upper bound, or None for no upper bound.
+            inclusive (tuple[bool, bool]): Whether values equal to lo and to
+                hi are included.
+        """
+        include_lo, include_hi = inclusive
+        values = self.values
+        lefts = self.lefts
+        rights = self.rights
+        stack: List[int] = []
+        node = self.root
+
+        while node:
+            value = values[node]
+            if lo is None or (lo <= value if include_lo else value > lo):
+                stack.append(node)
+                node = lefts[node]
+            else:
+                node = rights[node]
+
+        while stack:
+            node = stack.pop()
+            value = values[node]
+
+            if hi is not None and (value > hi if include_hi else hi <= value):
+                return
+
+            yield value
+            node = rights[node]
+
+            while node:
+                stack.append(node)
+                node = lefts[node]
+
+    def inorder(self) -> list:
+        """
+        Returns the values of the tree in ascending order.
+        """
+        return list(self)
+
+    def _count_below(self, value: Any, inclusive: bool) -> int:
+        """
+        Counts the values smaller than value, or smaller than or equal to it
+        if inclusive is True.
+        """
+        values = self.values
+        sizes = self.sizes
+        count = 0
+        node = self.root
+
+        while node:
+            if value > values[node] or (inclusive and values[node] <= value):
+                count += sizes[self.lefts[node]] + 1
+                node = self.rights[node]
+            else:
+                node = self.lefts[node]
+
+        return count
+
+    def rank(self, value: Any) -> int:
+        """
+        Counts the values of the tree that are smaller than value.
+        """
+        return self._count_below(value, False)
+
+    def select(self, k: int) -> Any:
+        """
+        Returns the k-th smallest value, starting at 0. Negative indexes
+        count from the largest value.
+
+        Raises:
+            Exception: If the index is out of range.
+        """
+        if k < 0:
+            k += self.size
+
+        if k < 0 or k >= self.size:
+            raise Exception("Index out of range.")
+
+        node = self.root
+
+        while True:
+            left_size = self.sizes[self.lefts[node]]
+
+            if k < left_size:
+                node = self.lefts[node]
+            elif k == left_size:
+                return self.values[node]
+            else:
+                k -= left_size + 1
+                node = self.rights[node]
+
+    def count_range(self, lo: Any, hi: Any, inclusive: Tuple[bool, bool] = (True, True)) -> int:
+        """
+        Counts the values between lo and hi.
+
+        Args:
+            lo: The lower bound.
+            hi: The upper bound.
+            inclusive (tuple[bool, bool]): Whether values equal to lo and to
+                hi are counted.
+        """
+        include_lo, include_hi = inclusive
+        count = self._count_below(hi, include_hi) - self._count_below(lo, not include_lo)
+
+        return max(count, 0)
+
+    def median(self) -> Any:
+        """
+        Returns the median value, the lower of the two middle values when the
+        tree has an even number of values.
+
+        Raises:
+            Exception: If the tree is empty.
+        """
+        if self.size == 0:
+            raise Exception("The tree is empty.")
+
+        return self.select((self.size - 1) // 2)
+
+    def _print(self, node: int) -> Optional[dict]:
+        """
+        Returns a dictionary representation of the subtree rooted at a slot,
+        built from an explicit stack.
+        """
+        if not node:
+            return None
+
+        root = {"value": self.values[node], "left": None, "right": None}
+        stack = [(node, root)]
+
+        while stack:
+            node, tree = stack.pop()
+
+            for side, links in (("left", self.lefts), ("right", self.rights)):
+                child = links[node]
+
+                if child:
+                    tree[side] = {"value": self.values[child], "left": None, "right": None}
+                    stack.append((child, tree[side]))
+
+        return root
+
+    def _lines(self) -> List[str]:
+        """
+        Returns the tree as indented lines, one per node, each child under
+        its parent and labelled with its side, built from an explicit stack.
+        """
+        if not self.root:
+            return ["None"]
+
+        lines = []
+        stack = [(self.root, 0, "")]
+
+        while stack:
+            node, depth, label = stack.pop()
+            lines.append("  " * depth + label + repr(self.values[node]))
+
+            for side, links in (("right", self.rights), ("left", self.lefts)):
+                child = links[node]
+
+                if child:
+                    stack.append((child, depth + 1, side + ": "))
+
+        return lines
+
+    def print(self) -> None:
+        """
+        Prints the tree in a structured format, one node per line.
+        """
+        print("\n".join(self._lines()))
+
+
+if __name__ == "__main__":
+    tree = ArrayBinaryTree(self_balancing=True, typecode="q")
+
+    for i in range(10):
+        tree.insert(i)
+
+    tree.remove(3)
+    tree.print()
+
+    print(list(tree.irange(2, 6)))
+    print("Mediana:", tree.median())
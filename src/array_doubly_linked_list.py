@@ -0,0 +1,360 @@
+from array import array
+from typing import Any, Iterator, Union
+from .node import Node, NIL_NODE
+
+
+class SlotNode:
+    """
+    Lightweight view of an element of an ArrayDoublyLinkedList, with the
+    item, prev_node and next_node attributes of a Node.
+
+    The view only holds the list and the slot, and reads and writes the
+    arrays of the list, so it is meant to be used while its element is in
+    the list. Past either end of the list, prev_node and next_node are
+    NIL_NODE, as for a Node.
+
+    Attributes:
+        slot (int): The slot of the element.
+    """
+    __slots__ = ("_list", "slot")
+
+    def __init__(self, linked_list: "ArrayDoublyLinkedList", slot: int) -> None:
+        self._list = linked_list
+        self.slot = slot
+
+    @property
+    def item(self) -> Any:
+        return self._list.items[self.slot]
+
+    @item.setter
+    def item(self, item: Any) -> None:
+        self._list.items[self.slot] = item
+
+    @property
+    def next_node(self) -> Union["SlotNode", Node]:
+        return self._list._node(self._list.next_slots[self.slot])
+
+    @property
+    def prev_node(self) -> Union["SlotNode", Node]:
+        return self._list._node(self._list.prev_slots[self.slot])
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, SlotNode)
+            and other._list is self._list
+            and other.slot == self.slot
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self._list), self.slot))
+
+    def __str__(self) -> str:
+        return str(self.item)
+
+
+class ArrayDoublyLinkedList:
+    """
+    Doubly linked list stored in parallel arrays instead of Node objects.
+
+    Every element lives in an integer slot: its item is kept in a Python list
+    and its previous and next links are slot numbers kept in typed arrays.
+    Slot 0 is a header that closes the list into a ring, so the first element
+    is next_slots[0] and the last one is prev_slots[0]. Slots released by
+    remove are chained into a free list through next_slots and reused by the
+    following insertions, so a list that keeps the same size does not grow
+    or allocate.
+
+    The public methods mirror DoublyLinkedList. Since there are no nodes to
+    hand out, __getitem__ and search return a SlotNode, a small view with the
+    item, prev_node and next_node of the element, or NIL_NODE.
+
+    Attributes:
+        size (int): The number of elements in the list.
+        items (list): The item stored in each slot.
+        prev_slots (array): The slot of the previous element of each slot.
+        next_slots (array): The slot of the next element of each slot, or the
+            next free slot for released slots.
+        free_slot (int): The first released slot, or 0 if there is none.
+    """
+    __slots__ = (
+        "size", "items", "prev_slots", "next_slots", "free_slot", "_version"
+    )
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty list holding only the header slot.
+        """
+        self.size = 0
+        self.items: list = [None]
+        self.prev_slots = array("q", [0])
+        self.next_slots = array("q", [0])
+        self.free_slot = 0
+        self._version = 0
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the list, e.g., "| item1 | item2 |".
+        If the list is empty, it returns "| |".
+        """
+        if self.size == 0:
+            return "| |"
+
+        list_string = "|"
+
+        slot = self.next_slots[0]
+        while slot != 0:
+            list_string += " " + str(self.items[slot]) + " |"
+            slot = self.next_slots[slot]
+
+        return list_string
+
+    def __repr__(self):
+        """
+        Returns a string representation for debugging.
+        """
+        return self.__str__()
+
+    def __len__(self):
+        """
+        Returns the number of elements in the list.
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yields the items of the list from first to last.
+
+        Raises: RuntimeError: If the list is modified during the iteration.
+        """
+        version = self._version
+        slot = self.next_slots[0]
+
+        while slot != 0:
+            yield self.items[slot]
+
+            if self._version != version:
+                raise RuntimeError("List changed during iteration.")
+
+            slot = self.next_slots[slot]
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Yields the items of the list from last to first.
+
+        Raises: RuntimeError: If the list is modified during the iteration.
+        """
+        version = self._version
+        slot = self.prev_slots[0]
+
+        while slot != 0:
+            yield self.items[slot]
+
+            if self._version != version:
+                raise RuntimeError("List changed during iteration.")
+
+            slot = self.prev_slots[slot]
+
+    def _node(self, slot: int) -> Union[SlotNode, Node]:
+        """
+        Returns a view of the element in a slot, or NIL_NODE for the header slot 0.
+        """
+        return SlotNode(self, slot) if slot != 0 else NIL_NODE
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Returns the node at the specified index, as a SlotNode.
+
+        Negative indexes count from the end of the list, and a slice returns
+        a new list with the selected items, collected in a single walk.
+
+        Args:
+            index (int | slice): The index of the item to be retrieved, or a
+            slice of the list.
+
+        Returns: The SlotNode at the index, or NIL_NODE if the index is out of
+        range. For a slice, a new ArrayDoublyLinkedList.
+        """
+        if isinstance(index, slice):
+            new_list = self.__class__()
+            indexes = range(*index.indices(self.size))
+
+            if len(indexes) == 0:
+                return new_list
+
+            links = self.next_slots if indexes.step > 0 else self.prev_slots
+            step = abs(indexes.step)
+            slot = self._slot_at(indexes[0])
+
+            for counter in range(len(indexes)):
+                new_list.append(self.items[slot])
+
+                if counter == len(indexes) - 1:
+                    break
+
+                for _ in range(step):
+                    slot = links[slot]
+
+            return new_list
+
+        return self._node(self._slot_at(index))
+
+    def _slot_at(self, index: int) -> int:
+        """
+        Returns the slot holding the element at the specified index, or the
+        header slot 0 if the index is out of range. The walk starts from
+        whichever end of the list is closer.
+        """
+        if index < 0:
+            index += self.size
+
+        if index < 0 or index >= self.size:
+            return 0
+
+        if index <= self.size // 2:
+            slot = self.next_slots[0]
+            for _ in range(index):
+                slot = self.next_slots[slot]
+        else:
+            slot = self.prev_slots[0]
+            for _ in range(self.size - 1 - index):
+                slot = self.prev_slots[slot]
+
+        return slot
+
+    def _new_slot(self, item: Any) -> int:
+        """
+        Stores the item in a free slot, reusing a released one if possible.
+
+        Returns: slot (int): The slot now holding the item.
+        """
+        slot = self.free_slot
+
+        if slot != 0:
+            self.free_slot = self.next_slots[slot]
+            self.items[slot] = item
+            return slot
+
+        self.items.append(item)
+        self.prev_slots.append(0)
+        self.next_slots.append(0)
+
+        return len(self.items) - 1
+
+    def _link_before(self, slot: int, next_slot: int) -> None:
+        """
+        Links the slot into the ring right before next_slot.
+        """
+        prev_slot = self.prev_slots[next_slot]
+
+        self.prev_slots[slot] = prev_slot
+        self.next_slots[slot] = next_slot
+        self.next_slots[prev_slot] = slot
+        self.prev_slots[next_slot] = slot
+
+        self.size += 1
+        self._version += 1
+
+    def _unlink(self, slot: int) -> None:
+        """
+        Unlinks the slot from the ring and pushes it onto the free list.
+        """
+        prev_slot = self.prev_slots[slot]
+        next_slot = self.next_slots[slot]
+
+        self.next_slots[prev_slot] = next_slot
+        self.prev_slots[next_slot] = prev_slot
+
+        self.items[slot] = None
+        self.next_slots[slot] = self.free_slot
+        self.free_slot = slot
+
+        self.size -= 1
+        self._version += 1
+
+    def append(self, item: Any) -> None:
+        """
+        Append an item to the end of the list.
+
+        Args:
+            item (Any): The item to be appended.
+            Raises: Exception: If the item is None.
+        """
+        if item is None:
+            raise Exception("Item can not be None.")
+
+        self._link_before(self._new_slot(item), 0)
+
+    def search(self, item: Any) -> Union[SlotNode, Node]:
+        """
+        Returns the node of the first occurrence of the item.
+
+        Args: item (Any): The value to be searched for.
+
+        Returns: node (SlotNode): The node containing the item, or NIL_NODE if
+        it is not in the list.
+        """
+        slot = self.next_slots[0]
+
+        while slot != 0 and self.items[slot] != item:
+            slot = self.next_slots[slot]
+
+        return self._node(slot)
+
+    def remove(self, index=None, item=None):
+        """
+        Removes an item by index or by value.
+
+        Args:
+            index (int): The index of the item to be removed.
+            item (Any): The value of the item to be removed.
+            Raises: Exception: If both index and item are None, or if no
+            element matches them.
+        """
+        if index is not None:
+            slot = self._slot_at(index)
+        elif item is not None:
+            slot = self.next_slots[0]
+            while slot != 0 and self.items[slot] != item:
+                slot = self.next_slots[slot]
+        else:
+            raise Exception("Either index or item must be given.")
+
+        if slot == 0:
+            raise Exception("Item is not in the list.")
+
+        self._unlink(slot)
+
+    def insert(self, elem, pos):
+        """
+        Inserts an item at a specific position.
+
+        Args:
+            elem (Any): The item to be inserted.
+            pos (int): The position at which the item should be inserted.
+            Raises: Exception: If the position is invalid.
+        """
+        if pos < 0 or pos > self.size:
+            raise Exception("Position not valid.")
+
+        if elem is None:
+            raise Exception("Item can not be None.")
+
+        self._link_before(self._new_slot(elem), self._slot_at(pos))
+
+
+if __name__ == "__main__":
+    array_linked_list = ArrayDoublyLinkedList()
+
+    array_linked_list.append(100)
+    array_linked_list.append(200)
+    array_linked_list.append(300)
+
+    print(array_linked_list)
+
+    array_linked_list.insert(99, 0)
+    array_linked_list.remove(index=2)
+    array_linked_list.append(400)
+
+    print(array_linked_list)
+    print("Tamanho:", len(array_linked_list))
+    print("Slots:", len(array_linked_list.items))
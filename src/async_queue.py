@@ -0,0 +1,227 @@
+import asyncio
+from collections import deque
+from typing import Any
+from .my_queue import Queue
+from .stack import Stack
+
+
+class AsyncQueue:
+    """
+    FIFO queue for coroutines, stored in a my_queue.Queue.
+
+    get waits while the queue is empty and, when a maxsize is given, put
+    waits while it is full. A waiting coroutine sleeps on its own future,
+    kept in a line of getters or putters, and is woken up by the coroutine
+    that adds or removes an item, so thousands of coroutines can share the
+    queue with no polling and no threads. A waiter that is cancelled leaves
+    its line, and if it had already been woken up it passes the wakeup on to
+    the next waiter, so no item or free slot is left unclaimed.
+
+    join and task_done track the items that were taken but not processed
+    yet, as in asyncio.Queue.
+
+    Attributes:
+        maxsize (int): The largest number of items, or 0 for no limit.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """
+        Initializes an empty queue.
+
+        Args:
+            maxsize (int): The largest number of items the queue holds before
+                put waits, or 0 for no limit.
+        """
+        self.maxsize = maxsize
+        self._items = Queue()
+        self._getters: deque = deque()
+        self._putters: deque = deque()
+        self._unfinished_tasks = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def _put_item(self, item: Any) -> None:
+        """Adds an item to the engine."""
+        self._items.enqueue(item)
+
+    def _get_item(self) -> Any:
+        """Removes the next item from the engine and returns it."""
+        return self._items.dequeue().item
+
+    @staticmethod
+    def _wakeup_next(waiters: deque) -> None:
+        """Wakes up the first waiter of a line that is still waiting."""
+        while waiters:
+            waiter = waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters: deque, is_ready) -> None:
+        """
+        Sleeps in a line of waiters until is_ready() is True.
+
+        If the coroutine is cancelled after being woken up, the wakeup goes
+        to the next waiter of the line.
+        """
+        loop = asyncio.get_running_loop()
+
+        while not is_ready():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+                if is_ready() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+
+                raise
+
+    def __len__(self) -> int:
+        """Returns the number of items in the queue."""
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """Tells whether the queue has no items."""
+        return len(self._items) == 0
+
+    def full(self) -> bool:
+        """Tells whether the queue holds maxsize items."""
+        return 0 < self.maxsize <= len(self._items)
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Adds an item without waiting.
+
+        Raises:
+            Exception: If the queue is full.
+        """
+        if self.full():
+            raise Exception("Queue is full.")
+
+        self._put_item(item)
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    async def put(self, item: Any) -> None:
+        """
+        Adds an item, waiting for a free slot while the queue is full.
+
+        Args:
+            item (Any): The item to be added.
+        """
+        await self._wait(self._putters, lambda: not self.full())
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        """
+        Removes the next item and returns it without waiting.
+
+        Raises:
+            Exception: If the queue is empty.
+        """
+        if self.empty():
+            raise Exception("Queue is empty.")
+
+        item = self._get_item()
+        self._wakeup_next(self._putters)
+
+        return item
+
+    async def get(self) -> Any:
+        """
+        Removes the next item and returns it, waiting for one while the queue
+        is empty.
+        """
+        await self._wait(self._getters, lambda: not self.empty())
+        return self.get_nowait()
+
+    def task_done(self) -> None:
+        """
+        Tells the queue that an item taken by get has been processed.
+
+        Raises:
+            Exception: If it is called more times than items were put.
+        """
+        if self._unfinished_tasks <= 0:
+            raise Exception("task_done() called too many times.")
+
+        self._unfinished_tasks -= 1
+
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """
+        Waits until every item that was put has been taken and marked with
+        task_done.
+        """
+        await self._finished.wait()
+
+    def __str__(self) -> str:
+        """Returns a string representation of the queue."""
+        return str(self._items)
+
+
+class AsyncStack(AsyncQueue):
+    """
+    LIFO stack for coroutines, stored in a stack.Stack.
+
+    It has the same awaitable put, get and join methods as AsyncQueue, but
+    get returns the most recently added item.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """
+        Initializes an empty stack.
+
+        Args:
+            maxsize (int): The largest number of items the stack holds before
+                put waits, or 0 for no limit.
+        """
+        super().__init__(maxsize)
+        self._items = Stack()
+
+    def _put_item(self, item: Any) -> None:
+        """Pushes an item onto the engine."""
+        self._items.push(item)
+
+    def _get_item(self) -> Any:
+        """Pops the top item of the engine and returns it."""
+        return self._items.pop().item
+
+
+if __name__ == "__main__":
+    async def main():
+        queue = AsyncQueue(maxsize=2)
+        results = []
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                results.append(item)
+                queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(3)]
+
+        for i in range(10):
+            await queue.put(i)
+
+        await queue.join()
+
+        for task in workers:
+            task.cancel()
+
+        print(results)
+
+    asyncio.run(main())
@@ -1,6 +1,6 @@
 from abc import abstractmethod, ABC
-import pprint
-from typing import Any, TypeVar, Generic, Optional, List
+from itertools import repeat
+from typing import Any, TypeVar, Generic, Iterator, Optional, List, Tuple
 
 # ABC means Abstract Base Class, and it is used to define abstract methods that must be implemented by subclasses.
 class Comparable(ABC):
@@ -27,6 +27,7 @@ class TreeNode(Generic[T]):
     It contains a value, references to its left and right children, and a reference to its parent.
     The type of the value is defined by the type variable T, which must be a subclass of Comparable.
     '''
+    __slots__ = ("value", "left", "right", "parent", "height", "size", "count")
 
     def __init__(self, value: T, parent: Optional["TreeNode[T]"]) -> None:
         '''Initialize a TreeNode with a value and an optional parent.
@@ -35,6 +36,9 @@ class TreeNode(Generic[T]):
             left (Optional[TreeNode[T]]): The left child of this node, or None if it has no left child.
             right (Optional[TreeNode[T]]): The right child of this node, or None if it has no right child.
             parent (Optional[TreeNode[T]]): The parent node of this node, or None if it is the root.
+            height (int): The height of the subtree rooted at this node, 1 for a leaf. It is only kept up to date by self balancing trees.
+            count (int): The number of occurrences of the value, which is above 1 only in multiset trees.
+            size (int): The number of values in the subtree rooted at this node, counting the occurrences.
 
         Return: None
         '''
@@ -42,6 +46,9 @@ class TreeNode(Generic[T]):
         self.left: Optional[TreeNode[T]] = None
         self.right: Optional[TreeNode[T]] = None
         self.parent: Optional[TreeNode[T]] = parent
+        self.height: int = 1
+        self.size: int = 1
+        self.count: int = 1
 
     def has_no_child(self) -> bool:
         '''Check if the node has no child.
@@ -118,32 +125,142 @@ class TreeNode(Generic[T]):
 
 class BinaryTree(Generic[T]):
     '''BinaryTree is a generic class that represents a binary tree.
-    It contains a root node and a size attribute to keep track of the number of nodes in the tree.
-    The type of the values in the tree is defined by the type variable T, which must be a subclass of Comparable.'''
+    It contains a root node and a size attribute to keep track of the number of values in the tree.
+    The type of the values in the tree is defined by the type variable T, which must be a subclass of Comparable.
 
-    def __init__(self) -> None:
+    A self balancing tree is an AVL tree: every node stores the height of its subtree, and insert and remove
+    rotate the nodes on the path back to the root whenever the heights of two sibling subtrees differ by more
+    than one. The height of the tree stays O(log n) even when the values are inserted in sorted order.
+
+    Every node also stores the size of its subtree, which lets rank, select, count_range and median descend
+    a single path of the tree instead of visiting the values in order.
+
+    A multiset tree keeps a single node per distinct value, with the number of occurrences in TreeNode.count,
+    so repeated values do not add nodes. Iteration, size and the order statistics count every occurrence.'''
+
+    def __init__(self, self_balancing: bool = False, multiset: bool = False) -> None:
         '''Initialize a BinaryTree with no root and size 0.
+        Args:
+            self_balancing (bool): Whether the tree rebalances itself on insert and remove.
+            multiset (bool): Whether equal values share a node that counts them.
         Returns: None'''
         self.root: Optional[TreeNode[T]] = None
         self.size: int = 0
+        self.self_balancing: bool = self_balancing
+        self.multiset: bool = multiset
+
+    @classmethod
+    def from_sorted(cls, iterable, self_balancing: bool = False, multiset: bool = False) -> "BinaryTree[T]":
+        '''Build a perfectly balanced binary tree from values in ascending order, in linear time.
+        Args:
+            iterable: The values, in ascending order.
+            self_balancing (bool): Whether the new tree rebalances itself on insert and remove.
+            multiset (bool): Whether equal values share a node that counts them.
+        Returns:
+            BinaryTree[T]: The new tree.
+        Raises:
+            Exception: If the values are not in ascending order.'''
+        values = list(iterable)
+
+        if any(previous > value for previous, value in zip(values, values[1:])):
+            raise Exception("Values must be sorted.")
+
+        tree = cls(self_balancing, multiset)
+
+        if not multiset:
+            tree._link([TreeNode(value, None) for value in values])
+            return tree
+
+        nodes: List[TreeNode[T]] = []
+
+        for value in values:
+            if nodes and nodes[-1].value == value:
+                nodes[-1].count += 1
+            else:
+                nodes.append(TreeNode(value, None))
+
+        tree._link(nodes)
+
+        return tree
+
+    def rebalance(self) -> None:
+        '''Rebuild the binary tree in place as a perfectly balanced tree.
+        The nodes are kept and relinked in inorder, so the tree holds the same node objects afterwards.
+        Returns: None'''
+        nodes: List[TreeNode[T]] = []
+        stack: List[TreeNode[T]] = []
+        node = self.root
+
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
 
-    def _insert(self, node: TreeNode[T], value: T) -> None:
+            node = stack.pop()
+            nodes.append(node)
+            node = node.right
+
+        self._link(nodes)
+
+    def _link(self, nodes: List[TreeNode[T]]) -> None:
+        '''Make a perfectly balanced tree out of nodes in inorder and make it the whole tree.
+        Args:
+            nodes (List[TreeNode[T]]): The nodes of the new tree, in inorder.
+        Returns: None'''
+        self.root = self._build(nodes, 0, len(nodes), None)
+        self.size = self._size(self.root)
+
+    def _build(self, nodes: List[TreeNode[T]], start: int, end: int,
+               parent: Optional[TreeNode[T]]) -> Optional[TreeNode[T]]:
+        '''Link nodes[start:end] into a perfectly balanced subtree, rooted at the middle node.
+        The recursion is only O(log n) deep.
+        Returns:
+            Optional[TreeNode[T]]: The root of the subtree, or None if the range is empty.'''
+        if start >= end:
+            return None
+
+        middle = (start + end) // 2
+        node = nodes[middle]
+
+        left = self._build(nodes, start, middle, node)
+
+        node.parent = parent
+        node.left = left
+        node.right = self._build(nodes, middle + 1, end, node)
+        # The left half is never smaller than the right one, so it is never lower.
+        node.height = 1 if left is None else left.height + 1
+        node.size = node.count + self._size(left) + self._size(node.right)
+
+        return node
+
+    def _insert(self, node: TreeNode[T], value: T) -> TreeNode[T]:
         '''Insert a value into the binary tree.
-        This method is called recursively to find the correct position for the new value.
+        This method walks down from node in a loop to find the correct position for the new value,
+        adding one to the size of every node on the way, since the value ends up in all of their subtrees.
+        In a multiset tree, a node holding the value only has its count incremented.
         Args:
-            node (TreeNode[T]): The current node to compare the value with.
+            node (TreeNode[T]): The node where the search for the position starts.
             value (T): The value to be inserted into the tree.
-        Returns: None '''
-        if value <= node.value:
-            if node.left is None:
-                node.left = TreeNode(value, node)
-            else:
-                self._insert(node.left, value)
-        else:
-            if node.right is None:
-                node.right = TreeNode(value, node)
+        Returns:
+            TreeNode[T]: The new node, or the node whose count was incremented.'''
+        multiset = self.multiset
+
+        while True:
+            node.size += 1
+
+            if multiset and value == node.value:
+                node.count += 1
+                return node
+            elif value <= node.value:
+                if node.left is None:
+                    node.left = TreeNode(value, node)
+                    return node.left
+                node = node.left
             else:
-                self._insert(node.right, value)
+                if node.right is None:
+                    node.right = TreeNode(value, node)
+                    return node.right
+                node = node.right
 
     def insert(self, value: T):
         '''Insert a value into the binary tree.
@@ -151,17 +268,22 @@ class BinaryTree(Generic[T]):
         If the tree is not empty, it calls the _insert method to find the correct position for the new value.
         Args:
             value (T): The value to be inserted into the tree.'''
+        self.size += 1
+
         if self.root is None:
             self.root = TreeNode(value, None)
             return
 
-        self._insert(self.root, value)
-        self.size += 1
+        node = self._insert(self.root, value)
+
+        # A new leaf may unbalance its ancestors; a counted occurrence changes no height.
+        if self.self_balancing and node.count == 1:
+            self._retrace(node.parent)
 
     def __len__(self) -> int:
         '''Return the size of the binary tree.
         Returns:
-            int: The number of nodes in the binary tree.
+            int: The number of values in the binary tree, counting every occurrence.
         '''
         return self.size
 
@@ -174,57 +296,293 @@ class BinaryTree(Generic[T]):
         '''
         return self.search(value) is not None
 
-    def remove(self, value: T) -> None:
-        '''Remove a value from the binary tree.
-        This method searches for the node with the given value and removes it from the tree.
+    def count(self, value: T) -> int:
+        '''Count the occurrences of a value in the binary tree.
+        Args:
+            value (T): The value to be counted.
+        Returns:
+            int: The number of occurrences of the value, 0 if it is not in the tree.
+        '''
+        if self.multiset:
+            node = self.search(value)
+            return 0 if node is None else node.count
+
+        return self.count_range(value, value)
+
+    def remove(self, value: T, n: int = 1) -> None:
+        '''Remove n occurrences of a value from the binary tree.
+        In a multiset tree, the count of the node is decremented and the node is only removed with its last occurrence.
+        Args:
+            value (T): The value to be removed from the tree.
+            n (int): The number of occurrences to be removed.
+        Returns: None
+        Raises:
+            Exception: If n is smaller than 1, or if the tree holds fewer than n occurrences of the value. Nothing is removed then.'''
+        if n < 1:
+            raise Exception("n must be at least 1.")
+
+        node_to_remove: Optional[TreeNode[T]] = self.search(value)
+
+        if node_to_remove is None or (n > 1 and self.count(value) < n):
+            raise Exception("Value doesn't exist in the tree.")
+
+        if self.multiset:
+            if node_to_remove.count > n:
+                node_to_remove.count -= n
+                self.size -= n
+                self._shrink_path(node_to_remove, None, n)
+                return
+        else:
+            for _ in range(n - 1):
+                self._remove_node(node_to_remove)
+                node_to_remove = self.search(value)
+
+        self._remove_node(node_to_remove)
+
+    def _remove_node(self, node_to_remove: TreeNode[T]) -> None:
+        '''Remove a node, with all the occurrences it counts, from the binary tree.
         If the node has no children, it simply removes it.
         If the node has one child, it replaces the node with its child.
         If the node has two children, it finds the successor (the smallest node in the right subtree) and replaces the node with the successor.
         Args:
-            value (T): The value to be removed from the tree.
+            node_to_remove (TreeNode[T]): The node to be removed.
         Returns: None'''
-        node_to_remove: Optional[TreeNode[T]] = self.search(value)
+        removed = node_to_remove.count
+        self.size -= removed
 
-        if node_to_remove is None:
-            raise Exception("Value doesn't exist in the tree.")
+        if node_to_remove.left is None or node_to_remove.right is None:
+            self._shrink_path(node_to_remove.parent, None, removed)
 
-        self.size -= 1
+            # The lowest node whose subtree changed, where rebalancing starts.
+            changed = node_to_remove.parent
+            self._replace_child(node_to_remove, node_to_remove.get_child())
+        else:
+            successor = node_to_remove.get_successor()
 
-        if node_to_remove.has_no_child():
-            if node_to_remove == self.root:
-                self.root = None
+            # The nodes between the successor and the removed node lose the successor,
+            # and the successor takes the place of the removed node.
+            self._shrink_path(successor.parent, node_to_remove, successor.count)
+            self._shrink_path(node_to_remove.parent, None, removed)
+            successor.size = node_to_remove.size - removed
+
+            if successor.parent is node_to_remove:
+                changed = successor
             else:
-                node_to_remove.replace(None)
-        elif node_to_remove.has_one_child():
-            if node_to_remove == self.root:
-                self.root = node_to_remove.get_child()
-            node_to_remove.replace(node_to_remove.get_child())
+                changed = successor.parent
+                self._replace_child(successor, successor.right)
+                successor.right = node_to_remove.right
+                successor.right.parent = successor
+
+            self._replace_child(node_to_remove, successor)
+            successor.left = node_to_remove.left
+            successor.left.parent = successor
+
+        if self.self_balancing:
+            self._retrace(changed)
+
+    @staticmethod
+    def _shrink_path(node: Optional[TreeNode[T]], stop: Optional[TreeNode[T]], amount: int) -> None:
+        '''Subtract amount from the size of every node from node up to, but not including, stop.
+        Args:
+            node (Optional[TreeNode[T]]): The lowest node whose subtree lost values.
+            stop (Optional[TreeNode[T]]): The ancestor where the walk stops, or None to go up to the root.
+            amount (int): The number of values removed.
+        Returns: None'''
+        while node is not stop:
+            node.size -= amount
+            node = node.parent
+
+    def _replace_child(self, node: TreeNode[T], new_node: Optional[TreeNode[T]]) -> None:
+        '''Put new_node, with its subtree, in the place of node under the parent of node.
+        Args:
+            node (TreeNode[T]): The node to be replaced.
+            new_node (Optional[TreeNode[T]]): The node taking its place, or None to detach node.
+        Returns: None'''
+        parent = node.parent
+
+        if parent is None:
+            self.root = new_node
+        elif parent.left is node:
+            parent.left = new_node
         else:
-            successor = node_to_remove.get_successor()
+            parent.right = new_node
+
+        if new_node is not None:
+            new_node.parent = parent
 
-            if successor is not None:
-                successor.replace(None)
+    @staticmethod
+    def _height(node: Optional[TreeNode[T]]) -> int:
+        '''Return the height of a subtree, 0 for an empty one.'''
+        return 0 if node is None else node.height
 
-            if node_to_remove == self.root:
-                self.root = successor
+    @staticmethod
+    def _size(node: Optional[TreeNode[T]]) -> int:
+        '''Return the number of nodes of a subtree, 0 for an empty one.'''
+        return 0 if node is None else node.size
 
-            node_to_remove.replace(successor)
+    def _update(self, node: TreeNode[T]) -> None:
+        '''Recompute the height and the size of a node from those of its children.'''
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = node.count + self._size(node.left) + self._size(node.right)
+
+    def _rotate_left(self, node: TreeNode[T]) -> TreeNode[T]:
+        '''Rotate a node down to the left, lifting its right child into its place.
+        Returns:
+            TreeNode[T]: The new root of the subtree.'''
+        pivot = node.right
+        self._replace_child(node, pivot)
+
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+
+        pivot.left = node
+        node.parent = pivot
+
+        self._update(node)
+        self._update(pivot)
+
+        return pivot
+
+    def _rotate_right(self, node: TreeNode[T]) -> TreeNode[T]:
+        '''Rotate a node down to the right, lifting its left child into its place.
+        Returns:
+            TreeNode[T]: The new root of the subtree.'''
+        pivot = node.left
+        self._replace_child(node, pivot)
+
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+
+        pivot.right = node
+        node.parent = pivot
+
+        self._update(node)
+        self._update(pivot)
+
+        return pivot
+
+    def _rebalance(self, node: TreeNode[T]) -> TreeNode[T]:
+        '''Update the height of a node and rotate it if its subtrees differ in height by more than one.
+        Returns:
+            TreeNode[T]: The node now at the position of the given node.'''
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                self._rotate_left(node.left)
+            return self._rotate_right(node)
+
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                self._rotate_right(node.right)
+            return self._rotate_left(node)
+
+        return node
+
+    def _retrace(self, node: Optional[TreeNode[T]]) -> None:
+        '''Update the height and the size of every node from the given node up to the root,
+        rebalancing them. Only self balancing trees retrace; plain trees keep their sizes up to date
+        along the insertion and removal paths instead.
+        Args:
+            node (Optional[TreeNode[T]]): The lowest node whose subtree changed.
+        Returns: None'''
+        while node is not None:
+            node = self._rebalance(node).parent
+
+    def _count_below(self, value: T, inclusive: bool) -> int:
+        '''Count the values smaller than value, or smaller than or equal to it if inclusive is True.'''
+        count = 0
+        node = self.root
+
+        while node is not None:
+            if value > node.value or (inclusive and node.value <= value):
+                count += self._size(node.left) + node.count
+                node = node.right
+            else:
+                node = node.left
+
+        return count
+
+    def rank(self, value: T) -> int:
+        '''Count the values of the binary tree that are smaller than value.
+        This is the index value has, or would have, in inorder.
+        Args:
+            value (T): The value to be ranked, which does not need to be in the tree.
+        Returns:
+            int: The number of values smaller than value.
+        '''
+        return self._count_below(value, False)
+
+    def select(self, k: int) -> T:
+        '''Get the value at index k in inorder, i.e., the k-th smallest value starting at 0.
+        Negative indexes count from the largest value.
+        Args:
+            k (int): The index of the value.
+        Returns:
+            T: The value at index k.
+        Raises:
+            Exception: If the index is out of range.'''
+        if k < 0:
+            k += self.size
+
+        if k < 0 or k >= self.size:
+            raise Exception("Index out of range.")
+
+        node = self.root
+
+        while True:
+            left_size = self._size(node.left)
+
+            if k < left_size:
+                node = node.left
+            elif k < left_size + node.count:
+                return node.value
+            else:
+                k -= left_size + node.count
+                node = node.right
+
+    def count_range(self, lo: T, hi: T, inclusive: Tuple[bool, bool] = (True, True)) -> int:
+        '''Count the values between lo and hi.
+        Args:
+            lo (T): The lower bound.
+            hi (T): The upper bound.
+            inclusive (Tuple[bool, bool]): Whether values equal to lo and to hi are counted.
+        Returns:
+            int: The number of values in the range.
+        '''
+        include_lo, include_hi = inclusive
+        count = self._count_below(hi, include_hi) - self._count_below(lo, not include_lo)
+
+        return max(count, 0)
+
+    def median(self) -> T:
+        '''Get the median value of the binary tree.
+        When the tree has an even number of values, the lower of the two middle values is returned.
+        Returns:
+            T: The median value.
+        Raises:
+            Exception: If the tree is empty.'''
+        if self.size == 0:
+            raise Exception("The tree is empty.")
+
+        return self.select((self.size - 1) // 2)
 
     def _search(self, node: Optional[TreeNode[T]], value: T) -> Optional[TreeNode[T]]:
         '''Search for a value in the binary tree.
-        This method is called recursively to find the node with the given value.
+        This method walks down from node in a loop to find the node with the given value.
         Args:
-            node (Optional[TreeNode[T]]): The current node to compare the value with.
+            node (Optional[TreeNode[T]]): The node where the search starts.
             value (T): The value to be searched in the tree.
         Returns:
             Optional[TreeNode[T]]: The node with the given value, or None if the value is not found.
         '''
-        if node is None or node.value == value:
-            return node
-        elif value > node.value:
-            return self._search(node.right, value)
-        else:
-            return self._search(node.left, value)
+        while node is not None and node.value != value:
+            node = node.right if value > node.value else node.left
+
+        return node
 
     def search(self, value: T) -> Optional[TreeNode[T]]:
         '''Search for a value in the binary tree.
@@ -239,18 +597,25 @@ class BinaryTree(Generic[T]):
     # list (List) é mutável e aceita .append(), mas é invariante e pode causar erros de tipagem em genéricos.
     def _inorder(self, node: Optional[TreeNode[T]], values: List[T]) -> List[T]:
         '''Perform an inorder traversal of the binary tree.
-        This method is called recursively to visit the left subtree, then the current node, and finally the right subtree.
+        This method visits the left subtree, then the current node, and finally the right subtree,
+        keeping the nodes whose left subtree is being visited in an explicit stack.
         Args:
-            node (Optional[TreeNode[T]]): The current node to visit.
+            node (Optional[TreeNode[T]]): The root of the subtree to visit.
             values (List[T]): A list to store the values in inorder.
         Returns:
             List[T]: A list of values in inorder traversal.'''
-        if node is None:
-            return values
+        stack: List[TreeNode[T]] = []
+
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
 
-        values = self._inorder(node.left, values)
-        values.append(node.value)
-        values = self._inorder(node.right, values)
+            node = stack.pop()
+            values.append(node.value)
+            if node.count > 1:
+                values.extend(repeat(node.value, node.count - 1))
+            node = node.right
 
         return values
 
@@ -261,34 +626,143 @@ class BinaryTree(Generic[T]):
         '''
         return self._inorder(self.root, [])
 
+    def __iter__(self) -> Iterator[T]:
+        '''Iterate over the values of the binary tree in inorder, keeping only the path to the current node in memory.
+        Returns:
+            Iterator[T]: The values in ascending order.
+        '''
+        stack: List[TreeNode[T]] = []
+        node = self.root
+
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+            yield node.value
+            if node.count > 1:
+                yield from repeat(node.value, node.count - 1)
+            node = node.right
+
+    def __reversed__(self) -> Iterator[T]:
+        '''Iterate over the values of the binary tree in reverse inorder, keeping only the path to the current node in memory.
+        Returns:
+            Iterator[T]: The values in descending order.
+        '''
+        stack: List[TreeNode[T]] = []
+        node = self.root
+
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right
+
+            node = stack.pop()
+            yield node.value
+            if node.count > 1:
+                yield from repeat(node.value, node.count - 1)
+            node = node.left
+
+    def irange(self, lo: Optional[T] = None, hi: Optional[T] = None,
+               inclusive: Tuple[bool, bool] = (True, True)) -> Iterator[T]:
+        '''Iterate in ascending order over the values between lo and hi.
+        The walk starts at the lower bound instead of the minimum and stops at the upper bound,
+        keeping only the path to the current node in memory.
+        Args:
+            lo (Optional[T]): The lower bound, or None for no lower bound.
+            hi (Optional[T]): The upper bound, or None for no upper bound.
+            inclusive (Tuple[bool, bool]): Whether values equal to lo and to hi are included.
+        Returns:
+            Iterator[T]: The values in the range, in ascending order.
+        '''
+        include_lo, include_hi = inclusive
+        stack: List[TreeNode[T]] = []
+        node = self.root
+
+        # Keep the path to the first value in the range: the nodes above the lower bound wait in the stack.
+        while node is not None:
+            if lo is None or (lo <= node.value if include_lo else node.value > lo):
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+
+        while stack:
+            node = stack.pop()
+
+            if hi is not None and (node.value > hi if include_hi else hi <= node.value):
+                return
+
+            yield node.value
+            if node.count > 1:
+                yield from repeat(node.value, node.count - 1)
+            node = node.right
+
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
     def _print(self, node: Optional[TreeNode[T]]) -> Optional[dict]:
         '''Print the binary tree in a structured format.
-        This method is called recursively to print the current node and its left and right children.
+        This method builds the dictionary of each node and fills in its children from an explicit stack.
         Args:
-            node (Optional[TreeNode[T]]): The current node to print.
+            node (Optional[TreeNode[T]]): The root of the subtree to print.
         Returns:
             dict: A dictionary representation of the binary tree, with the current node's value and its left and right children.
         '''
         if node is None:
             return None
 
-        return {
-            "value": node.value,
-            "left": self._print(node.left),
-            "right": self._print(node.right),
-        }
+        root = {"value": node.value, "left": None, "right": None}
+        stack = [(node, root)]
+
+        while stack:
+            node, tree = stack.pop()
+
+            for side in ("left", "right"):
+                child = getattr(node, side)
+
+                if child is not None:
+                    tree[side] = {"value": child.value, "left": None, "right": None}
+                    stack.append((child, tree[side]))
+
+        return root
+
+    def _lines(self) -> List[str]:
+        '''Render the binary tree as indented lines, one per node.
+        Each child is written under its parent, one level deeper and labelled with its side, and the nodes are visited from an explicit stack, so deep trees render without recursion.
+        Returns:
+            List[str]: The lines of the tree, or ["None"] if it is empty.
+        '''
+        if self.root is None:
+            return ["None"]
+
+        lines = []
+        stack = [(self.root, 0, "")]
+
+        while stack:
+            node, depth, label = stack.pop()
+            lines.append("  " * depth + label + repr(node.value))
+
+            for side in ("right", "left"):
+                child = getattr(node, side)
+
+                if child is not None:
+                    stack.append((child, depth + 1, side + ": "))
+
+        return lines
 
     def print(self) -> None:
         '''Print the binary tree in a structured format.
-        This method calls the _print method to get the dictionary representation of the binary tree and prints it.
+        This method prints the lines built by _lines, one node per line.
         Returns: None'''
-        pprint.pprint(self._print(self.root))
+        print("\n".join(self._lines()))
 
 
 if __name__ == "__main__":
     # To-Do
     # Refactor functions and types
-    # implement self balancing tree
     bt = BinaryTree()
     bt.insert(1)
     bt.insert(2)
@@ -299,3 +773,8 @@ if __name__ == "__main__":
     bt.print()
     bt.insert(1.5)
     bt.print()
+
+    avl = BinaryTree(self_balancing=True)
+    for i in range(10):
+        avl.insert(i)
+    avl.print()
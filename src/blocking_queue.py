@@ -0,0 +1,179 @@
+from threading import Condition, Lock
+from typing import Any, Optional
+from .node import Node, NIL_NODE
+
+
+class BlockingQueue:
+    """
+    Thread-safe FIFO queue with separate locks for its two ends.
+
+    The items are kept in a singly linked chain of nodes that starts with a
+    dummy node, as in the two-lock queue of Michael and Scott. Producers only
+    take the tail lock to link a node after the last one, and consumers only
+    take the head lock to move the dummy one node forward, so enqueueing and
+    dequeueing threads do not wait for each other. The number of items is
+    kept under a third lock, held just long enough to read and update it.
+
+    A thread that finds the queue empty, or full when a maxsize is given,
+    waits on a Condition of the lock of its end and is woken up by the
+    thread on the other end, with no polling. Each thread that succeeds wakes
+    the next waiter of its own end while there is still room or items, so
+    only one wakeup crosses to the other lock per empty/non-empty or
+    full/non-full transition.
+
+    Attributes:
+        maxsize (int): The largest number of items, or 0 for no limit.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """
+        Initializes an empty queue.
+
+        Args:
+            maxsize (int): The largest number of items the queue holds before
+                enqueue blocks, or 0 for no limit.
+        """
+        self.maxsize = maxsize
+        self._head = Node(None)
+        self._tail = self._head
+        self._count = 0
+
+        self._head_lock = Lock()
+        self._tail_lock = Lock()
+        self._count_lock = Lock()
+        self._not_empty = Condition(self._head_lock)
+        self._not_full = Condition(self._tail_lock)
+
+    def _add_to_count(self, delta: int) -> int:
+        """
+        Adds delta to the number of items.
+
+        Returns: The number of items before the change.
+        """
+        with self._count_lock:
+            count = self._count
+            self._count = count + delta
+
+        return count
+
+    def enqueue(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds an item to the end of the queue, waiting for room if the queue
+        is full.
+
+        Args:
+            item (Any): The item to be added.
+            block (bool): Whether to wait for room when the queue is full.
+            timeout (float | None): The longest time to wait, in seconds, or
+                None to wait for as long as needed.
+        Raises:
+            Exception: If the queue is still full when the wait ends.
+        """
+        node = Node(item)
+
+        with self._not_full:
+            if self.maxsize > 0 and self._count >= self.maxsize:
+                if not block or not self._not_full.wait_for(
+                    lambda: self._count < self.maxsize, timeout
+                ):
+                    raise Exception("Queue is full.")
+
+            self._tail.next_node = node
+            self._tail = node
+            count = self._add_to_count(1)
+
+            if self.maxsize > 0 and count + 1 < self.maxsize:
+                self._not_full.notify()
+
+        if count == 0:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def dequeue(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Removes the first item of the queue and returns it, waiting for an
+        item if the queue is empty.
+
+        Args:
+            block (bool): Whether to wait for an item when the queue is empty.
+            timeout (float | None): The longest time to wait, in seconds, or
+                None to wait for as long as needed.
+        Returns:
+            Any: The first item.
+        Raises:
+            Exception: If the queue is still empty when the wait ends.
+        """
+        with self._not_empty:
+            if self._count == 0:
+                if not block or not self._not_empty.wait_for(
+                    lambda: self._count > 0, timeout
+                ):
+                    raise Exception("Queue is empty.")
+
+            # The first node becomes the new dummy node.
+            first_node = self._head.next_node
+            self._head.next_node = NIL_NODE
+            self._head = first_node
+            item = first_node.item
+            first_node.item = None
+            count = self._add_to_count(-1)
+
+            if count > 1:
+                self._not_empty.notify()
+
+        if count == self.maxsize:
+            with self._not_full:
+                self._not_full.notify()
+
+        return item
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the queue. Other threads may change it
+        right after it is read.
+        """
+        return self._count
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the queue, e.g., "| item1 | item2 |",
+        taken while both ends are locked.
+        """
+        with self._head_lock, self._tail_lock:
+            items = []
+            curr_node = self._head.next_node
+
+            while curr_node is not NIL_NODE:
+                items.append(str(curr_node.item))
+                curr_node = curr_node.next_node
+
+        if not items:
+            return "| |"
+
+        return "| " + " | ".join(items) + " |"
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation for debugging.
+        """
+        return self.__str__()
+
+
+if __name__ == "__main__":
+    from threading import Thread
+
+    queue = BlockingQueue(maxsize=4)
+    results = []
+
+    def consume():
+        for _ in range(10):
+            results.append(queue.dequeue())
+
+    consumer = Thread(target=consume)
+    consumer.start()
+
+    for i in range(10):
+        queue.enqueue(i)
+
+    consumer.join()
+    print(results)
@@ -1,5 +1,5 @@
-from typing import Any
-from .node import Node
+from typing import Any, Iterator, Union
+from .node import Node, NIL_NODE
 
 
 class DoublyLinkedList:
@@ -16,6 +16,8 @@ class DoublyLinkedList:
         last_node (Node): The last node in the list.
 
     """
+    __slots__ = ("size", "first_node", "last_node", "_version")
+
     def __init__(self) -> None:
         """
         Initializes an empty doubly linked list.
@@ -26,8 +28,9 @@ class DoublyLinkedList:
             last_node (Node): The last node in the list.
         """
         self.size = 0
-        self.first_node = Node(None)
-        self.last_node = Node(None)
+        self.first_node = NIL_NODE
+        self.last_node = NIL_NODE
+        self._version = 0
 
     def __str__(self) -> str:
         """
@@ -60,31 +63,115 @@ class DoublyLinkedList:
         """
         return self.__str__()
 
-    def __getitem__(self, index: int) -> Node:
+    def __getitem__(self, index: Union[int, slice]) -> Any:
         """
         __getitem__(index): Returns the node at the specified index.
 
+        The walk starts from whichever end of the list is closer to the index.
+        Negative indexes count from the end of the list, and a slice returns a
+        new list with the selected items, collected in a single walk.
+
         Args:
-            index (int): The index of the node to be retrieved.
+            index (int | slice): The index of the node to be retrieved, or a
+            slice of the list.
 
-        Returns: curr_node (Node): The node at the specified index.
+        Returns: curr_node (Node): The node at the specified index, or
+        NIL_NODE if the index is out of range. For a slice, a new list of the
+        same type holding the selected items.
         """
-        counter = 0
+        if isinstance(index, slice):
+            return self._slice(index)
 
-        curr_node: Node | None = self.first_node
+        if index < 0:
+            index += self.size
 
-        while counter < index and curr_node.item is not None:
-            counter += 1
-            curr_node = curr_node.next_node
+        if index < 0 or index >= self.size:
+            return NIL_NODE
+
+        if index <= self.size // 2:
+            curr_node = self.first_node
+            for _ in range(index):
+                curr_node = curr_node.next_node
+        else:
+            curr_node = self.last_node
+            for _ in range(self.size - 1 - index):
+                curr_node = curr_node.prev_node
 
         return curr_node
 
+    def _slice(self, index: slice) -> "DoublyLinkedList":
+        """
+        _slice(index): Returns a new list with the items selected by a slice.
+
+        Args:
+            index (slice): The slice to be applied to the list.
+
+        Returns: new_list (DoublyLinkedList): A new list of the same type.
+        """
+        new_list = self.__class__()
+        indexes = range(*index.indices(self.size))
+
+        if len(indexes) == 0:
+            return new_list
+
+        curr_node = self[indexes[0]]
+        step = indexes.step
+
+        for counter in range(len(indexes)):
+            new_list.append(curr_node.item)
+
+            if counter == len(indexes) - 1:
+                break
+
+            if step > 0:
+                for _ in range(step):
+                    curr_node = curr_node.next_node
+            else:
+                for _ in range(-step):
+                    curr_node = curr_node.prev_node
+
+        return new_list
+
     def __len__(self):
         """
         __len__(): Returns the number of elements in the list.
         """
         return self.size
 
+    def __iter__(self) -> Iterator[Any]:
+        """
+        __iter__(): Yields the items of the list from first to last.
+
+        Raises: RuntimeError: If the list is modified during the iteration.
+        """
+        version = self._version
+        curr_node = self.first_node
+
+        while curr_node is not NIL_NODE:
+            yield curr_node.item
+
+            if self._version != version:
+                raise RuntimeError("List changed during iteration.")
+
+            curr_node = curr_node.next_node
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        __reversed__(): Yields the items of the list from last to first.
+
+        Raises: RuntimeError: If the list is modified during the iteration.
+        """
+        version = self._version
+        curr_node = self.last_node
+
+        while curr_node is not NIL_NODE:
+            yield curr_node.item
+
+            if self._version != version:
+                raise RuntimeError("List changed during iteration.")
+
+            curr_node = curr_node.prev_node
+
     def append(self, item: Any) -> None:
         """"
         Append an item to the end of the list.
@@ -101,11 +188,13 @@ class DoublyLinkedList:
 
         if self.size == 0:
             self.size += 1
+            self._version += 1
             self.first_node = new_node
             self.last_node = new_node
             return
 
         self.size += 1
+        self._version += 1
 
         new_node.prev_node = self.last_node
         self.last_node.next_node = new_node
@@ -121,7 +210,7 @@ class DoublyLinkedList:
         """
         curr_node = self.first_node
 
-        while curr_node.item and curr_node.item != item:
+        while curr_node.item is not None and curr_node.item != item:
             curr_node = curr_node.next_node
 
         return curr_node
@@ -131,17 +220,25 @@ class DoublyLinkedList:
         remove(index=None, item=None): Removes an item by index or by value.
 
         Args:
-            index (int): The index of the item to be removed.
+            index (int): The index of the item to be removed. Negative
+            indexes count from the end of the list.
             item (Any): The value of the item to be removed.
-            Raises: Exception: If both index and item are None.
+            Raises: Exception: If both index and item are None, or if no
+            node matches them.
 
         """
-        self.size -= 1
-
         if index is not None:
             curr_node = self[index]
         elif item is not None:
             curr_node = self.search(item)
+        else:
+            raise Exception("Either index or item must be given.")
+
+        if curr_node is NIL_NODE:
+            raise Exception("Item is not in the list.")
+
+        self.size -= 1
+        self._version += 1
 
         if curr_node == self.first_node:
             second_node = self.first_node.next_node
@@ -173,10 +270,11 @@ class DoublyLinkedList:
             self.append(elem)
             return
 
+        curr_node = self[pos]
+
         new_node = Node(elem)
         self.size += 1
-
-        curr_node = self[pos]
+        self._version += 1
 
         if pos == 0:
             self.first_node = new_node
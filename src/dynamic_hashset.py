@@ -1,33 +1,163 @@
 from .doubly_linked_list import DoublyLinkedList
-from typing import Hashable
+from .node import Node, NIL_NODE
+from .set_operations import SetOperations
+from math import ceil
+from operator import length_hint
+from typing import Hashable, Iterator, List, Optional, Tuple
 
 
-class DynamicHashSet:
+class HashNode(Node):
+    """
+    Linked list node that also stores the full hash of its key, so the key
+    never has to be hashed again once it is in the set.
+
+    Attributes:
+        hash (int): The hash of the key stored in item.
+    """
+    __slots__ = ("hash",)
+
+    def __init__(self, key: Hashable, key_hash: int) -> None:
+        super().__init__(key)
+        self.hash = key_hash
+
+
+class HashBucket(DoublyLinkedList):
+    """
+    Bucket of a DynamicHashSet: a doubly linked list of HashNodes that can
+    find a key by its cached hash and link or unlink nodes directly.
+    """
+    __slots__ = ()
+
+    def find(self, key: Hashable, key_hash: int) -> Node:
+        """
+        Returns the node holding the key, comparing cached hashes before
+        comparing keys, or NIL_NODE if the key is not in the bucket.
+        """
+        curr_node = self.first_node
+
+        while curr_node is not NIL_NODE:
+            if curr_node.hash == key_hash and (
+                curr_node.item is key or curr_node.item == key
+            ):
+                return curr_node
+
+            curr_node = curr_node.next_node
+
+        return NIL_NODE
+
+    def append_node(self, node: HashNode) -> None:
+        """
+        Links an existing node at the end of the bucket.
+        """
+        node.next_node = NIL_NODE
+
+        if self.size == 0:
+            node.prev_node = NIL_NODE
+            self.first_node = node
+        else:
+            node.prev_node = self.last_node
+            self.last_node.next_node = node
+
+        self.last_node = node
+        self.size += 1
+        self._version += 1
+
+    def unlink(self, node: HashNode) -> None:
+        """
+        Unlinks a node of this bucket.
+        """
+        if node == self.first_node:
+            self.first_node = node.next_node
+        else:
+            node.prev_node.next_node = node.next_node
+
+        if node == self.last_node:
+            self.last_node = node.prev_node
+        else:
+            node.next_node.prev_node = node.prev_node
+
+        self.size -= 1
+        self._version += 1
+
+
+class DynamicHashSet(SetOperations):
     """
     Basic implementation of a HashSet with dynamic resizing of its capacity.
 
+    Every key is stored in a HashNode together with its hash, so add and
+    remove hash the key once and scan its bucket once, and resizing moves
+    the existing nodes to their new buckets without hashing any key again.
+
+    Buckets are created when they receive their first key, so a new or
+    resized table is only a list of None slots.
+
+    With incremental_resize=True, a resize only allocates the new table.
+    The old buckets are kept next to them and every add and remove moves
+    the nodes of the next rehash_step old buckets, so the cost of a resize
+    is spread over the following writes. While the migration is in
+    progress, keys are looked up in both tables. Lookups never move nodes,
+    so iterating the HashSet while testing membership is safe.
+
     Atributes:
     initial_capacity (int): the capacity passed as a param in the instantiation of the class.
-    buckets (list[DoubleLinkedList]):
+    buckets (list[HashBucket | None]): The list of buckets for the HashSet,
+        None for the buckets that never received a key.
     """
 
-    def __init__(self, capacity=10, load_factor_threshold=0.75):
+    def __init__(
+        self,
+        capacity=10,
+        load_factor_threshold=0.75,
+        shrink_threshold=None,
+        min_capacity=None,
+        incremental_resize=False,
+        rehash_step=4,
+    ):
         """
         Initializes a HashSet with a given capacity and load factor threshold.
 
         Args:
             initial_capacity (int): The initial capacity of the HashSet.
-            buckets (list[DoublyLinkedList]): The list of buckets for the HashSet.
+            buckets (list[HashBucket]): The list of buckets for the HashSet.
             load_factor_threshold (float): The load factor threshold for resizing.
+            shrink_threshold (float | None): The load factor under which the
+                HashSet shrinks. It must be lower than half of
+                load_factor_threshold. Defaults to 1 - load_factor_threshold
+                when that leaves such a gap, and to a quarter of
+                load_factor_threshold otherwise.
+            min_capacity (int | None): The capacity the HashSet never shrinks
+                below. Defaults to the initial capacity.
             capacity (int): The initial capacity of the HashSet.
             size (int): The number of elements in the HashSet.
+            incremental_resize (bool): Whether resizes migrate the buckets
+                gradually instead of all at once.
+            rehash_step (int): The number of old buckets migrated by each
+                operation during an incremental resize.
 
+        Raises:
+            Exception: If shrink_threshold leaves no gap below the growth
+            threshold.
         """
+        if shrink_threshold is None:
+            shrink_threshold = 1 - load_factor_threshold
+            if shrink_threshold >= load_factor_threshold / 2:
+                shrink_threshold = load_factor_threshold / 4
+        elif shrink_threshold >= load_factor_threshold / 2:
+            raise Exception(
+                "shrink_threshold must be lower than half of load_factor_threshold."
+            )
+
         self.initial_capacity = capacity
-        self.buckets = [DoublyLinkedList() for _ in range(capacity)]
+        self.min_capacity = capacity if min_capacity is None else min_capacity
+        self.buckets: List[Optional[HashBucket]] = [None] * capacity
         self.load_factor_threshold = load_factor_threshold
+        self.shrink_threshold = shrink_threshold
         self.capacity = capacity
         self.size = 0
+        self.incremental_resize = incremental_resize
+        self.rehash_step = rehash_step
+        self._old_buckets: Optional[List[Optional[HashBucket]]] = None
+        self._rehash_index = 0
 
     def _hash(self, key: Hashable) -> int:
         """
@@ -40,19 +170,174 @@ class DynamicHashSet:
         """
         return hash(key) % self.capacity
 
+    def is_rehashing(self) -> bool:
+        """
+        is_rehashing(): Returns True while an incremental resize is moving
+        keys from the old buckets to the new ones.
+        """
+        return self._old_buckets is not None
+
+    def _rehash(self, steps: int) -> None:
+        """
+        Moves the nodes of the next old buckets to the new buckets, using
+        their cached hashes.
+
+        Args:
+            steps (int): The number of old buckets to migrate.
+        """
+        old_buckets = self._old_buckets
+        buckets = self.buckets
+        capacity = self.capacity
+        end = min(self._rehash_index + steps, len(old_buckets))
+
+        for index in range(self._rehash_index, end):
+            old_bucket = old_buckets[index]
+
+            if old_bucket is not None:
+                curr_node = old_bucket.first_node
+
+                while curr_node is not NIL_NODE:
+                    next_node = curr_node.next_node
+                    bucket = buckets[curr_node.hash % capacity]
+
+                    if bucket is None:
+                        bucket = buckets[curr_node.hash % capacity] = HashBucket()
+
+                    bucket.append_node(curr_node)
+                    curr_node = next_node
+
+                old_bucket.first_node = NIL_NODE
+                old_bucket.last_node = NIL_NODE
+                old_bucket.size = 0
+                old_bucket._version += 1
+
+            old_buckets[index] = None
+
+        self._rehash_index = end
+
+        if end == len(old_buckets):
+            self._old_buckets = None
+
+    def _find(self, key: Hashable, key_hash: int) -> Tuple[Optional[HashBucket], Node]:
+        """
+        Looks a key up in the new buckets and, during an incremental resize,
+        in the old bucket it may still be in.
+
+        Returns:
+            (bucket, node): The bucket holding the key and its node, or the
+            bucket where the key belongs, None if it was not created yet,
+            and NIL_NODE.
+        """
+        bucket = self.buckets[key_hash % self.capacity]
+        node = NIL_NODE if bucket is None else bucket.find(key, key_hash)
+
+        if node is NIL_NODE and self._old_buckets is not None:
+            index = key_hash % len(self._old_buckets)
+            old_bucket = self._old_buckets[index]
+
+            if index >= self._rehash_index and old_bucket is not None:
+                old_node = old_bucket.find(key, key_hash)
+
+                if old_node is not NIL_NODE:
+                    return old_bucket, old_node
+
+        return bucket, node
+
+    def _finish_rehash(self) -> None:
+        """
+        Completes an incremental resize in progress, if any.
+        """
+        if self._old_buckets is not None:
+            self._rehash(len(self._old_buckets))
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs) -> "DynamicHashSet":
+        """
+        Creates a HashSet holding the keys of an iterable.
+
+        Args:
+            iterable: The keys to be added to the HashSet.
+            **kwargs: The options of the HashSet, as in __init__.
+        Returns:
+            DynamicHashSet: The new HashSet.
+        """
+        hashset = cls(**kwargs)
+        hashset.update(iterable)
+
+        return hashset
+
+    def update(self, iterable) -> None:
+        """
+        Adds every key of an iterable to the HashSet.
+
+        The table is resized once up front from the length hint of the
+        iterable. Each key is then hashed once and written straight to its
+        bucket, and the load factor only triggers a resize if the hint fell
+        short.
+
+        Args:
+            iterable: The keys to be added to the HashSet.
+        """
+        self.reserve(self.size + length_hint(iterable))
+        self._finish_rehash()
+
+        buckets = self.buckets
+        capacity = self.capacity
+        limit = capacity * self.load_factor_threshold
+
+        for key_hash, key in self._hashed(iterable):
+            if key is None:
+                raise Exception("Key can not be None.")
+
+            bucket = buckets[key_hash % capacity]
+
+            if bucket is None:
+                bucket = buckets[key_hash % capacity] = HashBucket()
+            elif bucket.find(key, key_hash) is not NIL_NODE:
+                continue
+
+            bucket.append_node(HashNode(key, key_hash))
+            self.size += 1
+
+            if self.size > limit:
+                self.resize(capacity * 2)
+                self._finish_rehash()
+
+                buckets = self.buckets
+                capacity = self.capacity
+                limit = capacity * self.load_factor_threshold
+
     def add(self, key: Hashable) -> None:
         """
         Add a new key to the HashSet.
 
+        The key is hashed once, and a single scan of its bucket either finds
+        it or tells that it has to be appended.
+
         Params:
         key (Hashable): A key of any hashable type to store in the HashSet.
         """
-        if key in self:  # if self.__contains__(key):
+        if key is None:
+            raise Exception("Key can not be None.")
+
+        if self._old_buckets is not None:
+            self._rehash(self.rehash_step)
+
+        self._add_hashed(key, hash(key))
+
+    def _add_hashed(self, key: Hashable, key_hash: int) -> None:
+        """
+        Adds a key with a known hash if it is not in the HashSet.
+        """
+        bucket, node = self._find(key, key_hash)
+
+        if node is not NIL_NODE:
             return
 
-        index = self._hash(key)
-        linked_list = self.buckets[index]
-        linked_list.append(key)
+        if bucket is None:
+            bucket = self.buckets[key_hash % self.capacity] = HashBucket()
+
+        bucket.append_node(HashNode(key, key_hash))
         self.size += 1
 
         if self.size / self.capacity > self.load_factor_threshold:
@@ -60,49 +345,103 @@ class DynamicHashSet:
 
     def remove(self, key: Hashable) -> None:
         """
+        Remove a key from the HashSet.
 
-        Args:
-            key: A port value greater or equal to 1024.
+        The node found by the bucket scan is unlinked directly, without
+        searching the bucket a second time.
 
-        Returns:
-            The new minimum port.
+        Args:
+            key (Hashable): The key to be removed from the HashSet.
 
         Raises:
-            ConnectionError: If no available port is found.
+            Exception: If the key is not in the HashSet.
         """
-        if key not in self:
+        if self._old_buckets is not None:
+            self._rehash(self.rehash_step)
+
+        if not self._discard_hashed(key, hash(key)):
             raise Exception("Key is not in the set.")
 
-        index = self._hash(key)
-        linked_list = self.buckets[index]
+    def _discard_hashed(self, key: Hashable, key_hash: int) -> bool:
+        """
+        Removes a key with a known hash if it is in the HashSet.
 
-        linked_list.remove(item=key)
+        Returns:
+            bool: Whether the key was in the HashSet.
+        """
+        bucket, node = self._find(key, key_hash)
+
+        if node is NIL_NODE:
+            return False
+
+        bucket.unlink(node)
         self.size -= 1
 
-        if self.capacity > self.initial_capacity and self.size / self.capacity < (
-            1 - self.load_factor_threshold
+        if (
+            self.capacity > self.min_capacity
+            and self.size / self.capacity < self.shrink_threshold
         ):
-            self.resize(self.capacity // 2)
+            self.resize(max(self.capacity // 2, self.min_capacity))
+
+        return True
+
+    def _capacity_for(self, count: int) -> int:
+        """
+        Returns the smallest capacity that holds count keys without going
+        above the load factor threshold.
+        """
+        return max(ceil(count / self.load_factor_threshold), 1)
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the HashSet, with a single resize, so that it holds count keys
+        without resizing again.
+
+        Args:
+            count (int): The number of keys the HashSet should hold.
+        """
+        capacity = self._capacity_for(count)
+
+        if capacity > self.capacity:
+            self.resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Shrinks the HashSet to the smallest capacity that holds its keys,
+        but never below min_capacity.
+        """
+        capacity = max(self._capacity_for(self.size), self.min_capacity)
+
+        if capacity < self.capacity:
+            self.resize(capacity)
 
     def resize(self, new_capacity: int) -> None:
         """
         Resize the HashSet to a new capacity.
+
+        The nodes are moved to their new buckets using their cached hashes,
+        so no key is hashed again and no node is allocated. The new table
+        starts as None slots and each bucket is created by its first node. In
+        incremental mode, the nodes are moved by the following operations. A resize requested while another one is
+        in progress first finishes the pending one.
+
         Args:
             capacity (int): The new capacity for the HashSet.
-            old_buckets (list[DoublyLinkedList]): The list of buckets before resizing.
-            buckets (list[DoublyLinkedList]): The list of buckets after resizing.
+            old_buckets (list[HashBucket]): The list of buckets before resizing.
+            buckets (list[HashBucket]): The list of buckets after resizing.
             size (int): The number of elements in the HashSet.
 
         """
+        if self._old_buckets is not None:
+            self._rehash(len(self._old_buckets))
+
         self.capacity = new_capacity
-        old_buckets = self.buckets
-        self.buckets = [DoublyLinkedList() for _ in range(new_capacity)]
-        self.size = 0
+        self._old_buckets = self.buckets
+        self._rehash_index = 0
+        self.buckets = [None] * new_capacity
 
-        for bucket in old_buckets:
-            for i in range(len(bucket)):
-                if bucket[i].item is not None:
-                    self.add(bucket[i].item)
+        if not self.incremental_resize:
+            self._rehash(len(self._old_buckets))
 
         # print("\n\n------- Resize done -------\n")
         # self.print_lists()
@@ -112,16 +451,47 @@ class DynamicHashSet:
         """
         contains(key): Returns True if the key is in the HashSet, False otherwise.
         Args:
-            index (int): The index of the key to be searched for.
-            linked_list: buckets[index]: The linked list at the index of the key.
+            key (Hashable): The key to be searched for.
+
+        Lookups do not advance an incremental resize.
 
         Returns:
             bool: True if the key is in the HashSet, False otherwise.
         """
-        index = self._hash(key)
-        linked_list = self.buckets[index]
+        return self._find(key, hash(key))[1] is not NIL_NODE
 
-        return linked_list.search(key).item is not None
+    def _contains_hashed(self, key: Hashable, key_hash: int) -> bool:
+        """
+        Tells whether a key with a known hash is in the HashSet.
+        """
+        return self._find(key, key_hash)[1] is not NIL_NODE
+
+    def _hashed_keys(self) -> Iterator[Tuple[int, Hashable]]:
+        """
+        Yields the (hash, key) pairs of the HashSet from the cached hashes.
+        """
+        for bucket in self._all_buckets():
+            curr_node = bucket.first_node
+
+            while curr_node is not NIL_NODE:
+                yield curr_node.hash, curr_node.item
+                curr_node = curr_node.next_node
+
+    def _new_set(self, count: int) -> "DynamicHashSet":
+        """
+        Returns an empty HashSet with the same options, sized for count keys.
+        """
+        hashset = self.__class__(
+            self.initial_capacity,
+            self.load_factor_threshold,
+            self.shrink_threshold,
+            self.min_capacity,
+            self.incremental_resize,
+            self.rehash_step,
+        )
+        hashset.reserve(count)
+
+        return hashset
 
     def __len__(self) -> int:
         """
@@ -129,13 +499,42 @@ class DynamicHashSet:
         """
         return self.size
 
+    def _all_buckets(self) -> List[HashBucket]:
+        """
+        _all_buckets(): Returns the old buckets not migrated yet, if a resize
+        is in progress, followed by the current buckets, skipping the buckets
+        that were never created.
+        """
+        buckets = self.buckets
+
+        if self._old_buckets is not None:
+            buckets = self._old_buckets[self._rehash_index:] + buckets
+
+        return [bucket for bucket in buckets if bucket is not None]
+
+    @staticmethod
+    def _bucket_str(bucket: Optional[HashBucket]) -> str:
+        """
+        Returns the string representation of a bucket, showing a bucket that
+        was never created as an empty one.
+        """
+        return "| |" if bucket is None else str(bucket)
+
     def print_lists(self) -> None:
         """
         print_lists(): Prints the contents of the HashSet.
         """
+        if self._old_buckets is not None:
+            print(
+                "\n".join(
+                    "old " + str(i) + " -> " + self._bucket_str(self._old_buckets[i])
+                    for i in range(self._rehash_index, len(self._old_buckets))
+                )
+            )
+
         print(
             "\n".join(
-                str(i) + " -> " + str(linked_list)
+                str(i) + " -> " + self._bucket_str(linked_list)
                 for i, linked_list in enumerate(self.buckets)
             )
             + "\n\n"
@@ -143,18 +542,17 @@ class DynamicHashSet:
 
     def __str__(self) -> str:
         elements = []  # [25, 35, 22, 59, 61, 21, 26, 54]
-        for linked_list in self.buckets:
-            for i in range(len(linked_list)):
-                elements.append(linked_list[i])
+        for linked_list in self._all_buckets():
+            elements.extend(linked_list)
 
-        return "{" + ", ".join(str(element.item) for element in elements) + "}"
+        return "{" + ", ".join(str(element) for element in elements) + "}"
 
     def __repr__(self) -> str:
         """
         repr (): Returns a string representation of the HashSet.
         """
         return "; ".join(
-            str(i) + " -> " + str(linked_list)
+            str(i) + " -> " + self._bucket_str(linked_list)
             for i, linked_list in enumerate(self.buckets)
         )
 
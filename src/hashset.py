@@ -1,20 +1,42 @@
+from array import array
+from operator import length_hint
 from .doubly_linked_list import DoublyLinkedList
+from .node import NIL_NODE
+from .set_operations import SetOperations
 
 
-class HashSet:
+class HashSet(SetOperations):
     """
     HashSet is a data structure that implements a set using a hash table.
     It uses a list of linked lists to store the elements in the set.
     The hash table is implemented using a list of linked lists, where each linked list
     is a bucket that stores the elements that hash to the same index.
 
+    Passing probing="linear" or probing="quadratic" creates an
+    OpenAddressingHashSet instead, which keeps the keys in flat arrays.
+
+    Set algebra (union, intersection, |, &=, issubset, ...) comes from
+    SetOperations.
+
     """
-    def __init__(self, capacity=10):
+    def __new__(cls, capacity=10, probing=None):
+        """
+        Creates a HashSet, or an OpenAddressingHashSet if a probing
+        strategy is given.
+        """
+        if cls is HashSet and probing is not None:
+            cls = OpenAddressingHashSet
+
+        return super().__new__(cls)
+
+    def __init__(self, capacity=10, probing=None):
         """
         Initializes the HashSet with a given capacity.
         Args:
             buckets (list[DoublyLinkedList]): The list of buckets for the HashSet.
             capacity (int): The initial capacity of the HashSet.
+            probing (str | None): None to chain collisions in linked lists,
+                or "linear" / "quadratic" to use open addressing.
             size (int): The number of elements in the HashSet.
         """
         self.buckets = [DoublyLinkedList() for _ in range(capacity)]
@@ -46,6 +68,73 @@ class HashSet:
         linked_list.append(key)
         self.size += 1
 
+    @classmethod
+    def from_iterable(cls, iterable, capacity=None, probing=None):
+        """
+        Creates a HashSet holding the keys of an iterable.
+
+        Args:
+            iterable: The keys to be added to the HashSet.
+            capacity (int | None): The capacity of the HashSet. Defaults to
+                the length hint of the iterable, and at least 10.
+            probing (str | None): The collision strategy, as in __init__.
+        Returns:
+            HashSet: The new HashSet.
+        """
+        if capacity is None:
+            capacity = max(10, length_hint(iterable))
+
+        hashset = cls(capacity) if probing is None else cls(capacity, probing)
+        hashset.update(iterable)
+
+        return hashset
+
+    def update(self, iterable):
+        """
+        Adds every key of an iterable to the HashSet.
+
+        Each key is hashed once and its bucket scanned once, instead of the
+        lookup followed by the insertion done by add.
+
+        Args:
+            iterable: The keys to be added to the HashSet.
+        """
+        for key_hash, key in self._hashed(iterable):
+            if key is None:
+                raise Exception("Key can not be None.")
+
+            self._add_hashed(key, key_hash)
+
+    def _hashed_keys(self):
+        """Yields the (hash, key) pairs of the HashSet."""
+        for linked_list in self.buckets:
+            for key in linked_list:
+                yield hash(key), key
+
+    def _contains_hashed(self, key, key_hash):
+        """Tells whether a key with a known hash is in the HashSet."""
+        return self.buckets[key_hash % self.capacity].search(key) is not NIL_NODE
+
+    def _add_hashed(self, key, key_hash):
+        """Adds a key with a known hash if it is not in the HashSet."""
+        linked_list = self.buckets[key_hash % self.capacity]
+
+        if linked_list.search(key) is NIL_NODE:
+            linked_list.append(key)
+            self.size += 1
+
+    def _discard_hashed(self, key, key_hash):
+        """Removes a key with a known hash if it is in the HashSet."""
+        linked_list = self.buckets[key_hash % self.capacity]
+
+        if linked_list.search(key) is not NIL_NODE:
+            linked_list.remove(item=key)
+            self.size -= 1
+
+    def _new_set(self, count):
+        """Returns an empty HashSet with a capacity for count keys."""
+        return self.__class__(max(10, count))
+
     def remove(self, key):
         """
         Removes a key from the HashSet.
@@ -59,7 +148,7 @@ class HashSet:
         index = self.hash(key)
         linked_list = self.buckets[index]
 
-        linked_list.remove(key)
+        linked_list.remove(item=key)
         self.size -= 1
 
     def __contains__(self, key):
@@ -67,7 +156,7 @@ class HashSet:
         index = self.hash(key)
         linked_list = self.buckets[index]
 
-        return linked_list.search(key) is not None
+        return linked_list.search(key).item is not None
 
     def __len__(self):
         """Returns the number of elements in the HashSet."""
@@ -84,10 +173,242 @@ class HashSet:
         """Returns a string representation of the HashSet."""
         elements = []  # [25, 35, 22, 59, 61, 21, 26, 54]
         for linked_list in self.buckets:
-            for i in range(len(linked_list)):
-                elements.append(linked_list[i])
+            elements.extend(linked_list)
 
-        return "{" + ", ".join(str(element.item) for element in elements) + "}"
+        return "{" + ", ".join(str(element) for element in elements) + "}"
+
+
+_TOMBSTONE = object()
+
+
+class OpenAddressingHashSet(HashSet):
+    """
+    HashSet that resolves collisions by open addressing.
+
+    Keys live in a flat list and their full hashes in a parallel integer
+    array, so a lookup probes neighbouring slots of two arrays instead of
+    following linked list nodes, and the cached hash is compared before the
+    key itself. The capacity is always a power of two and slots are found
+    by masking the hash, then probing linearly or quadratically (triangular
+    steps, which visit every slot of a power-of-two table).
+
+    Removed keys leave a tombstone so that probe chains stay intact.
+    Tombstones are reused by later insertions and dropped when the table is
+    compacted, which happens when they pile up or when the table is rebuilt
+    to grow.
+
+    Attributes:
+        keys (list): The key stored in each slot, None for an empty slot.
+        hashes (array): The hash of the key stored in each slot.
+        capacity (int): The number of slots.
+        probing (str): "linear" or "quadratic".
+        size (int): The number of elements in the HashSet.
+        tombstones (int): The number of slots holding a tombstone.
+    """
+    max_load_factor = 2 / 3
+
+    def __init__(self, capacity=10, probing="linear"):
+        """
+        Initializes an empty table with room for at least capacity keys.
+
+        Args:
+            capacity (int): The number of keys the table should hold
+                before growing.
+            probing (str): "linear" or "quadratic".
+        """
+        if probing not in ("linear", "quadratic"):
+            raise Exception("Probing must be 'linear' or 'quadratic'.")
+
+        self.probing = probing
+        self._allocate(self._capacity_for(capacity))
+
+    def _capacity_for(self, count):
+        """
+        Returns the smallest power of two that holds count keys under the
+        maximum load factor.
+        """
+        capacity = 8
+        while count > capacity * self.max_load_factor:
+            capacity *= 2
+
+        return capacity
+
+    def _allocate(self, capacity):
+        """
+        Replaces the table with an empty one of the given capacity.
+        """
+        self.keys = [None] * capacity
+        self.hashes = array("q", bytes(8 * capacity))
+        self.capacity = capacity
+        self.size = 0
+        self.tombstones = 0
+
+    def _find_slot(self, key, key_hash):
+        """
+        Probes the table for a key.
+
+        Args:
+            key: The key to look for.
+            key_hash (int): The hash of the key.
+        Returns:
+            (index, found): The slot holding the key and True, or the slot
+            where the key should be inserted and False.
+        """
+        keys = self.keys
+        hashes = self.hashes
+        mask = self.capacity - 1
+        quadratic = self.probing == "quadratic"
+
+        index = key_hash & mask
+        step = 0
+        free_slot = -1
+
+        while True:
+            slot_key = keys[index]
+
+            if slot_key is None:
+                return (index if free_slot < 0 else free_slot), False
+
+            if slot_key is _TOMBSTONE:
+                if free_slot < 0:
+                    free_slot = index
+            elif hashes[index] == key_hash and (slot_key is key or slot_key == key):
+                return index, True
+
+            step += 1
+            index = (index + (step if quadratic else 1)) & mask
+
+    def _rebuild(self, capacity):
+        """
+        Moves every key into a new table of the given capacity, reusing the
+        cached hashes and dropping the tombstones.
+        """
+        old_keys = self.keys
+        old_hashes = self.hashes
+
+        self._allocate(capacity)
+
+        for index, key in enumerate(old_keys):
+            if key is not None and key is not _TOMBSTONE:
+                key_hash = old_hashes[index]
+                slot, _ = self._find_slot(key, key_hash)
+                self.keys[slot] = key
+                self.hashes[slot] = key_hash
+                self.size += 1
+
+    def add(self, key):
+        """
+        Adds a key to the HashSet with a single probe.
+
+        Args:
+            key: The key to be added to the HashSet.
+        """
+        if key is None:
+            raise Exception("Key can not be None.")
+
+        self._add_hashed(key, hash(key))
+
+    def _add_hashed(self, key, key_hash):
+        """Adds a key with a known hash if it is not in the HashSet."""
+        index, found = self._find_slot(key, key_hash)
+
+        if found:
+            return
+
+        if self.keys[index] is _TOMBSTONE:
+            self.tombstones -= 1
+        elif self.size + self.tombstones + 1 > self.capacity * self.max_load_factor:
+            self._rebuild(self._capacity_for(self.size + 1))
+            index, _ = self._find_slot(key, key_hash)
+
+        self.keys[index] = key
+        self.hashes[index] = key_hash
+        self.size += 1
+
+    def update(self, iterable):
+        """
+        Adds every key of an iterable to the HashSet. The table is grown
+        once up front from the length hint of the iterable.
+
+        Args:
+            iterable: The keys to be added to the HashSet.
+        """
+        count = self.size + length_hint(iterable)
+
+        if count > self.capacity * self.max_load_factor:
+            self._rebuild(self._capacity_for(count))
+
+        for key_hash, key in self._hashed(iterable):
+            if key is None:
+                raise Exception("Key can not be None.")
+
+            self._add_hashed(key, key_hash)
+
+    def _hashed_keys(self):
+        """Yields the (hash, key) pairs of the HashSet."""
+        hashes = self.hashes
+
+        for index, key in enumerate(self.keys):
+            if key is not None and key is not _TOMBSTONE:
+                yield hashes[index], key
+
+    def _contains_hashed(self, key, key_hash):
+        """Tells whether a key with a known hash is in the HashSet."""
+        return key is not None and self._find_slot(key, key_hash)[1]
+
+    def _new_set(self, count):
+        """Returns an empty HashSet with the same probing, sized for count keys."""
+        return self.__class__(count, self.probing)
+
+    def remove(self, key):
+        """
+        Removes a key from the HashSet, leaving a tombstone in its slot.
+        The table is compacted once tombstones fill a quarter of it.
+
+        Args:
+            key: The key to be removed from the HashSet.
+        """
+        if not self._discard_hashed(key, hash(key)):
+            raise Exception("Key is not in the set.")
+
+    def _discard_hashed(self, key, key_hash):
+        """
+        Removes a key with a known hash if it is in the HashSet.
+
+        Returns:
+            bool: Whether the key was in the HashSet.
+        """
+        index, found = self._find_slot(key, key_hash)
+
+        if not found:
+            return False
+
+        self.keys[index] = _TOMBSTONE
+        self.size -= 1
+        self.tombstones += 1
+
+        if self.tombstones * 4 > self.capacity:
+            self._rebuild(self.capacity)
+
+        return True
+
+    def __contains__(self, key):
+        """if key in conjunto"""
+        return key is not None and self._find_slot(key, hash(key))[1]
+
+    def print_lists(self):
+        """ Prints the contents of each slot in the HashSet."""
+        return "\n".join(
+            str(i) + " -> " + ("<deleted>" if key is _TOMBSTONE else str(key))
+            for i, key in enumerate(self.keys)
+            if key is not None
+        )
+
+    def __str__(self):
+        """Returns a string representation of the HashSet."""
+        return "{" + ", ".join(
+            str(key) for key in self.keys if key is not None and key is not _TOMBSTONE
+        ) + "}"
 
 
 if __name__ == "__main__":
@@ -101,3 +422,13 @@ if __name__ == "__main__":
     print(hashset.print_lists())
     print()
     print(hashset)
+
+    open_hashset = HashSet(probing="quadratic")
+
+    for i in range(50):
+        open_hashset.add(round(random(), 2))
+
+    print()
+    print(open_hashset.print_lists())
+    print()
+    print(open_hashset)
@@ -0,0 +1,426 @@
+from random import getrandbits
+from typing import Any, List, Optional, Tuple
+from .doubly_linked_list import DoublyLinkedList
+from .node import Node, NIL_NODE
+
+MAX_LEVEL = 32
+
+
+class IndexedNode(Node):
+    """
+    Node of an IndexedDoublyLinkedList.
+
+    Besides the regular links, a node may belong to some of the skip-list
+    levels that sit above the list. For each of those levels it keeps the
+    next and previous node on that level, and the span of the forward link,
+    i.e., how many positions it skips.
+
+    Attributes:
+        forward (list[IndexedNode | None]): The next node on each level, or
+            None at the end of the level.
+        backward (list[IndexedNode | None]): The previous node on each level,
+            or None if the node is the first one of the level.
+        span (list[int]): The distance to the next node on each level.
+    """
+    __slots__ = ("forward", "backward", "span")
+
+    def __init__(self, item: Any, levels: int) -> None:
+        super().__init__(item)
+        self.forward: List[Optional[IndexedNode]] = [None] * levels
+        self.backward: List[Optional[IndexedNode]] = [None] * levels
+        self.span: List[int] = [0] * levels
+
+
+class IndexedDoublyLinkedList(DoublyLinkedList):
+    """
+    Doubly linked list with an indexable skip list on top of it.
+
+    Each node is promoted to a random number of levels above the list, and
+    each level links its nodes with the number of positions every link
+    skips. Positional access descends the levels, so __getitem__, insert and
+    remove(index=...) take O(log n) expected time instead of a linear walk.
+
+    Nodes are placed at virtual positions, and the rank of a node is its
+    virtual position minus offset. Removing or inserting at the front only
+    moves offset, and appending or removing at the back only touches the
+    levels of that node, so operations at either end stay O(1) expected.
+
+    Attributes:
+        size (int): The number of elements in the list.
+        first_node (Node): The first node in the list.
+        last_node (Node): The last node in the list.
+    """
+    __slots__ = ("_offset", "_head_forward", "_head_pos", "_tails", "_tail_pos")
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty list with no skip-list levels.
+        """
+        super().__init__()
+        self._offset = 0
+        self._head_forward: List[Optional[IndexedNode]] = []
+        self._head_pos: List[int] = []
+        self._tails: List[Optional[IndexedNode]] = []
+        self._tail_pos: List[int] = []
+
+    def _new_node(self, item: Any) -> IndexedNode:
+        """
+        Creates a node promoted to a random number of levels, each level
+        holding half of the nodes of the level below it.
+        """
+        bits = getrandbits(MAX_LEVEL)
+        levels = (bits & -bits).bit_length() - 1 if bits else MAX_LEVEL
+
+        while len(self._head_forward) < levels:
+            self._head_forward.append(None)
+            self._head_pos.append(0)
+            self._tails.append(None)
+            self._tail_pos.append(0)
+
+        return IndexedNode(item, levels)
+
+    def _predecessors(self, target: int) -> Tuple[list, List[int]]:
+        """
+        Finds, on every level, the last node placed before a virtual position.
+
+        Args:
+            target (int): The virtual position.
+
+        Returns: The predecessor on each level, None meaning the head of the
+        level, and the virtual position of each predecessor.
+        """
+        levels = len(self._head_forward)
+        preds: List[Optional[IndexedNode]] = [None] * levels
+        positions = [0] * levels
+
+        node: Optional[IndexedNode] = None
+        pos = 0
+
+        for level in range(levels - 1, -1, -1):
+            if node is None:
+                first = self._head_forward[level]
+                if first is not None and self._head_pos[level] < target:
+                    node, pos = first, self._head_pos[level]
+
+            if node is not None:
+                next_node = node.forward[level]
+                while next_node is not None and pos + node.span[level] < target:
+                    pos += node.span[level]
+                    node = next_node
+                    next_node = node.forward[level]
+
+            preds[level] = node
+            positions[level] = pos
+
+        return preds, positions
+
+    def _node_at(self, index: int) -> Node:
+        """
+        Returns the node at a valid, non-negative index.
+        """
+        if index == 0:
+            return self.first_node
+        if index == self.size - 1:
+            return self.last_node
+
+        target = self._offset + index
+        node: Node = self.first_node
+        pos = self._offset
+
+        if self._head_forward:
+            preds, positions = self._predecessors(target + 1)
+            if preds[0] is not None:
+                node, pos = preds[0], positions[0]
+
+        for _ in range(target - pos):
+            node = node.next_node
+
+        return node
+
+    def __getitem__(self, index):
+        """
+        __getitem__(index): Returns the node at the specified index.
+
+        Negative indexes count from the end of the list, and a slice returns a
+        new list with the selected items.
+
+        Args:
+            index (int | slice): The index of the node to be retrieved, or a
+            slice of the list.
+
+        Returns: curr_node (Node): The node at the specified index, or
+        NIL_NODE if the index is out of range.
+        """
+        if isinstance(index, slice):
+            return self._slice(index)
+
+        if index < 0:
+            index += self.size
+
+        if index < 0 or index >= self.size:
+            return NIL_NODE
+
+        return self._node_at(index)
+
+    def append(self, item: Any) -> None:
+        """
+        Append an item to the end of the list.
+
+        Args:
+            item (Any): The item to be appended.
+            Raises: Exception: If the item is None.
+        """
+        if item is None:
+            raise Exception("Item can not be None.")
+
+        new_node = self._new_node(item)
+        target = self._offset + self.size
+
+        for level in range(len(new_node.forward)):
+            tail = self._tails[level]
+
+            if tail is None:
+                self._head_forward[level] = new_node
+                self._head_pos[level] = target
+            else:
+                tail.forward[level] = new_node
+                tail.span[level] = target - self._tail_pos[level]
+                new_node.backward[level] = tail
+
+            self._tails[level] = new_node
+            self._tail_pos[level] = target
+
+        if self.size == 0:
+            self.first_node = new_node
+        else:
+            new_node.prev_node = self.last_node
+            self.last_node.next_node = new_node
+
+        self.last_node = new_node
+        self.size += 1
+        self._version += 1
+
+    def insert(self, elem, pos):
+        """
+        insert(elem, pos): Inserts an item at a specific position.
+
+        Args:
+            elem (Any): The item to be inserted.
+            pos (int): The position at which the item should be inserted.
+            Raises: Exception: If the position is invalid.
+        """
+        if pos < 0 or pos > self.size:
+            raise Exception("Position not valid.")
+
+        if pos == self.size:
+            self.append(elem)
+            return
+
+        curr_node = self._node_at(pos)
+        new_node = self._new_node(elem)
+        levels = len(new_node.forward)
+
+        if pos == 0:
+            self._offset -= 1
+            target = self._offset
+            preds: list = [None] * len(self._head_forward)
+            positions = [0] * len(self._head_forward)
+        else:
+            target = self._offset + pos
+            preds, positions = self._predecessors(target)
+
+        for level in range(len(self._head_forward)):
+            pred = preds[level]
+
+            if pred is None:
+                next_node = self._head_forward[level]
+                next_pos = self._head_pos[level]
+            else:
+                next_node = pred.forward[level]
+                next_pos = positions[level] + pred.span[level]
+
+            if level >= levels:
+                # The link over the new node now skips one more position,
+                # unless the insertion happened in front of everything.
+                if next_node is not None and pos != 0:
+                    if pred is None:
+                        self._head_pos[level] += 1
+                    else:
+                        pred.span[level] += 1
+                    self._tail_pos[level] += 1
+                continue
+
+            new_node.forward[level] = next_node
+            new_node.backward[level] = pred
+
+            if next_node is None:
+                self._tails[level] = new_node
+                self._tail_pos[level] = target
+            else:
+                if pos != 0:
+                    next_pos += 1
+                    self._tail_pos[level] += 1
+                next_node.backward[level] = new_node
+                new_node.span[level] = next_pos - target
+
+            if pred is None:
+                self._head_forward[level] = new_node
+                self._head_pos[level] = target
+            else:
+                pred.forward[level] = new_node
+                pred.span[level] = target - positions[level]
+
+        if pos == 0:
+            self.first_node = new_node
+        else:
+            prev_node = curr_node.prev_node
+            prev_node.next_node = new_node
+            new_node.prev_node = prev_node
+
+        curr_node.prev_node = new_node
+        new_node.next_node = curr_node
+
+        self.size += 1
+        self._version += 1
+
+    def remove(self, index=None, item=None):
+        """
+        remove(index=None, item=None): Removes an item by index or by value.
+
+        Args:
+            index (int): The index of the item to be removed. Negative
+            indexes count from the end of the list.
+            item (Any): The value of the item to be removed.
+            Raises: Exception: If both index and item are None, or if no
+            node matches them.
+        """
+        if index is not None:
+            if index < 0:
+                index += self.size
+            if index < 0 or index >= self.size:
+                raise Exception("Item is not in the list.")
+        elif item is not None:
+            index = 0
+            curr_node = self.first_node
+            while curr_node is not NIL_NODE and curr_node.item != item:
+                index += 1
+                curr_node = curr_node.next_node
+            if curr_node is NIL_NODE:
+                raise Exception("Item is not in the list.")
+        else:
+            raise Exception("Either index or item must be given.")
+
+        target = self._offset + index
+
+        if index == 0:
+            curr_node = self.first_node
+            self._remove_first(curr_node, target)
+        elif index == self.size - 1:
+            curr_node = self.last_node
+            self._remove_last(curr_node, target)
+        else:
+            curr_node = self._node_at(index)
+            self._remove_middle(curr_node, target)
+
+        if curr_node == self.first_node:
+            self.first_node = curr_node.next_node
+        else:
+            curr_node.prev_node.next_node = curr_node.next_node
+
+        if curr_node == self.last_node:
+            self.last_node = curr_node.prev_node
+        else:
+            curr_node.next_node.prev_node = curr_node.prev_node
+
+        self.size -= 1
+        self._version += 1
+
+        if self.size == 0:
+            self._offset = 0
+
+    def _remove_first(self, node: IndexedNode, target: int) -> None:
+        """
+        Unlinks the first node from its levels. The nodes behind it keep
+        their virtual positions and the offset moves past the removed node.
+        """
+        for level in range(len(node.forward)):
+            next_node = node.forward[level]
+            self._head_forward[level] = next_node
+
+            if next_node is None:
+                self._tails[level] = None
+            else:
+                next_node.backward[level] = None
+                self._head_pos[level] = target + node.span[level]
+
+        self._offset += 1
+
+    def _remove_last(self, node: IndexedNode, target: int) -> None:
+        """
+        Unlinks the last node from its levels. No link can skip over the
+        last node, so only the levels of the node itself change.
+        """
+        for level in range(len(node.forward)):
+            pred = node.backward[level]
+            self._tails[level] = pred
+
+            if pred is None:
+                self._head_forward[level] = None
+            else:
+                pred.forward[level] = None
+                self._tail_pos[level] = target - pred.span[level]
+
+    def _remove_middle(self, node: IndexedNode, target: int) -> None:
+        """
+        Unlinks a node from its levels and shortens every link skipping over
+        it, as every node behind it moves one position closer.
+        """
+        preds, positions = self._predecessors(target)
+        levels = len(node.forward)
+
+        for level in range(len(self._head_forward)):
+            pred = preds[level]
+
+            if level >= levels:
+                next_node = self._head_forward[level] if pred is None else pred.forward[level]
+
+                if next_node is not None:
+                    if pred is None:
+                        self._head_pos[level] -= 1
+                    else:
+                        pred.span[level] -= 1
+                    self._tail_pos[level] -= 1
+                continue
+
+            next_node = node.forward[level]
+
+            if pred is None:
+                self._head_forward[level] = next_node
+                if next_node is not None:
+                    self._head_pos[level] = target + node.span[level] - 1
+            else:
+                pred.forward[level] = next_node
+                if next_node is not None:
+                    pred.span[level] += node.span[level] - 1
+
+            if next_node is None:
+                self._tails[level] = pred
+                self._tail_pos[level] = positions[level]
+            else:
+                next_node.backward[level] = pred
+                self._tail_pos[level] -= 1
+
+
+if __name__ == "__main__":
+    indexed_list = IndexedDoublyLinkedList()
+
+    for i in range(10):
+        indexed_list.append(i * 100)
+
+    indexed_list.insert(250, 3)
+    indexed_list.remove(index=0)
+    indexed_list.remove(index=-1)
+
+    print(indexed_list)
+    print("Tamanho:", len(indexed_list))
+    print("Item 5:", indexed_list[5])
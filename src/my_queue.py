@@ -1,13 +1,468 @@
+from .array_doubly_linked_list import ArrayDoublyLinkedList
 from .doubly_linked_list import DoublyLinkedList
+from .node import Node, NIL_NODE
 
 
 class Queue(DoublyLinkedList):
+    """
+    FIFO queue of linked nodes.
+
+    Passing engine="array" creates an ArrayQueue instead, which keeps the
+    items in the parallel arrays of an ArrayDoublyLinkedList and recycles
+    their slots, so a long-running queue stops allocating a node per item.
+    """
+    def __new__(cls, engine=None):
+        """
+        Creates a Queue, or an ArrayQueue if the array engine is asked for.
+
+        Raises:
+            Exception: If the engine is not None or "array".
+        """
+        if engine not in (None, "array"):
+            raise Exception('engine must be None or "array".')
+
+        if cls is Queue and engine == "array":
+            return ArrayQueue()
+
+        return super().__new__(cls)
+
+    def __init__(self, engine=None):
+        """
+        Initializes an empty queue.
+
+        Args:
+            engine (str | None): None to link Node objects, or "array" to
+                use an ArrayQueue.
+        """
+        super().__init__()
+
     def enqueue(self, item):
         self.append(item)
 
     def dequeue(self):
+        if self.size == 0:
+            raise Exception("Queue is empty.")
+
         first_item = self[0]
 
         self.remove(index=0)
 
         return first_item
+
+    def enqueue_many(self, items):
+        """
+        Adds many items to the end of the queue. The items are copied, so
+        items is left untouched even when it is another Queue; use splice to
+        move the nodes of a Queue instead.
+
+        Args:
+            items (Iterable): The items to be added, in order.
+        """
+        for item in list(items) if items is self else items:
+            self.append(item)
+
+    def splice(self, other):
+        """
+        Moves every node of another Queue to the end of this one in O(1),
+        leaving the other queue empty.
+
+        Args:
+            other (Queue): The queue whose nodes are moved, in order.
+        Raises:
+            Exception: If other is this queue.
+        """
+        if other is self:
+            raise Exception("A queue can not be spliced onto itself.")
+
+        if other.size == 0:
+            return
+
+        if self.size == 0:
+            self.first_node = other.first_node
+        else:
+            self.last_node.next_node = other.first_node
+            other.first_node.prev_node = self.last_node
+
+        self.last_node = other.last_node
+        self.size += other.size
+        self._version += 1
+
+        other.first_node = NIL_NODE
+        other.last_node = NIL_NODE
+        other.size = 0
+        other._version += 1
+
+    def _detach(self, count):
+        """
+        Cuts the first count nodes off the queue, with a single walk to the
+        last of them and no per-node relinking.
+
+        Returns:
+            (Node, Node): The first and the last detached nodes.
+        """
+        first_node = self.first_node
+        last_node = self[count - 1]
+
+        self.first_node = last_node.next_node
+
+        if self.first_node is NIL_NODE:
+            self.last_node = NIL_NODE
+        else:
+            self.first_node.prev_node = NIL_NODE
+
+        last_node.next_node = NIL_NODE
+        self.size -= count
+        self._version += 1
+
+        return first_node, last_node
+
+    def dequeue_many(self, n):
+        """
+        Removes up to n items from the front of the queue.
+
+        Args:
+            n (int): The largest number of items to be removed.
+
+        Returns:
+            Queue: A new queue holding the removed nodes, in order.
+        """
+        batch = self.__class__()
+        count = min(n, self.size)
+
+        if count > 0:
+            batch.first_node, batch.last_node = self._detach(count)
+            batch.size = count
+
+        return batch
+
+    def drain(self, n=None):
+        """
+        Removes up to n items, or every item, from the front of the queue.
+
+        Args:
+            n (int | None): The largest number of items to be removed, or
+                None to empty the queue.
+
+        Returns:
+            list: The removed items, in order.
+        """
+        count = self.size if n is None else min(n, self.size)
+
+        if count <= 0:
+            return []
+
+        curr_node, _ = self._detach(count)
+        items = []
+
+        while curr_node is not NIL_NODE:
+            items.append(curr_node.item)
+            curr_node = curr_node.next_node
+
+        return items
+
+
+class ArrayQueue(ArrayDoublyLinkedList):
+    """
+    FIFO queue stored in an ArrayDoublyLinkedList, created by
+    Queue(engine="array").
+
+    It has the methods of Queue. Dequeued items leave the arrays, so dequeue
+    hands them out in a new detached Node, and splice copies the items of
+    the other queue, in O(n), before emptying it.
+    """
+    __slots__ = ()
+
+    def enqueue(self, item):
+        """
+        Adds an item to the end of the queue.
+        """
+        self.append(item)
+
+    def dequeue(self):
+        """
+        Removes the first item of the queue.
+
+        Returns:
+            Node: A detached node holding the item.
+
+        Raises:
+            Exception: If the queue is empty.
+        """
+        if self.size == 0:
+            raise Exception("Queue is empty.")
+
+        slot = self.next_slots[0]
+        item = self.items[slot]
+        self._unlink(slot)
+
+        return Node(item)
+
+    def enqueue_many(self, items):
+        """
+        Adds many items to the end of the queue, copying them.
+
+        Args:
+            items (Iterable): The items to be added, in order.
+        """
+        for item in list(items) if items is self else items:
+            self.append(item)
+
+    def splice(self, other):
+        """
+        Moves every item of another queue to the end of this one, leaving
+        the other queue empty.
+
+        Args:
+            other (Queue | ArrayQueue): The queue whose items are moved, in order.
+        Raises:
+            Exception: If other is this queue.
+        """
+        if other is self:
+            raise Exception("A queue can not be spliced onto itself.")
+
+        self.enqueue_many(other.drain())
+
+    def dequeue_many(self, n):
+        """
+        Removes up to n items from the front of the queue.
+
+        Args:
+            n (int): The largest number of items to be removed.
+
+        Returns:
+            ArrayQueue: A new queue holding the removed items, in order.
+        """
+        batch = self.__class__()
+        batch.enqueue_many(self.drain(n))
+
+        return batch
+
+    def drain(self, n=None):
+        """
+        Removes up to n items, or every item, from the front of the queue.
+        Their slots go back to the free list.
+
+        Args:
+            n (int | None): The largest number of items to be removed, or
+                None to empty the queue.
+
+        Returns:
+            list: The removed items, in order.
+        """
+        count = self.size if n is None else min(n, self.size)
+        items = []
+
+        for _ in range(max(count, 0)):
+            slot = self.next_slots[0]
+            items.append(self.items[slot])
+            self._unlink(slot)
+
+        return items
+
+
+class RingBufferQueue:
+    """
+    Queue stored in a circular buffer instead of linked nodes.
+
+    The items live in a Python list used as a ring: head is the slot of the
+    first item and the following items wrap around the end of the list. The
+    capacity is always a power of two, so a slot is found by masking an
+    index instead of taking a remainder. Enqueueing and dequeueing only write
+    a slot and move an index, and allocate nothing until the buffer is full;
+    it then doubles, and it halves when it becomes a quarter full, never going
+    below its initial capacity.
+
+    Unlike Queue, dequeue returns the item itself, as there are no nodes.
+
+    Attributes:
+        items (list): The buffer, with None in the free slots.
+        head (int): The slot of the first item.
+        size (int): The number of items in the queue.
+        capacity (int): The number of slots, always a power of two.
+    """
+    __slots__ = ("items", "head", "size", "capacity", "initial_capacity")
+
+    def __init__(self, capacity=16):
+        """
+        Initializes an empty queue with room for at least capacity items.
+
+        Args:
+            capacity (int): The number of items the queue holds before
+                growing, rounded up to a power of two.
+        """
+        self.initial_capacity = 1 << max(capacity - 1, 1).bit_length()
+        self.capacity = self.initial_capacity
+        self.items = [None] * self.capacity
+        self.head = 0
+        self.size = 0
+
+    def _resize(self, capacity):
+        """
+        Moves the items to the front of a new buffer of the given capacity.
+        """
+        self.items = list(self) + [None] * (capacity - self.size)
+        self.capacity = capacity
+        self.head = 0
+
+    def enqueue(self, item):
+        """
+        Adds an item to the end of the queue.
+
+        Args:
+            item (Any): The item to be added.
+        """
+        if self.size == self.capacity:
+            self._resize(self.capacity * 2)
+
+        self.items[(self.head + self.size) & (self.capacity - 1)] = item
+        self.size += 1
+
+    def dequeue(self):
+        """
+        Removes the first item of the queue and returns it.
+
+        Returns:
+            Any: The first item.
+
+        Raises:
+            Exception: If the queue is empty.
+        """
+        if self.size == 0:
+            raise Exception("Queue is empty.")
+
+        head = self.head
+        item = self.items[head]
+        self.items[head] = None
+        self.head = (head + 1) & (self.capacity - 1)
+        self.size -= 1
+
+        if self.size * 4 <= self.capacity and self.capacity > self.initial_capacity:
+            self._resize(self.capacity // 2)
+
+        return item
+
+    def enqueue_many(self, items):
+        """
+        Adds many items to the end of the queue. The buffer grows at most
+        once and the items are copied in at most two slice assignments.
+
+        Args:
+            items (Iterable): The items to be added, in order.
+        """
+        items = list(items)
+        count = len(items)
+
+        if self.size + count > self.capacity:
+            capacity = self.capacity
+            while self.size + count > capacity:
+                capacity *= 2
+            self._resize(capacity)
+
+        start = (self.head + self.size) & (self.capacity - 1)
+        first_part = min(count, self.capacity - start)
+
+        self.items[start:start + first_part] = items[:first_part]
+        self.items[:count - first_part] = items[first_part:]
+        self.size += count
+
+    def drain(self, n=None):
+        """
+        Removes up to n items, or every item, from the front of the queue,
+        slicing them out of the buffer at once.
+
+        Args:
+            n (int | None): The largest number of items to be removed, or
+                None to empty the queue.
+
+        Returns:
+            list: The removed items, in order.
+        """
+        count = self.size if n is None else min(n, self.size)
+
+        if count <= 0:
+            return []
+
+        head = self.head
+        end = head + count
+
+        if end <= self.capacity:
+            items = self.items[head:end]
+            self.items[head:end] = [None] * count
+        else:
+            end -= self.capacity
+            items = self.items[head:] + self.items[:end]
+            self.items[head:] = [None] * (self.capacity - head)
+            self.items[:end] = [None] * end
+
+        self.head = end & (self.capacity - 1)
+        self.size -= count
+
+        capacity = self.capacity
+        while self.size * 4 <= capacity and capacity > self.initial_capacity:
+            capacity //= 2
+
+        if capacity != self.capacity:
+            self._resize(capacity)
+
+        return items
+
+    def dequeue_many(self, n):
+        """
+        Removes up to n items from the front of the queue.
+
+        Args:
+            n (int): The largest number of items to be removed.
+
+        Returns:
+            RingBufferQueue: A new queue holding the removed items, in order.
+        """
+        items = self.drain(n)
+        batch = self.__class__(len(items))
+        batch.enqueue_many(items)
+
+        return batch
+
+    def peek(self):
+        """
+        Returns the first item of the queue without removing it.
+
+        Raises:
+            Exception: If the queue is empty.
+        """
+        if self.size == 0:
+            raise Exception("Queue is empty.")
+
+        return self.items[self.head]
+
+    def __len__(self):
+        """
+        Returns the number of items in the queue.
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Yields the items from the first to the last.
+        """
+        end = self.head + self.size
+
+        if end <= self.capacity:
+            return iter(self.items[self.head:end])
+
+        return iter(self.items[self.head:] + self.items[:end - self.capacity])
+
+    def __str__(self):
+        """
+        Returns a string representation of the queue, e.g., "| item1 | item2 |".
+        If the queue is empty, it returns "| |".
+        """
+        if self.size == 0:
+            return "| |"
+
+        return "| " + " | ".join(str(item) for item in self) + " |"
+
+    def __repr__(self):
+        """
+        Returns a string representation for debugging.
+        """
+        return self.__str__()
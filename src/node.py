@@ -2,12 +2,49 @@ from typing import Any
 
 
 class Node:
-    def __init__(self, item: Any):
-        if item is not None:
-            self.prev_node = Node(None)
-            self.next_node = Node(None)
+    """
+    Node of a linked list.
+
+    Nodes are slotted, so they carry no per-instance ``__dict__``, and they do
+    not allocate placeholder neighbours: an unlinked node points to the shared
+    ``NIL_NODE`` marker on both sides.
+
+    Attributes:
+        item (Any): The value stored in the node.
+        prev_node (Node): The previous node, or ``NIL_NODE``.
+        next_node (Node): The next node, or ``NIL_NODE``.
+    """
+    __slots__ = ("item", "prev_node", "next_node")
 
+    def __init__(self, item: Any):
         self.item = item
+        self.prev_node = NIL_NODE
+        self.next_node = NIL_NODE
 
     def __str__(self) -> str:
         return str(self.item)
+
+
+class _NilNode(Node):
+    """
+    End-of-list marker shared by every list.
+
+    Its item is None and both of its links point back to itself, so walking
+    past either end of a list keeps returning the marker. It is read-only,
+    which stops a list from accidentally linking nodes into the marker.
+    """
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "item", None)
+        object.__setattr__(self, "prev_node", self)
+        object.__setattr__(self, "next_node", self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise Exception("The end-of-list marker can not be modified.")
+
+    def __repr__(self) -> str:
+        return "NIL_NODE"
+
+
+NIL_NODE: Node = _NilNode()
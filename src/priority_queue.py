@@ -0,0 +1,303 @@
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+
+class PriorityQueue:
+    """
+    Min-priority queue stored as a d-ary heap in flat lists.
+
+    The priorities and the items are kept in two parallel lists laid out as
+    a heap: the children of slot i are the slots d * i + 1 to d * i + d, and
+    no child has a smaller priority than its parent. A wider heap is lower,
+    so push and decrease_key compare fewer levels on the way up, while pop
+    compares up to d children per level on the way down. A dictionary keeps
+    the slot of every item, which lets decrease_key find an item in O(1).
+    For that reason, items must be hashable and can only be in the queue once.
+
+    Entries are moved by shifting a hole along the path and writing the
+    moved entry once, instead of swapping at every level.
+
+    enqueue and dequeue are aliases of push and pop, following my_queue.
+
+    Attributes:
+        d (int): The number of children of each slot.
+        priorities (list): The priority of the entry in each slot.
+        items (list): The item of the entry in each slot.
+        positions (dict): The slot of each item.
+    """
+    __slots__ = ("d", "priorities", "items", "positions")
+
+    def __init__(self, d: int = 4) -> None:
+        """
+        Initializes an empty priority queue.
+
+        Args:
+            d (int): The number of children of each slot, at least 2.
+        Raises:
+            Exception: If d is smaller than 2.
+        """
+        if d < 2:
+            raise Exception("d must be at least 2.")
+
+        self.d = d
+        self.priorities: List[Any] = []
+        self.items: List[Hashable] = []
+        self.positions: Dict[Hashable, int] = {}
+
+    def _sift_up(self, index: int, item: Hashable, priority: Any) -> None:
+        """
+        Places an entry at index or above it, moving its larger ancestors
+        one level down.
+        """
+        priorities = self.priorities
+        items = self.items
+        positions = self.positions
+        d = self.d
+
+        while index > 0:
+            parent = (index - 1) // d
+
+            if not priority < priorities[parent]:
+                break
+
+            priorities[index] = priorities[parent]
+            items[index] = items[parent]
+            positions[items[index]] = index
+            index = parent
+
+        priorities[index] = priority
+        items[index] = item
+        positions[item] = index
+
+    def _sift_down(self, index: int, item: Hashable, priority: Any) -> None:
+        """
+        Places an entry at index or below it, moving its smallest
+        descendants one level up.
+        """
+        priorities = self.priorities
+        items = self.items
+        positions = self.positions
+        d = self.d
+        size = len(priorities)
+
+        while True:
+            first = d * index + 1
+
+            if first >= size:
+                break
+
+            child = first
+            for other in range(first + 1, min(first + d, size)):
+                if priorities[other] < priorities[child]:
+                    child = other
+
+            if not priorities[child] < priority:
+                break
+
+            priorities[index] = priorities[child]
+            items[index] = items[child]
+            positions[items[index]] = index
+            index = child
+
+        priorities[index] = priority
+        items[index] = item
+        positions[item] = index
+
+    def push(self, item: Hashable, priority: Any = None) -> None:
+        """
+        Adds an item to the queue.
+
+        Args:
+            item (Hashable): The item to be added.
+            priority (Any): Its priority, smaller values coming out first.
+                Defaults to the item itself.
+        Raises:
+            Exception: If the item is already in the queue.
+        """
+        if item in self.positions:
+            raise Exception("Item is already in the queue.")
+
+        if priority is None:
+            priority = item
+
+        self.priorities.append(priority)
+        self.items.append(item)
+        self._sift_up(len(self.items) - 1, item, priority)
+
+    def pop(self) -> Hashable:
+        """
+        Removes the item with the smallest priority and returns it. The last
+        entry of the heap is sifted down from the top into the hole.
+
+        Raises:
+            Exception: If the queue is empty.
+        """
+        if not self.items:
+            raise Exception("Priority queue is empty.")
+
+        top_item = self.items[0]
+        del self.positions[top_item]
+
+        last_item = self.items.pop()
+        last_priority = self.priorities.pop()
+
+        if self.items:
+            self._sift_down(0, last_item, last_priority)
+
+        return top_item
+
+    def peek(self) -> Hashable:
+        """
+        Returns the item with the smallest priority without removing it.
+
+        Raises:
+            Exception: If the queue is empty.
+        """
+        if not self.items:
+            raise Exception("Priority queue is empty.")
+
+        return self.items[0]
+
+    def peek_priority(self) -> Any:
+        """
+        Returns the smallest priority in the queue.
+
+        Raises:
+            Exception: If the queue is empty.
+        """
+        if not self.items:
+            raise Exception("Priority queue is empty.")
+
+        return self.priorities[0]
+
+    def pushpop(self, item: Hashable, priority: Any = None) -> Hashable:
+        """
+        Adds an item and then removes the item with the smallest priority,
+        with a single sift. If the new item would come out first, it is
+        returned right away and the heap is not touched.
+
+        Args:
+            item (Hashable): The item to be added.
+            priority (Any): Its priority, defaulting to the item itself.
+        Returns:
+            Hashable: The item with the smallest priority.
+        Raises:
+            Exception: If the item is already in the queue.
+        """
+        if item in self.positions:
+            raise Exception("Item is already in the queue.")
+
+        if priority is None:
+            priority = item
+
+        if not self.items or priority <= self.priorities[0]:
+            return item
+
+        top_item = self.items[0]
+        del self.positions[top_item]
+        self._sift_down(0, item, priority)
+
+        return top_item
+
+    def heapify(self, items: Iterable, priorities: Optional[Iterable] = None) -> None:
+        """
+        Adds many items and restores the heap once, bottom-up, in linear time.
+
+        Args:
+            items (Iterable): The items to be added.
+            priorities (Iterable | None): The priority of each item, in the
+                same order, or None to use the items themselves.
+        Raises:
+            Exception: If an item is repeated or already in the queue, or if
+            the numbers of items and priorities differ. No item is added then.
+        """
+        new_items = list(items)
+        new_priorities = list(new_items if priorities is None else priorities)
+
+        if len(new_priorities) != len(new_items):
+            raise Exception("Every item needs a priority.")
+
+        if len(set(new_items)) != len(new_items) or any(
+            item in self.positions for item in new_items
+        ):
+            raise Exception("Item is already in the queue.")
+
+        start = len(self.items)
+        self.items.extend(new_items)
+        self.priorities.extend(new_priorities)
+
+        for index in range(start, len(self.items)):
+            self.positions[self.items[index]] = index
+
+        for index in range((len(self.items) - 2) // self.d, -1, -1):
+            self._sift_down(index, self.items[index], self.priorities[index])
+
+    def decrease_key(self, item: Hashable, priority: Any) -> None:
+        """
+        Lowers the priority of an item already in the queue.
+
+        Args:
+            item (Hashable): The item.
+            priority (Any): Its new priority, not larger than the current one.
+        Raises:
+            Exception: If the item is not in the queue, or if the new priority
+            is larger than the current one.
+        """
+        index = self.positions.get(item)
+
+        if index is None:
+            raise Exception("Item is not in the queue.")
+
+        if self.priorities[index] < priority:
+            raise Exception("New priority is larger than the current one.")
+
+        self._sift_up(index, item, priority)
+
+    def priority(self, item: Hashable) -> Optional[Any]:
+        """
+        Returns the priority of an item, or None if it is not in the queue.
+        """
+        index = self.positions.get(item)
+
+        return None if index is None else self.priorities[index]
+
+    def enqueue(self, item: Hashable, priority: Any = None) -> None:
+        """Adds an item to the queue, as push."""
+        self.push(item, priority)
+
+    def dequeue(self) -> Hashable:
+        """Removes the item with the smallest priority and returns it, as pop."""
+        return self.pop()
+
+    def __contains__(self, item: Hashable) -> bool:
+        """Tells whether an item is in the queue."""
+        return item in self.positions
+
+    def __len__(self) -> int:
+        """Returns the number of items in the queue."""
+        return len(self.items)
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the queue, with the items in heap
+        order, e.g., "| item1 | item2 |".
+        """
+        if not self.items:
+            return "| |"
+
+        return "| " + " | ".join(str(item) for item in self.items) + " |"
+
+    def __repr__(self) -> str:
+        """Returns a string representation for debugging."""
+        return self.__str__()
+
+
+if __name__ == "__main__":
+    from random import random
+
+    queue = PriorityQueue()
+    queue.heapify(("job" + str(i) for i in range(10)), (round(random(), 2) for _ in range(10)))
+
+    queue.decrease_key("job9", 0.0)
+
+    while queue:
+        print(queue.priority(queue.peek()), queue.dequeue())
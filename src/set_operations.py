@@ -0,0 +1,287 @@
+from operator import length_hint
+from typing import Hashable, Iterable, Iterator, List, Tuple
+
+
+class SetOperations:
+    """
+    Set algebra shared by the hash sets.
+
+    The operations work on (hash, key) pairs, so keys coming from another
+    hash set are never hashed again: a set that caches the hashes of its keys
+    hands them out directly. Intersections and subset tests iterate the
+    smaller operand, and every result is sized for its final number of keys
+    before it is filled.
+
+    A class using it provides:
+        _hashed_keys(): Yields the (hash, key) pairs of the set.
+        _contains_hashed(key, key_hash): Tells whether the key is in the set.
+        _add_hashed(key, key_hash): Adds the key if it is not in the set.
+        _discard_hashed(key, key_hash): Removes the key if it is in the set.
+        _new_set(count): Returns an empty set with the same options, sized
+            for count keys.
+        update(iterable): Adds every key of an iterable.
+    """
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Yields the keys of the set."""
+        for _, key in self._hashed_keys():
+            yield key
+
+    @staticmethod
+    def _hashed(iterable: Iterable) -> Iterator[Tuple[int, Hashable]]:
+        """
+        Yields the (hash, key) pairs of an iterable, reusing the hashes
+        cached by a hash set.
+        """
+        if isinstance(iterable, SetOperations):
+            return iterable._hashed_keys()
+
+        return ((hash(key), key) for key in iterable)
+
+    def _as_set(self, iterable: Iterable) -> "SetOperations":
+        """
+        Returns the iterable itself if it is a hash set, or a new set of the
+        same type as this one holding its keys.
+        """
+        if isinstance(iterable, SetOperations):
+            return iterable
+
+        other = self._new_set(length_hint(iterable))
+        other.update(iterable)
+
+        return other
+
+    def contains_many(self, keys: Iterable) -> List[bool]:
+        """
+        Checks many keys at once.
+
+        The pure Python sets do not depend on NumPy, so the result is a list
+        of bools rather than the boolean ndarray of TypedHashSet.contains_many;
+        np.asarray turns it into one.
+
+        Args:
+            keys: The keys to be looked up.
+        Returns:
+            list[bool]: Whether each key is in the set, in the same order.
+        """
+        contains = self._contains_hashed
+
+        return [contains(key, key_hash) for key_hash, key in self._hashed(keys)]
+
+    def copy(self) -> "SetOperations":
+        """Returns a new set with the same keys and options."""
+        result = self._new_set(len(self))
+        result.update(self)
+
+        return result
+
+    def union(self, other: Iterable) -> "SetOperations":
+        """
+        Returns a new set with the keys of both operands.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        result = self._new_set(len(self) + length_hint(other))
+        result.update(self)
+        result.update(other)
+
+        return result
+
+    def intersection(self, other: Iterable) -> "SetOperations":
+        """
+        Returns a new set with the keys that are in both operands. The
+        smaller operand is iterated and looked up in the larger one.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        other = self._as_set(other)
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+
+        result = self._new_set(len(smaller))
+        contains = larger._contains_hashed
+
+        for key_hash, key in smaller._hashed_keys():
+            if contains(key, key_hash):
+                result._add_hashed(key, key_hash)
+
+        return result
+
+    def difference(self, other: Iterable) -> "SetOperations":
+        """
+        Returns a new set with the keys of this set that are not in other.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        other = self._as_set(other)
+
+        result = self._new_set(len(self))
+        contains = other._contains_hashed
+
+        for key_hash, key in self._hashed_keys():
+            if not contains(key, key_hash):
+                result._add_hashed(key, key_hash)
+
+        return result
+
+    def symmetric_difference(self, other: Iterable) -> "SetOperations":
+        """
+        Returns a new set with the keys that are in exactly one operand.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        other = self._as_set(other)
+
+        result = self._new_set(len(self) + len(other))
+
+        for first, second in ((self, other), (other, self)):
+            contains = second._contains_hashed
+
+            for key_hash, key in first._hashed_keys():
+                if not contains(key, key_hash):
+                    result._add_hashed(key, key_hash)
+
+        return result
+
+    def intersection_update(self, other: Iterable) -> None:
+        """
+        Keeps only the keys that are also in other.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        other = self._as_set(other)
+
+        if other is self:
+            return
+
+        contains = other._contains_hashed
+        missing = [
+            (key_hash, key)
+            for key_hash, key in self._hashed_keys()
+            if not contains(key, key_hash)
+        ]
+
+        for key_hash, key in missing:
+            self._discard_hashed(key, key_hash)
+
+    def difference_update(self, other: Iterable) -> None:
+        """
+        Removes the keys of other from this set.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        if other is self:
+            other = list(self._hashed_keys())
+        else:
+            other = self._hashed(other)
+
+        for key_hash, key in other:
+            self._discard_hashed(key, key_hash)
+
+    def symmetric_difference_update(self, other: Iterable) -> None:
+        """
+        Keeps the keys that are in exactly one of the two sets.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        other = self._as_set(other)
+
+        if other is self:
+            self.difference_update(self)
+            return
+
+        for key_hash, key in other._hashed_keys():
+            if self._contains_hashed(key, key_hash):
+                self._discard_hashed(key, key_hash)
+            else:
+                self._add_hashed(key, key_hash)
+
+    def issubset(self, other: Iterable) -> bool:
+        """
+        Tells whether every key of this set is in other.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        other = self._as_set(other)
+
+        if len(self) > len(other):
+            return False
+
+        contains = other._contains_hashed
+
+        return all(contains(key, key_hash) for key_hash, key in self._hashed_keys())
+
+    def issuperset(self, other: Iterable) -> bool:
+        """
+        Tells whether every key of other is in this set.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        return self._as_set(other).issubset(self)
+
+    def isdisjoint(self, other: Iterable) -> bool:
+        """
+        Tells whether the two sets have no key in common.
+
+        Args:
+            other: A hash set or any iterable of keys.
+        """
+        other = self._as_set(other)
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+        contains = larger._contains_hashed
+
+        return not any(
+            contains(key, key_hash) for key_hash, key in smaller._hashed_keys()
+        )
+
+    def __or__(self, other):
+        if not isinstance(other, SetOperations):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other):
+        if not isinstance(other, SetOperations):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        if not isinstance(other, SetOperations):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other):
+        if not isinstance(other, SetOperations):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    def __ior__(self, other):
+        if not isinstance(other, SetOperations):
+            return NotImplemented
+        self.update(other)
+        return self
+
+    def __iand__(self, other):
+        if not isinstance(other, SetOperations):
+            return NotImplemented
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other):
+        if not isinstance(other, SetOperations):
+            return NotImplemented
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other):
+        if not isinstance(other, SetOperations):
+            return NotImplemented
+        self.symmetric_difference_update(other)
+        return self
@@ -38,13 +38,40 @@ def print_linked_list(head: Node) -> None:
 
     list_string = "|"
 
+    for item in iterate(head):
+        list_string += " " + str(item) + " |"
+
+    print(list_string)
+
+
+def iterate(head: Node):
+    """
+    Yields the items of the singly linked list from first to last.
+
+    Args:
+        head (Node): The head node of the linked list.
+    """
     curr_node = head.next_node
-    while curr_node.item is not None:
-        list_string += " " + str(curr_node.item) + " |"
+
+    while curr_node is not None and curr_node.item is not None:
+        yield curr_node.item
 
         curr_node = curr_node.next_node
 
-    print(list_string)
+
+def iterate_reversed(head: Node):
+    """
+    Yields the items of the singly linked list from last to first.
+    The nodes only link forward, so the items are collected in one pass
+    and then yielded backwards.
+
+    Args:
+        head (Node): The head node of the linked list.
+    """
+    items = list(iterate(head))
+
+    for item in reversed(items):
+        yield item
 
 
 def append(head: Node, item):
@@ -1,4 +1,5 @@
-from .node import Node
+from typing import Any, Iterator
+from .node import Node, NIL_NODE
 
 
 class SingleLinkedList:
@@ -21,6 +22,8 @@ class SingleLinkedList:
         remove(index=None, item=None): Removes a node by index or by item value.
         search(item): Finds a node and its predecessor by item value.
         __getitem__(index): Returns the node at the specified index.
+        __iter__(): Yields the items from first to last.
+        __reversed__(): Yields the items from last to first.
         __str__(): Returns a string representation of the list.
         getNodeAndPrevious(index): Returns a node and its previous node by index.
 
@@ -37,8 +40,9 @@ class SingleLinkedList:
             last_node (Node | None): The last node in the list.
         """
         self.size = 0
-        self.first_node = Node(None)
-        self.last_node = Node(None)
+        self.first_node = NIL_NODE
+        self.last_node = NIL_NODE
+        self._version = 0
 
     def __str__(self) -> str:
         """
@@ -73,15 +77,53 @@ class SingleLinkedList:
 
         if self.size == 0:
             self.size += 1
+            self._version += 1
             self.first_node = new_node
             self.last_node = new_node
             return
 
         self.size += 1
+        self._version += 1
 
         self.last_node.next_node = new_node
         self.last_node = new_node
 
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yields the items of the singly linked list from first to last.
+
+        Raises:
+            RuntimeError: If the list is modified during the iteration.
+        """
+        version = self._version
+        curr_node = self.first_node
+
+        while curr_node is not NIL_NODE:
+            yield curr_node.item
+
+            if self._version != version:
+                raise RuntimeError("List changed during iteration.")
+
+            curr_node = curr_node.next_node
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Yields the items of the singly linked list from last to first.
+        The nodes only link forward, so the items are collected in one pass
+        and then yielded backwards.
+
+        Raises:
+            RuntimeError: If the list is modified during the iteration.
+        """
+        version = self._version
+        items = list(self)
+
+        for item in reversed(items):
+            yield item
+
+            if self._version != version:
+                raise RuntimeError("List changed during iteration.")
+
     def __getitem__(self, index):
         """
         Gets the node at the specified index in the singly linked list.
@@ -136,9 +178,8 @@ class SingleLinkedList:
         curr_node = self.first_node
         prev_node = None
 
-        while curr_node.item != item:
-            # prev_node, curr_node
-            curr_node = curr_node.next_node
+        while curr_node is not NIL_NODE and curr_node.item != item:
+            prev_node, curr_node = curr_node, curr_node.next_node
 
         return curr_node, prev_node
 
@@ -150,12 +191,21 @@ class SingleLinkedList:
             index (int): The index of the node to remove. Defaults to None.
             item (Any): The value of the node to remove. Defaults to None.
         """
-        self.size -= 1
-
         if index is not None:
             curr_node, prev_node = self.getNodeAndPrevious(index)
         elif item is not None:
             curr_node, prev_node = self.search(item)
+        else:
+            raise Exception("Either index or item must be given.")
+
+        if curr_node is NIL_NODE:
+            raise Exception("Item is not in the list.")
+
+        self.size -= 1
+        self._version += 1
+
+        if curr_node == self.last_node:
+            self.last_node = prev_node if prev_node is not None else NIL_NODE
 
         if curr_node == self.first_node:
             self.first_node = curr_node.next_node
@@ -182,22 +232,29 @@ class SingleLinkedList:
 
         new_node = Node(elem)
         self.size += 1
+        self._version += 1
 
         if pos == 0:
             new_node.next_node = self.first_node
             self.first_node = new_node
+
+            if self.size == 1:
+                self.last_node = new_node
             return
 
         aux_node = self.first_node
         counter = 1
 
-        while aux_node.next_node is not None and counter < pos - 1:
+        while aux_node.next_node is not NIL_NODE and counter < pos - 1:
             aux_node = aux_node.next_node
             counter += 1
 
         new_node.next_node = aux_node.next_node
         aux_node.next_node = new_node
 
+        if aux_node == self.last_node:
+            self.last_node = new_node
+
 
 if __name__ == "__main__":
     single_linked_list = SingleLinkedList()
@@ -0,0 +1,358 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, chain
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+class SortedList:
+    """
+    Sorted collection kept as a list of sorted sublists, in the spirit of the
+    sortedcontainers package.
+
+    Each sublist holds between load / 2 and 2 * load values, and the largest
+    value of every sublist is kept in a separate list of maxes. A lookup is a
+    bisect on the maxes followed by a bisect in one sublist, two calls into C
+    instead of one Python comparison per level of a binary tree, and an
+    insertion or removal shifts at most 2 * load references. There is one
+    Python object per sublist instead of one per value.
+
+    Positions are answered from the number of values before each sublist,
+    which is rebuilt in one pass the first time it is needed after a change,
+    so read-heavy workloads pay for it once.
+
+    The public methods mirror BinaryTree: insert, remove, search (returning
+    the position of the value), __contains__, inorder, iteration, irange,
+    rank, select, count_range, median and from_sorted. Duplicates are kept.
+
+    Attributes:
+        size (int): The number of values in the list.
+        load (int): The target length of the sublists.
+    """
+    __slots__ = ("size", "load", "_lists", "_maxes", "_offsets")
+
+    def __init__(self, iterable: Optional[Iterable] = None, load: int = 1000) -> None:
+        """
+        Initializes the list with the values of an iterable, in any order.
+
+        Args:
+            iterable: The initial values, or None for an empty list.
+            load (int): The target length of the sublists. Larger loads make
+                lookups cheaper and insertions and removals more expensive.
+        Raises:
+            Exception: If load is smaller than 4.
+        """
+        if load < 4:
+            raise Exception("Load must be at least 4.")
+
+        self.load = load
+        self._set(sorted(iterable) if iterable is not None else [])
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable, load: int = 1000) -> "SortedList":
+        """
+        Builds a list from values in ascending order, in linear time.
+
+        Raises:
+            Exception: If the values are not in ascending order.
+        """
+        values = list(iterable)
+
+        if any(previous > value for previous, value in zip(values, values[1:])):
+            raise Exception("Values must be sorted.")
+
+        sorted_list = cls(load=load)
+        sorted_list._set(values)
+
+        return sorted_list
+
+    def _set(self, values: list) -> None:
+        """
+        Replaces the contents with sorted values, cut into sublists of load values.
+        """
+        load = self.load
+
+        self._lists: List[list] = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes: list = [sublist[-1] for sublist in self._lists]
+        self._offsets: Optional[List[int]] = None
+        self.size = len(values)
+
+    def _index(self) -> List[int]:
+        """
+        Returns the number of values before each sublist, rebuilding it if
+        the list changed since it was last computed.
+        """
+        if self._offsets is None:
+            self._offsets = [0]
+            self._offsets.extend(accumulate(len(sublist) for sublist in self._lists))
+
+        return self._offsets
+
+    def _split(self, i: int) -> None:
+        """
+        Splits sublist i in two halves.
+        """
+        sublist = self._lists[i]
+        half = len(sublist) // 2
+
+        self._lists[i:i + 1] = [sublist[:half], sublist[half:]]
+        self._maxes[i:i + 1] = [sublist[half - 1], sublist[-1]]
+
+    def _merge(self, i: int) -> None:
+        """
+        Merges sublist i with a neighbour, splitting the result again if it
+        is too long.
+        """
+        if i == len(self._lists) - 1:
+            i -= 1
+
+        merged = self._lists[i] + self._lists[i + 1]
+
+        self._lists[i:i + 2] = [merged]
+        self._maxes[i:i + 2] = [merged[-1]]
+
+        if len(merged) > 2 * self.load:
+            self._split(i)
+
+    def insert(self, value: Any) -> None:
+        """
+        Inserts a value, after the values equal to it.
+
+        Args:
+            value: The value to be inserted.
+        """
+        lists = self._lists
+        maxes = self._maxes
+
+        if not maxes:
+            lists.append([value])
+            maxes.append(value)
+        else:
+            i = bisect_right(maxes, value)
+
+            if i == len(maxes):
+                i -= 1
+                lists[i].append(value)
+                maxes[i] = value
+            else:
+                insort(lists[i], value)
+
+            if len(lists[i]) > 2 * self.load:
+                self._split(i)
+
+        self.size += 1
+        self._offsets = None
+
+    def _locate(self, value: Any) -> Optional[Tuple[int, int]]:
+        """
+        Finds the first occurrence of a value.
+
+        Returns: The sublist and the position in it, or None if the value is
+        not in the list.
+        """
+        i = bisect_left(self._maxes, value)
+
+        if i == len(self._maxes):
+            return None
+
+        sublist = self._lists[i]
+        j = bisect_left(sublist, value)
+
+        if sublist[j] != value:
+            return None
+
+        return i, j
+
+    def remove(self, value: Any) -> None:
+        """
+        Removes one occurrence of a value.
+
+        Args:
+            value: The value to be removed.
+        Raises:
+            Exception: If the value is not in the list.
+        """
+        location = self._locate(value)
+
+        if location is None:
+            raise Exception("Value doesn't exist in the list.")
+
+        i, j = location
+        sublist = self._lists[i]
+        del sublist[j]
+
+        if not sublist:
+            del self._lists[i]
+            del self._maxes[i]
+        else:
+            self._maxes[i] = sublist[-1]
+
+            if len(sublist) < self.load // 2 and len(self._lists) > 1:
+                self._merge(i)
+
+        self.size -= 1
+        self._offsets = None
+
+    def search(self, value: Any) -> Optional[int]:
+        """
+        Searches for a value.
+
+        Args:
+            value: The value to be searched.
+        Returns: The position of the first occurrence of the value in
+        ascending order, or None if the value is not found.
+        """
+        location = self._locate(value)
+
+        if location is None:
+            return None
+
+        i, j = location
+
+        return self._index()[i] + j
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Checks if a value is in the list.
+        """
+        return self._locate(value) is not None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values in the list.
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yields the values in ascending order.
+        """
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Yields the values in descending order.
+        """
+        for sublist in reversed(self._lists):
+            yield from reversed(sublist)
+
+    def inorder(self) -> list:
+        """
+        Returns the values in ascending order.
+        """
+        return list(self)
+
+    def _count_below(self, value: Any, inclusive: bool) -> int:
+        """
+        Counts the values smaller than value, or smaller than or equal to it
+        if inclusive is True, with one bisect on the maxes and one in a sublist.
+        """
+        bisect = bisect_right if inclusive else bisect_left
+        i = bisect(self._maxes, value)
+
+        if i == len(self._maxes):
+            return self.size
+
+        return self._index()[i] + bisect(self._lists[i], value)
+
+    def rank(self, value: Any) -> int:
+        """
+        Counts the values that are smaller than value.
+        """
+        return self._count_below(value, False)
+
+    def select(self, k: int) -> Any:
+        """
+        Returns the k-th smallest value, starting at 0. Negative indexes
+        count from the largest value.
+
+        Raises:
+            Exception: If the index is out of range.
+        """
+        if k < 0:
+            k += self.size
+
+        if k < 0 or k >= self.size:
+            raise Exception("Index out of range.")
+
+        offsets = self._index()
+        i = bisect_right(offsets, k) - 1
+
+        return self._lists[i][k - offsets[i]]
+
+    def count_range(self, lo: Any, hi: Any, inclusive: Tuple[bool, bool] = (True, True)) -> int:
+        """
+        Counts the values between lo and hi.
+
+        Args:
+            lo: The lower bound.
+            hi: The upper bound.
+            inclusive (tuple[bool, bool]): Whether values equal to lo and to
+                hi are counted.
+        """
+        include_lo, include_hi = inclusive
+        count = self._count_below(hi, include_hi) - self._count_below(lo, not include_lo)
+
+        return max(count, 0)
+
+    def irange(self, lo: Any = None, hi: Any = None,
+               inclusive: Tuple[bool, bool] = (True, True)) -> Iterator[Any]:
+        """
+        Yields, in ascending order, the values between lo and hi. Both ends
+        are found by bisection and the values are read sublist by sublist.
+
+        Args:
+            lo: The lower bound, or None for no lower bound.
+            hi: The upper bound, or None for no upper bound.
+            inclusive (tuple[bool, bool]): Whether values equal to lo and to
+                hi are included.
+        """
+        include_lo, include_hi = inclusive
+        start = 0 if lo is None else self._count_below(lo, not include_lo)
+        stop = self.size if hi is None else self._count_below(hi, include_hi)
+
+        if start >= stop:
+            return
+
+        offsets = self._index()
+        i = bisect_right(offsets, start) - 1
+
+        while start < stop:
+            sublist = self._lists[i]
+            begin = start - offsets[i]
+            end = min(len(sublist), stop - offsets[i])
+
+            yield from sublist[begin:end]
+
+            start += end - begin
+            i += 1
+
+    def median(self) -> Any:
+        """
+        Returns the median value, the lower of the two middle values when the
+        list has an even number of values.
+
+        Raises:
+            Exception: If the list is empty.
+        """
+        if self.size == 0:
+            raise Exception("The list is empty.")
+
+        return self.select((self.size - 1) // 2)
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the list, e.g., "[1, 2, 3]".
+        """
+        return "[" + ", ".join(str(value) for value in self) + "]"
+
+
+if __name__ == "__main__":
+    from random import random
+
+    sorted_list = SortedList(load=8)
+
+    for i in range(50):
+        sorted_list.insert(round(random(), 2))
+
+    print(sorted_list)
+    print(list(sorted_list.irange(0.25, 0.5)))
+    print("Mediana:", sorted_list.median())
@@ -32,9 +32,16 @@ class Stack(DoublyLinkedList):
 
         Returns:
             Node: The node that was removed from the stack.
+
+        Raises:
+            Exception: If the stack is empty.
         """
+        if self.size == 0:
+            raise Exception("Stack is empty.")
+
         last_node = self.last_node
         self.size -= 1
+        self._version += 1
 
         if last_node == self.first_node:
             second_node = self.first_node.next_node
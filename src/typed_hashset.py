@@ -0,0 +1,364 @@
+import warnings
+from typing import Iterator
+
+import numpy as np
+
+EMPTY = 0
+FULL = 1
+DELETED = 2
+
+
+def mix(bits: np.ndarray) -> np.ndarray:
+    """
+    Vectorized 64-bit integer hash (the splitmix64 finalizer).
+
+    Args:
+        bits (np.ndarray): The keys as an array of uint64.
+    Returns:
+        np.ndarray: The hashes, as an array of uint64.
+    """
+    hashes = bits ^ (bits >> np.uint64(30))
+    hashes *= np.uint64(0xBF58476D1CE4E5B9)
+    hashes ^= hashes >> np.uint64(27)
+    hashes *= np.uint64(0x94D049BB133111EB)
+    hashes ^= hashes >> np.uint64(31)
+
+    return hashes
+
+
+def first_occurrences(values: np.ndarray) -> np.ndarray:
+    """
+    Returns the index of the first occurrence of each distinct value, using
+    a stable sort.
+    """
+    order = np.argsort(values, kind="stable")
+    ordered = values[order]
+    starts = np.empty(ordered.size, dtype=bool)
+    starts[:1] = True
+    np.not_equal(ordered[1:], ordered[:-1], out=starts[1:])
+
+    return order[starts]
+
+
+class TypedHashSet:
+    """
+    HashSet of int64 or float64 keys stored in NumPy arrays.
+
+    Keys are kept by their 64-bit pattern in a flat uint64 array, next to a
+    uint8 array telling whether each slot is empty, full or deleted, so the
+    table costs about 9 bytes per slot and holds no Python objects. Slots
+    are found by linear probing from a vectorized integer hash, and the
+    add_many, remove_many and contains_many methods process a whole ndarray
+    per probing round instead of one key per Python call.
+
+    Float keys are stored by their bit pattern, with -0.0 folded into 0.0.
+    NaN can not be added, since it is not equal to itself.
+
+    Attributes:
+        dtype (np.dtype): The type of the keys, int64 or float64.
+        slots (np.ndarray): The bit pattern of the key in each slot.
+        states (np.ndarray): EMPTY, FULL or DELETED for each slot.
+        capacity (int): The number of slots, always a power of two.
+        size (int): The number of elements in the HashSet.
+        tombstones (int): The number of DELETED slots.
+    """
+
+    def __init__(self, capacity=16, dtype=np.int64, load_factor_threshold=0.5):
+        """
+        Initializes an empty HashSet with room for at least capacity keys.
+
+        Args:
+            capacity (int): The number of keys the HashSet should hold before
+                growing, and the smallest size it shrinks back to.
+            dtype: np.int64 or np.float64.
+            load_factor_threshold (float): The fraction of used slots, full
+                or deleted, above which the table is rebuilt. It must be
+                between 0 and 1, both excluded, so that probing always
+                reaches an empty slot.
+        Raises:
+            Exception: If dtype is not supported, or if load_factor_threshold
+            is out of range.
+        """
+        self.dtype = np.dtype(dtype)
+
+        if self.dtype not in (np.dtype(np.int64), np.dtype(np.float64)):
+            raise Exception("dtype must be int64 or float64.")
+
+        if not 0 < load_factor_threshold < 1:
+            raise Exception("load_factor_threshold must be between 0 and 1.")
+
+        self.load_factor_threshold = load_factor_threshold
+        self.initial_capacity = self._capacity_for(capacity)
+        self._allocate(self.initial_capacity)
+
+    def _capacity_for(self, count: int) -> int:
+        """
+        Returns the smallest power of two that holds count keys under the
+        load factor threshold.
+        """
+        capacity = 16
+        while count > capacity * self.load_factor_threshold:
+            capacity *= 2
+
+        return capacity
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replaces the table with an empty one of the given capacity.
+        """
+        self.slots = np.zeros(capacity, dtype=np.uint64)
+        self.states = np.zeros(capacity, dtype=np.uint8)
+        self.capacity = capacity
+        self.size = 0
+        self.tombstones = 0
+
+    def _to_bits(self, keys) -> np.ndarray:
+        """
+        Converts keys to a flat array of their uint64 bit patterns.
+
+        An empty input gives an empty array whatever its dtype, since
+        np.asarray([]) is float64. Unsigned keys that do not fit in int64
+        are rejected instead of wrapping around to negative keys.
+
+        Raises:
+            Exception: If the keys can not be safely converted to dtype.
+        """
+        keys = np.asarray(keys)
+
+        if not keys.size:
+            return np.empty(0, dtype=np.uint64)
+
+        if not np.can_cast(keys.dtype, self.dtype, casting="same_kind"):
+            raise Exception("Keys must be of type " + str(self.dtype) + ".")
+
+        if (
+            keys.dtype.kind == "u"
+            and not np.can_cast(keys.dtype, self.dtype, casting="safe")
+            and keys.max() > np.iinfo(self.dtype).max
+        ):
+            raise Exception("Keys must fit in " + str(self.dtype) + ".")
+
+        keys = np.ascontiguousarray(keys, dtype=self.dtype).ravel()
+
+        if self.dtype.kind == "f":
+            keys = keys + 0.0
+
+        return keys.view(np.uint64)
+
+    def _probe_start(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Returns the first slot probed for each key.
+        """
+        return (mix(bits) & np.uint64(self.capacity - 1)).astype(np.intp)
+
+    def _locate(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Finds the slot of each key, probing all of them together.
+
+        Returns:
+            np.ndarray: The slot holding each key, or -1 if it is missing.
+        """
+        result = np.full(bits.size, -1, dtype=np.intp)
+        positions = np.arange(bits.size)
+        probe = self._probe_start(bits)
+        mask = self.capacity - 1
+
+        while positions.size:
+            states = self.states[probe]
+            found = (states == FULL) & (self.slots[probe] == bits[positions])
+            result[positions[found]] = probe[found]
+
+            keep = ~found & (states != EMPTY)
+            positions = positions[keep]
+            probe = (probe[keep] + 1) & mask
+
+        return result
+
+    def _insert_new(self, bits: np.ndarray) -> None:
+        """
+        Inserts distinct keys that are not in the HashSet yet, assuming the
+        table has room for them. When several keys reach the same free slot
+        in a round, the first one takes it and the others keep probing.
+        """
+        mask = self.capacity - 1
+        probe = self._probe_start(bits)
+        self.size += bits.size
+
+        while bits.size:
+            free = np.flatnonzero(self.states[probe] != FULL)
+            winners = free[first_occurrences(probe[free])]
+            slots = probe[winners]
+
+            self.tombstones -= int(np.count_nonzero(self.states[slots] == DELETED))
+            self.slots[slots] = bits[winners]
+            self.states[slots] = FULL
+
+            losers = np.ones(bits.size, dtype=bool)
+            losers[winners] = False
+            bits = bits[losers]
+            probe = (probe[losers] + 1) & mask
+
+    def _rebuild(self, capacity: int) -> None:
+        """
+        Moves every key into a new table of the given capacity, dropping the
+        tombstones.
+        """
+        live = self.slots[self.states == FULL]
+
+        self._allocate(capacity)
+        self._insert_new(live)
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table, with a single rebuild, so that it holds count keys
+        without growing again.
+
+        Args:
+            count (int): The number of keys the HashSet should hold.
+        """
+        capacity = self._capacity_for(count)
+
+        if capacity > self.capacity:
+            self._rebuild(capacity)
+
+    def add_many(self, keys) -> None:
+        """
+        Adds every key of an array to the HashSet.
+
+        Args:
+            keys: An ndarray, or anything np.asarray accepts, of keys.
+        Raises:
+            Exception: If a float key is NaN.
+        """
+        bits = self._to_bits(keys)
+        bits = bits[first_occurrences(bits)]
+
+        if self.dtype.kind == "f" and np.isnan(bits.view(self.dtype)).any():
+            raise Exception("Key can not be NaN.")
+
+        bits = bits[self._locate(bits) < 0]
+
+        if not bits.size:
+            return
+
+        if self.size + self.tombstones + bits.size > (
+            self.capacity * self.load_factor_threshold
+        ):
+            self._rebuild(self._capacity_for(self.size + bits.size))
+
+        self._insert_new(bits)
+
+    def remove_many(self, keys) -> None:
+        """
+        Removes every key of an array from the HashSet. The table is
+        compacted once tombstones fill a quarter of it.
+
+        Args:
+            keys: An ndarray, or anything np.asarray accepts, of keys.
+        Raises:
+            Exception: If a key is not in the HashSet. No key is removed then.
+        """
+        bits = self._to_bits(keys)
+        slots = self._locate(bits[first_occurrences(bits)])
+
+        if (slots < 0).any():
+            raise Exception("Key is not in the set.")
+
+        self.states[slots] = DELETED
+        self.size -= slots.size
+        self.tombstones += slots.size
+
+        if self.tombstones * 4 > self.capacity:
+            self._rebuild(max(self._capacity_for(self.size), self.initial_capacity))
+
+    def contains_many(self, keys) -> np.ndarray:
+        """
+        Checks many keys at once. Unlike add_many and remove_many, it never
+        rejects keys of another type: keys with no exact value in dtype,
+        such as 1.5 or "a" for an int64 set, are simply not in the HashSet.
+
+        Args:
+            keys: An ndarray, or anything np.asarray accepts, of keys.
+        Returns:
+            np.ndarray: A boolean array telling whether each key is in the
+            HashSet.
+        """
+        keys = np.asarray(keys).ravel()
+
+        if keys.dtype.kind != "u" and np.can_cast(keys.dtype, self.dtype, casting="same_kind"):
+            return self._locate(self._to_bits(keys)) >= 0
+
+        found = np.zeros(keys.size, dtype=bool)
+
+        try:
+            with warnings.catch_warnings(), np.errstate(all="ignore"):
+                warnings.simplefilter("ignore")
+                converted = keys.astype(self.dtype)
+                exact = np.asarray(converted == keys, dtype=bool)
+        except (TypeError, ValueError):
+            return found
+
+        if exact.shape == found.shape and exact.any():
+            found[exact] = self._locate(self._to_bits(converted[exact])) >= 0
+
+        return found
+
+    def add(self, key) -> None:
+        """
+        Adds a key to the HashSet.
+        """
+        self.add_many([key])
+
+    def remove(self, key) -> None:
+        """
+        Removes a key from the HashSet.
+
+        Raises:
+            Exception: If the key is not in the HashSet.
+        """
+        self.remove_many([key])
+
+    def __contains__(self, key) -> bool:
+        """if key in conjunto. Keys that are not a single number are never in it."""
+        try:
+            keys = np.asarray([key])
+        except (TypeError, ValueError):
+            return False
+
+        if keys.shape != (1,):
+            return False
+
+        return bool(self.contains_many(keys)[0])
+
+    def __len__(self) -> int:
+        """Returns the number of elements in the HashSet."""
+        return self.size
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns a new array with the keys of the HashSet, in table order.
+        """
+        return self.slots[self.states == FULL].view(self.dtype)
+
+    def __iter__(self) -> Iterator:
+        """Yields the keys of the HashSet as Python numbers."""
+        return iter(self.to_array().tolist())
+
+    def __str__(self) -> str:
+        """Returns a string representation of the HashSet."""
+        return "{" + ", ".join(str(key) for key in self) + "}"
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng()
+
+    hashset = TypedHashSet()
+    ids = rng.integers(0, 1000, size=50)
+
+    hashset.add_many(ids)
+    print(hashset)
+    print(hashset.contains_many(np.arange(10)))
+
+    floats = TypedHashSet(dtype=np.float64)
+    floats.add_many(np.round(rng.random(50), 2))
+    print(floats)
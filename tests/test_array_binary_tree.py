@@ -0,0 +1,183 @@
+import pytest
+from random import Random
+from ..src.array_binary_tree import ArrayBinaryTree
+
+
+@pytest.fixture
+def binary_tree():
+    return ArrayBinaryTree()
+
+
+def check_avl(tree, node):
+    if not node:
+        return 0
+
+    for child in (tree.lefts[node], tree.rights[node]):
+        if child:
+            assert tree.parents[child] == node
+
+    left = check_avl(tree, tree.lefts[node])
+    right = check_avl(tree, tree.rights[node])
+
+    assert abs(left - right) <= 1
+    assert tree.heights[node] == 1 + max(left, right)
+    assert tree.sizes[node] == 1 + tree.sizes[tree.lefts[node]] + tree.sizes[tree.rights[node]]
+
+    return left + 1 if left > right else right + 1
+
+
+def test_insert_and_search(binary_tree):
+    for value in (5, 1, -1, 2, 10, 7, 6):
+        binary_tree.insert(value)
+
+    assert len(binary_tree) == 7
+    assert binary_tree.inorder() == [-1, 1, 2, 5, 6, 7, 10]
+    assert binary_tree.values[binary_tree.search(7)] == 7
+    assert binary_tree.search(3) is None
+    assert 6 in binary_tree and 8 not in binary_tree
+
+
+def test_remove(binary_tree):
+    with pytest.raises(Exception):
+        binary_tree.remove(1)
+
+    for value in (5, 1, -1, 2, 10, 7, 6):
+        binary_tree.insert(value)
+
+    binary_tree.remove(-1)
+    binary_tree.remove(1)
+    binary_tree.remove(5)
+
+    assert binary_tree.values[binary_tree.root] == 6
+    assert binary_tree.inorder() == [2, 6, 7, 10]
+    assert len(binary_tree) == 4
+
+
+def test_reuses_free_slots(binary_tree):
+    for i in range(10):
+        binary_tree.insert(i)
+
+    slots = len(binary_tree.values)
+
+    for i in range(100):
+        binary_tree.remove(i)
+        binary_tree.insert(i + 10)
+
+    assert len(binary_tree.values) == slots
+    assert list(binary_tree) == list(range(100, 110))
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_self_balancing(typecode):
+    rng = Random(5)
+    values = [rng.randrange(200) for _ in range(500)]
+    tree = ArrayBinaryTree(self_balancing=True, typecode=typecode)
+
+    for i in range(500):
+        tree.insert(i)
+
+    assert check_avl(tree, tree.root) <= 11
+
+    for value in values:
+        tree.insert(value)
+
+    rng.shuffle(values)
+
+    for value in values[:300] + list(range(500)):
+        tree.remove(value)
+        check_avl(tree, tree.root)
+
+    assert tree.inorder() == sorted(values[300:])
+
+
+def test_ranges_and_order_statistics():
+    rng = Random(9)
+    values = sorted(rng.randrange(50) for _ in range(200))
+    tree = ArrayBinaryTree.from_sorted(values, typecode="q")
+
+    assert check_avl(tree, tree.root) == 8
+    assert list(tree) == values
+    assert list(reversed(tree)) == values[::-1]
+    assert list(tree.irange(10, 20)) == [v for v in values if 10 <= v <= 20]
+    assert list(tree.irange(10, 20, inclusive=(False, False))) == [
+        v for v in values if 10 < v < 20
+    ]
+    assert [tree.select(k) for k in range(200)] == values
+    assert tree.median() == values[99]
+
+    for value in (-1, 10, 25, 60):
+        assert tree.rank(value) == sum(v < value for v in values)
+        assert tree.count_range(10, value) == sum(10 <= v <= value for v in values)
+
+    with pytest.raises(Exception):
+        ArrayBinaryTree.from_sorted([2, 1])
+
+
+def test_rebalance(binary_tree):
+    for i in range(100):
+        binary_tree.insert(i)
+
+    for i in range(0, 100, 2):
+        binary_tree.remove(i)
+
+    binary_tree.rebalance()
+
+    assert check_avl(binary_tree, binary_tree.root) == 6
+    assert list(binary_tree.values[1:]) == list(range(1, 100, 2))
+    assert binary_tree.free_slot == 0
+    assert binary_tree._print(binary_tree.root)["value"] == binary_tree.select(25)
+
+
+def test_deep_plain_tree(binary_tree):
+    for i in range(300):
+        binary_tree.insert(i)
+
+    assert len(binary_tree) == 300
+    assert binary_tree.sizes[binary_tree.root] == 300
+    assert 299 in binary_tree and 300 not in binary_tree
+    assert list(binary_tree) == list(range(300))
+
+
+def test_plain_tree_order_statistics(binary_tree):
+    rng = Random(5)
+    values = []
+
+    for _ in range(2000):
+        if values and rng.random() < 0.4:
+            value = rng.choice(values)
+            values.remove(value)
+            binary_tree.remove(value)
+        else:
+            value = rng.randrange(300)
+            values.append(value)
+            binary_tree.insert(value)
+
+    values.sort()
+
+    stack = [binary_tree.root]
+    while stack:
+        node = stack.pop()
+        left, right = binary_tree.lefts[node], binary_tree.rights[node]
+        assert binary_tree.sizes[node] == 1 + binary_tree.sizes[left] + binary_tree.sizes[right]
+        stack.extend(child for child in (left, right) if child)
+
+    assert binary_tree.sizes[binary_tree.root] == len(values)
+    assert list(binary_tree) == values
+    assert [binary_tree.select(k) for k in range(len(values))] == values
+
+    for value in range(-1, 302, 7):
+        assert binary_tree.rank(value) == sum(v < value for v in values)
+
+
+def test_print(binary_tree, capsys):
+    for value in (2, 1, 3):
+        binary_tree.insert(value)
+
+    binary_tree.print()
+    assert capsys.readouterr().out == "2\n  left: 1\n  right: 3\n"
+
+    for value in range(4, 1000):
+        binary_tree.insert(value)
+
+    binary_tree.print()
+    assert len(capsys.readouterr().out.splitlines()) == 999
@@ -0,0 +1,115 @@
+import pytest
+from ..src.array_doubly_linked_list import ArrayDoublyLinkedList
+from ..src.node import NIL_NODE
+
+
+@pytest.fixture
+def linked_list():
+    return ArrayDoublyLinkedList()
+
+
+def test_append(linked_list):
+    assert str(linked_list) == "| |"
+
+    linked_list.append(1)
+    linked_list.append(2)
+    linked_list.append(3)
+
+    assert str(linked_list) == "| 1 | 2 | 3 |"
+    assert len(linked_list) == 3
+    assert linked_list[0].item == 1
+    assert linked_list[2].item == 3
+    assert linked_list[3] is NIL_NODE
+
+
+def test_insert(linked_list):
+    linked_list.insert(2, 0)
+    linked_list.insert(0, 0)
+    linked_list.insert(1, 1)
+    linked_list.insert(3, 3)
+
+    assert str(linked_list) == "| 0 | 1 | 2 | 3 |"
+
+    with pytest.raises(Exception):
+        linked_list.insert(5, 5)
+
+
+def test_remove(linked_list):
+    with pytest.raises(Exception):
+        linked_list.remove(index=0)
+
+    for i in range(5):
+        linked_list.append(i)
+
+    linked_list.remove(index=0)
+    linked_list.remove(item=3)
+    linked_list.remove(index=2)
+
+    assert str(linked_list) == "| 1 | 2 |"
+    assert len(linked_list) == 2
+
+    with pytest.raises(Exception):
+        linked_list.remove(item=10)
+
+
+def test_search(linked_list):
+    linked_list.append(10)
+    linked_list.append(0)
+
+    assert linked_list.search(10).item == 10
+    assert linked_list.search(10) == linked_list[0]
+    assert linked_list.search(0) == linked_list[1]
+    assert linked_list.search(5) is NIL_NODE
+
+
+def test_nodes_match_doubly_linked_list(linked_list):
+    for i in range(3):
+        linked_list.append(i)
+
+    node = linked_list[1]
+
+    assert node.prev_node.item == 0
+    assert node.next_node.item == 2
+    assert node.next_node.next_node is NIL_NODE
+    assert linked_list[0].prev_node is NIL_NODE
+    assert str(node) == "1"
+
+    node.item = 10
+
+    assert str(linked_list) == "| 0 | 10 | 2 |"
+
+
+def test_reuses_free_slots(linked_list):
+    for i in range(4):
+        linked_list.append(i)
+
+    slots = len(linked_list.items)
+
+    for i in range(100):
+        linked_list.remove(index=0)
+        linked_list.append(i)
+
+    assert len(linked_list.items) == slots
+    assert str(linked_list) == "| 96 | 97 | 98 | 99 |"
+
+
+def test_iter(linked_list):
+    for i in range(5):
+        linked_list.append(i)
+
+    assert list(linked_list) == [0, 1, 2, 3, 4]
+    assert list(reversed(linked_list)) == [4, 3, 2, 1, 0]
+
+    with pytest.raises(RuntimeError):
+        for item in linked_list:
+            linked_list.remove(item=item)
+
+
+def test_getitem_from_both_ends(linked_list):
+    for i in range(7):
+        linked_list.append(i)
+
+    assert [linked_list[i].item for i in range(7)] == list(range(7))
+    assert linked_list[-2].item == 5
+    assert list(linked_list[1:6:2]) == [1, 3, 5]
+    assert list(linked_list[::-2]) == [6, 4, 2, 0]
@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from ..src.async_queue import AsyncQueue, AsyncStack
+
+
+def test_fifo_and_lifo():
+    async def main():
+        queue = AsyncQueue()
+        stack = AsyncStack()
+
+        for i in range(3):
+            await queue.put(i)
+            await stack.put(i)
+
+        return [await queue.get() for _ in range(3)], [await stack.get() for _ in range(3)]
+
+    assert asyncio.run(main()) == ([0, 1, 2], [2, 1, 0])
+
+
+def test_nowait():
+    queue = AsyncQueue(maxsize=1)
+
+    with pytest.raises(Exception):
+        queue.get_nowait()
+
+    queue.put_nowait(1)
+
+    with pytest.raises(Exception):
+        queue.put_nowait(2)
+
+    assert queue.full()
+    assert str(queue) == "| 1 |"
+    assert queue.get_nowait() == 1
+
+    with pytest.raises(Exception):
+        queue.task_done()
+        queue.task_done()
+
+
+def test_backpressure_and_join():
+    async def main():
+        queue = AsyncQueue(maxsize=2)
+        results = []
+
+        async def produce(start):
+            for i in range(start, start + 50):
+                await queue.put(i)
+                assert len(queue) <= 2
+
+        async def consume():
+            while True:
+                results.append(await queue.get())
+                await asyncio.sleep(0)
+                queue.task_done()
+
+        consumers = [asyncio.create_task(consume()) for _ in range(3)]
+        await asyncio.gather(*(produce(i * 50) for i in range(4)))
+        await queue.join()
+
+        for task in consumers:
+            task.cancel()
+
+        return results
+
+    assert sorted(asyncio.run(main())) == list(range(200))
+
+
+def test_cancelled_getter_passes_the_item_on():
+    async def main():
+        queue = AsyncQueue()
+        first = asyncio.create_task(queue.get())
+        second = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+
+        queue.put_nowait("item")
+        first.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        return await asyncio.wait_for(second, 1)
+
+    assert asyncio.run(main()) == "item"
+
+
+def test_cancelled_putter_leaves_the_line():
+    async def main():
+        stack = AsyncStack(maxsize=1)
+        stack.put_nowait(1)
+
+        putter = asyncio.create_task(stack.put(2))
+        await asyncio.sleep(0)
+        putter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await putter
+
+        assert not stack._putters
+        assert stack.get_nowait() == 1
+
+        await stack.put(3)
+
+        return len(stack)
+
+    assert asyncio.run(main()) == 1
@@ -41,10 +41,10 @@ def test_size(binary_tree):
 
     assert len(binary_tree) == 2
 
-    # binary_tree.remove(1)
-    # binary_tree.remove(2)
+    binary_tree.remove(1)
+    binary_tree.remove(2)
 
-    # assert len(binary_tree) == 0
+    assert len(binary_tree) == 0
 
 
 def test_contains(binary_tree):
@@ -55,9 +55,9 @@ def test_contains(binary_tree):
     assert 2 in binary_tree
     assert 3 not in binary_tree
 
-    # binary_tree.remove(2)
+    binary_tree.remove(2)
 
-    # assert 2 not in binary_tree
+    assert 2 not in binary_tree
 
 
 def test_inorder(binary_tree):
@@ -147,3 +147,313 @@ def test_remove(binary_tree):
 #     binary_tree.add(3)
 
 #     assert str(binary_tree) == "{1, 2, 3}"
+
+
+def check_avl(node):
+    if node is None:
+        return 0
+
+    for child in (node.left, node.right):
+        if child is not None:
+            assert child.parent is node
+
+    left = check_avl(node.left)
+    right = check_avl(node.right)
+
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    assert node.size == node.count + (node.left.size if node.left else 0) + (
+        node.right.size if node.right else 0
+    )
+
+    return node.height
+
+
+def test_self_balancing_sorted_inserts():
+    tree = BinaryTree(self_balancing=True)
+
+    for i in range(1000):
+        tree.insert(i)
+
+    assert tree.root.parent is None
+    assert check_avl(tree.root) <= 14
+    assert tree.inorder() == list(range(1000))
+    assert 999 in tree and 1000 not in tree
+
+
+def test_self_balancing_remove():
+    from random import Random
+
+    rng = Random(7)
+    values = [rng.randrange(200) for _ in range(500)]
+    tree = BinaryTree(self_balancing=True)
+
+    for value in values:
+        tree.insert(value)
+
+    rng.shuffle(values)
+
+    for value in values[:400]:
+        tree.remove(value)
+        check_avl(tree.root)
+
+    assert tree.inorder() == sorted(values[400:])
+
+    for value in values[400:]:
+        tree.remove(value)
+
+    assert tree.root is None
+
+
+def test_deep_tree(binary_tree):
+    for i in range(3000):
+        binary_tree.insert(i)
+
+    assert 2999 in binary_tree
+    assert binary_tree.search(-1) is None
+    assert binary_tree.inorder() == list(range(3000))
+    assert binary_tree._print(binary_tree.root)["right"]["value"] == 1
+
+
+def test_print(binary_tree):
+    for value in (2, 1, 3):
+        binary_tree.insert(value)
+
+    assert binary_tree._print(binary_tree.root) == {
+        "value": 2,
+        "left": {"value": 1, "left": None, "right": None},
+        "right": {"value": 3, "left": None, "right": None},
+    }
+
+
+def test_print_deep_tree(binary_tree, capsys):
+    binary_tree.print()
+    assert capsys.readouterr().out == "None\n"
+
+    for value in range(1000):
+        binary_tree.insert(value)
+
+    binary_tree.print()
+    lines = capsys.readouterr().out.splitlines()
+
+    assert len(lines) == 1000
+    assert lines[:3] == ["0", "  right: 1", "    right: 2"]
+    assert lines[-1] == "  " * 999 + "right: 999"
+
+
+def test_iter(binary_tree):
+    for value in (5, 1, -1, 2, 10, 7, 6):
+        binary_tree.insert(value)
+
+    assert list(binary_tree) == [-1, 1, 2, 5, 6, 7, 10]
+    assert list(reversed(binary_tree)) == [10, 7, 6, 5, 2, 1, -1]
+    assert list(BinaryTree()) == []
+
+
+def test_irange(binary_tree):
+    for value in (5, 1, -1, 2, 10, 7, 6, 7):
+        binary_tree.insert(value)
+
+    assert list(binary_tree.irange(2, 7)) == [2, 5, 6, 7, 7]
+    assert list(binary_tree.irange(2, 7, inclusive=(False, False))) == [5, 6]
+    assert list(binary_tree.irange(3, 6.5)) == [5, 6]
+    assert list(binary_tree.irange(lo=6)) == [6, 7, 7, 10]
+    assert list(binary_tree.irange(hi=1, inclusive=(True, False))) == [-1]
+    assert list(binary_tree.irange(11, 20)) == []
+    assert list(binary_tree.irange()) == list(binary_tree)
+
+
+def test_irange_self_balancing():
+    from random import Random
+
+    rng = Random(3)
+    values = [rng.randrange(100) for _ in range(300)]
+    tree = BinaryTree(self_balancing=True)
+
+    for value in values:
+        tree.insert(value)
+
+    for lo, hi in ((10, 20), (0, 99), (50, 50), (60, 40)):
+        assert list(tree.irange(lo, hi)) == sorted(v for v in values if lo <= v <= hi)
+        assert list(tree.irange(lo, hi, inclusive=(False, True))) == sorted(
+            v for v in values if lo < v <= hi
+        )
+
+
+def check_sizes(root):
+    stack = [root]
+
+    while stack:
+        node = stack.pop()
+
+        if node is not None:
+            assert node.size == node.count + (node.left.size if node.left else 0) + (
+                node.right.size if node.right else 0
+            )
+            stack.extend((node.left, node.right))
+
+
+@pytest.mark.parametrize("self_balancing", [False, True])
+def test_order_statistics(self_balancing):
+    from random import Random
+
+    rng = Random(11)
+    values = [rng.randrange(50) for _ in range(200)]
+    tree = BinaryTree(self_balancing=self_balancing)
+
+    for value in values:
+        tree.insert(value)
+
+    check_sizes(tree.root)
+
+    for value in values[:100]:
+        tree.remove(value)
+
+    check_sizes(tree.root)
+    values = sorted(values[100:])
+
+    assert len(tree) == tree.root.size == 100
+    assert [tree.select(k) for k in range(100)] == values
+    assert tree.select(-1) == values[-1]
+    assert tree.median() == values[49]
+
+    for value in (-1, 0, 10, 25, 49, 60):
+        assert tree.rank(value) == sum(v < value for v in values)
+        assert tree.count_range(10, value) == sum(10 <= v <= value for v in values)
+        assert tree.count_range(value, 40, inclusive=(False, False)) == sum(
+            value < v < 40 for v in values
+        )
+
+    with pytest.raises(Exception):
+        tree.select(100)
+
+
+def test_median_empty(binary_tree):
+    with pytest.raises(Exception):
+        binary_tree.median()
+
+    binary_tree.insert(3)
+    binary_tree.insert(1)
+
+    assert binary_tree.median() == 1
+    assert binary_tree.rank(3) == 1
+
+
+def test_from_sorted():
+    tree = BinaryTree.from_sorted(range(1000))
+
+    assert len(tree) == 1000
+    assert check_avl(tree.root) == 10
+    assert list(tree) == list(range(1000))
+    assert tree.select(500) == 500
+    assert not tree.self_balancing
+
+    assert BinaryTree.from_sorted([]).root is None
+    assert BinaryTree.from_sorted([1, 1, 2], self_balancing=True).self_balancing
+
+    with pytest.raises(Exception):
+        BinaryTree.from_sorted([2, 1])
+
+
+def test_rebalance(binary_tree):
+    for i in range(100):
+        binary_tree.insert(i)
+
+    nodes = {id(node) for node in (binary_tree.search(i) for i in range(100))}
+    binary_tree.rebalance()
+
+    assert binary_tree.root.parent is None
+    assert check_avl(binary_tree.root) == 7
+    assert {id(binary_tree.search(i)) for i in range(100)} == nodes
+    assert binary_tree.inorder() == list(range(100))
+
+    binary_tree.insert(50.5)
+    binary_tree.remove(0)
+
+    assert binary_tree.rank(51) == 51
+
+
+@pytest.mark.parametrize("self_balancing", [False, True])
+def test_multiset(self_balancing):
+    from random import Random
+
+    rng = Random(13)
+    values = [rng.randrange(20) for _ in range(500)]
+    tree = BinaryTree(self_balancing=self_balancing, multiset=True)
+
+    for value in values:
+        tree.insert(value)
+
+    assert len(tree) == 500
+    assert tree.root.size == 500
+    assert list(tree) == sorted(values)
+    assert list(reversed(tree)) == sorted(values, reverse=True)
+    assert tree.inorder() == sorted(values)
+    assert tree.count(7) == values.count(7)
+    assert tree.count(20) == 0
+    assert list(tree.irange(5, 6)) == sorted(v for v in values if 5 <= v <= 6)
+    assert [tree.select(k) for k in range(500)] == sorted(values)
+    assert tree.rank(10) == sum(v < 10 for v in values)
+
+    nodes = []
+    stack = [tree.root]
+    while stack:
+        node = stack.pop()
+        if node is not None:
+            nodes.append(node)
+            stack.extend((node.left, node.right))
+
+    assert len(nodes) == len(set(values))
+
+    if self_balancing:
+        check_avl(tree.root)
+
+    tree.remove(7, n=values.count(7) - 1)
+    assert tree.count(7) == 1
+    check_sizes(tree.root)
+
+    with pytest.raises(Exception):
+        tree.remove(7, n=2)
+
+    tree.remove(7)
+    assert 7 not in tree
+    assert len(tree) == 500 - values.count(7)
+
+
+def test_remove_many_duplicates(binary_tree):
+    for value in (3, 1, 3, 2, 3):
+        binary_tree.insert(value)
+
+    assert binary_tree.count(3) == 3
+
+    with pytest.raises(Exception):
+        binary_tree.remove(3, n=4)
+
+    binary_tree.remove(3, n=2)
+
+    assert binary_tree.inorder() == [1, 2, 3]
+
+
+@pytest.mark.parametrize("multiset", [False, True])
+@pytest.mark.parametrize("n", [0, -1])
+def test_remove_rejects_non_positive_n(multiset, n):
+    tree = BinaryTree(multiset=multiset)
+
+    for value in (3, 1, 3):
+        tree.insert(value)
+
+    with pytest.raises(Exception):
+        tree.remove(3, n=n)
+
+    assert tree.count(3) == 2
+    assert len(tree) == 3
+
+
+def test_multiset_from_sorted():
+    tree = BinaryTree.from_sorted([1, 1, 2, 3, 3, 3], multiset=True)
+
+    assert len(tree) == 6
+    assert tree.root.size == 6
+    assert tree.count(3) == 3
+    assert list(tree) == [1, 1, 2, 3, 3, 3]
+    assert tree.median() == 2
@@ -0,0 +1,60 @@
+import pytest
+from threading import Thread
+from ..src.blocking_queue import BlockingQueue
+
+
+def test_fifo():
+    queue = BlockingQueue()
+
+    for i in range(3):
+        queue.enqueue(i)
+
+    assert str(queue) == "| 0 | 1 | 2 |"
+    assert queue.dequeue() == 0
+    assert len(queue) == 2
+
+
+def test_timeouts():
+    queue = BlockingQueue(maxsize=1)
+
+    with pytest.raises(Exception):
+        queue.dequeue(block=False)
+
+    with pytest.raises(Exception):
+        queue.dequeue(timeout=0.01)
+
+    queue.enqueue(1)
+
+    with pytest.raises(Exception):
+        queue.enqueue(2, block=False)
+
+    with pytest.raises(Exception):
+        queue.enqueue(2, timeout=0.01)
+
+    assert queue.dequeue(block=False) == 1
+    assert str(queue) == "| |"
+
+
+def test_producers_and_consumers():
+    queue = BlockingQueue(maxsize=8)
+    results = []
+
+    def produce(start):
+        for i in range(start, start + 500):
+            queue.enqueue(i)
+
+    def consume():
+        for _ in range(500):
+            results.append(queue.dequeue(timeout=10))
+
+    threads = [Thread(target=consume) for _ in range(4)]
+    threads += [Thread(target=produce, args=(i * 500,)) for i in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == list(range(2000))
+    assert len(queue) == 0
@@ -0,0 +1,80 @@
+import pytest
+from ..src.doubly_linked_list import DoublyLinkedList
+
+
+@pytest.fixture
+def linked_list():
+    return DoublyLinkedList()
+
+
+def test_append(linked_list):
+    assert str(linked_list) == "| |"
+
+    linked_list.append(1)
+    linked_list.append(2)
+
+    assert str(linked_list) == "| 1 | 2 |"
+    assert len(linked_list) == 2
+
+
+def test_iter(linked_list):
+    assert list(linked_list) == []
+
+    for i in range(5):
+        linked_list.append(i)
+
+    assert list(linked_list) == [0, 1, 2, 3, 4]
+    assert list(reversed(linked_list)) == [4, 3, 2, 1, 0]
+
+
+def test_iter_invalidated_by_mutation(linked_list):
+    for i in range(3):
+        linked_list.append(i)
+
+    with pytest.raises(RuntimeError):
+        for item in linked_list:
+            linked_list.append(item)
+
+    with pytest.raises(RuntimeError):
+        for item in reversed(linked_list):
+            linked_list.remove(item=item)
+
+
+def test_getitem(linked_list):
+    for i in range(7):
+        linked_list.append(i)
+
+    assert [linked_list[i].item for i in range(7)] == list(range(7))
+    assert linked_list[-1].item == 6
+    assert linked_list[-7].item == 0
+    assert linked_list[7].item is None
+    assert linked_list[-8].item is None
+
+
+def test_slice(linked_list):
+    for i in range(7):
+        linked_list.append(i)
+
+    assert list(linked_list[2:5]) == [2, 3, 4]
+    assert list(linked_list[::2]) == [0, 2, 4, 6]
+    assert list(linked_list[::-3]) == [6, 3, 0]
+    assert list(linked_list[-2:]) == [5, 6]
+    assert list(linked_list[5:2]) == []
+    assert isinstance(linked_list[1:3], DoublyLinkedList)
+
+
+def test_insert_and_remove_near_the_end(linked_list):
+    for i in range(6):
+        linked_list.append(i)
+
+    linked_list.insert(10, 5)
+    linked_list.insert(20, 1)
+
+    assert list(linked_list) == [0, 20, 1, 2, 3, 4, 10, 5]
+    assert list(reversed(linked_list)) == [5, 10, 4, 3, 2, 1, 20, 0]
+
+    linked_list.remove(index=-2)
+    linked_list.remove(index=6)
+
+    assert list(linked_list) == [0, 20, 1, 2, 3, 4]
+    assert list(reversed(linked_list)) == [4, 3, 2, 1, 20, 0]
@@ -1,4 +1,5 @@
 import pytest
+from random import Random
 from ..src.dynamic_hashset import DynamicHashSet
 
 
@@ -80,5 +81,246 @@ def test_string_set(hashset):
     assert str(hashset) == "{1, 2, 3}"
 
 
+class CountingKey:
+    hash_calls = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        CountingKey.hash_calls += 1
+        return hash(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, CountingKey) and self.value == other.value
+
+
+def test_keys_are_hashed_once(hashset):
+    keys = [CountingKey(i) for i in range(100)]
+    CountingKey.hash_calls = 0
+
+    for key in keys:
+        hashset.add(key)
+
+    assert hashset.capacity > 10
+    assert CountingKey.hash_calls == 100
+    assert all(key in hashset for key in keys)
+
+    for key in keys:
+        hashset.remove(key)
+
+    assert len(hashset) == 0
+    assert CountingKey.hash_calls == 300
+
+
+def test_no_resize_thrashing():
+    hashset = DynamicHashSet(load_factor_threshold=0.5)
+
+    for i in range(6):
+        hashset.add(i)
+
+    assert hashset.capacity == 20
+    assert hashset.shrink_threshold < 0.25
+
+    for _ in range(10):
+        hashset.remove(5)
+        hashset.add(5)
+
+    assert hashset.capacity == 20
+
+    with pytest.raises(Exception):
+        DynamicHashSet(load_factor_threshold=0.5, shrink_threshold=0.3)
+
+
+def test_min_capacity():
+    hashset = DynamicHashSet(capacity=4, min_capacity=8)
+
+    for i in range(40):
+        hashset.add(i)
+
+    for i in range(40):
+        hashset.remove(i)
+
+    assert hashset.capacity == 8
+
+
+def test_reserve(hashset):
+    hashset.reserve(1000)
+    capacity = hashset.capacity
+
+    assert 1000 / capacity <= hashset.load_factor_threshold
+
+    for i in range(1000):
+        hashset.add(i)
+
+    assert hashset.capacity == capacity
+
+    hashset.reserve(10)
+
+    assert hashset.capacity == capacity
+
+
+def test_shrink_to_fit(hashset):
+    hashset.reserve(1000)
+
+    for i in range(30):
+        hashset.add(i)
+
+    hashset.shrink_to_fit()
+
+    assert hashset.capacity == 40
+    assert all(i in hashset for i in range(30))
+
+    hashset.shrink_to_fit()
+
+    assert hashset.capacity == 40
+
+
+def test_update(hashset):
+    hashset.add(1)
+    hashset.update([1, 2, 3, 2])
+
+    assert len(hashset) == 3
+
+    hashset.update(i for i in range(1000))
+
+    assert len(hashset) == 1000
+    assert all(i in hashset for i in range(1000))
+    assert len(hashset) / hashset.capacity <= hashset.load_factor_threshold
+
+
+def test_from_iterable():
+    keys = list(range(1000)) * 2
+    hashset = DynamicHashSet.from_iterable(keys, load_factor_threshold=0.5)
+
+    assert len(hashset) == 1000
+    assert hashset.capacity == 4000
+    assert all(i in hashset for i in range(1000))
+
+
+def test_set_algebra_reuses_hashes():
+    first = DynamicHashSet.from_iterable(CountingKey(i) for i in range(50))
+    second = DynamicHashSet.from_iterable(CountingKey(i) for i in range(25, 100))
+    CountingKey.hash_calls = 0
+
+    union = first | second
+    intersection = first & second
+    difference = first - second
+    symmetric_difference = first ^ second
+
+    assert CountingKey.hash_calls == 0
+    assert len(union) == 100
+    assert len(intersection) == 25
+    assert len(difference) == 25
+    assert len(symmetric_difference) == 75
+    assert intersection.issubset(first) and intersection.issubset(second)
+    assert intersection.capacity < union.capacity
+
+
+def test_set_algebra_in_place():
+    hashset = DynamicHashSet.from_iterable(range(100), incremental_resize=True)
+
+    hashset -= DynamicHashSet.from_iterable(range(0, 100, 2))
+    hashset &= DynamicHashSet.from_iterable(range(50))
+
+    assert sorted(hashset) == list(range(1, 50, 2))
+    assert hashset.contains_many([1, 2, 3]) == [True, False, True]
+
+
+def test_incremental_resize():
+    hashset = DynamicHashSet(incremental_resize=True, rehash_step=2)
+
+    for i in range(8):
+        hashset.add(i)
+
+    assert hashset.capacity == 20
+    assert hashset.is_rehashing()
+    assert all(i in hashset for i in range(8))
+    assert hashset.is_rehashing()
+
+    for i in range(8, 13):
+        hashset.add(i)
+
+    assert not hashset.is_rehashing()
+    assert len(hashset) == 13
+    assert str(hashset) == "{" + ", ".join(str(i) for i in range(13)) + "}"
+
+
+def test_iterate_with_lookups_during_incremental_resize():
+    rng = Random(7)
+
+    for _ in range(50):
+        hashset = DynamicHashSet(incremental_resize=True, rehash_step=rng.randint(1, 3))
+        keys = rng.sample(range(10 ** 6), rng.randint(8, 200))
+
+        for key in keys:
+            hashset.add(key)
+
+        if not hashset.is_rehashing():
+            continue
+
+        seen = []
+        for key in hashset:
+            assert key in hashset
+            assert (-key - 1) not in hashset
+            seen.append(key)
+
+        assert sorted(seen) == sorted(keys)
+        assert hashset.is_rehashing()
+
+
+def test_migrated_old_buckets_are_emptied():
+    hashset = DynamicHashSet(incremental_resize=True, rehash_step=1)
+
+    for i in range(8):
+        hashset.add(i)
+
+    old_bucket = hashset._old_buckets[0]
+    hashset.add(8)
+
+    assert hashset._old_buckets[0] is None
+    assert len(old_bucket) == 0
+    assert list(old_bucket) == []
+    assert 0 in hashset
+
+
+def test_incremental_resize_keeps_every_key():
+    hashset = DynamicHashSet(incremental_resize=True, rehash_step=2)
+
+    for i in range(1000):
+        hashset.add(i)
+        assert i in hashset
+
+    for i in range(0, 1000, 3):
+        hashset.remove(i)
+
+    assert len(hashset) == 666
+    assert all((i in hashset) == (i % 3 != 0) for i in range(1000))
+
+    for i in range(1000):
+        if i % 3 != 0:
+            hashset.remove(i)
+
+    assert len(hashset) == 0
+    assert hashset.capacity == 10
+
+
+def test_incremental_resize_creates_buckets_lazily():
+    hashset = DynamicHashSet(capacity=1000, incremental_resize=True, rehash_step=1)
+
+    for i in range(751):
+        hashset.add(i)
+
+    assert hashset.is_rehashing()
+    assert hashset.capacity == 2000
+    created = sum(bucket is not None for bucket in hashset.buckets)
+    assert created <= 2
+    assert all(i in hashset for i in range(751))
+
+    hashset.remove(0)
+    assert 0 not in hashset
+    assert len(hashset) == 750
+
+
 if __name__ == '__main__':
     print("MAIN")
\ No newline at end of file
@@ -0,0 +1,132 @@
+import pytest
+from ..src.hashset import HashSet, OpenAddressingHashSet
+
+
+@pytest.fixture(params=[None, "linear", "quadratic"])
+def hashset(request):
+    return HashSet(probing=request.param)
+
+
+def test_probing_option():
+    assert type(HashSet()) is HashSet
+    assert type(HashSet(probing="linear")) is OpenAddressingHashSet
+
+    with pytest.raises(Exception):
+        HashSet(probing="cuckoo")
+
+
+def test_size(hashset):
+    hashset.add(1)
+    hashset.add(2)
+    hashset.add(2)
+
+    assert len(hashset) == 2
+
+    hashset.remove(1)
+    hashset.remove(2)
+
+    assert len(hashset) == 0
+
+
+def test_contains(hashset):
+    hashset.add(0)
+    hashset.add(11)
+
+    assert 0 in hashset
+    assert 11 in hashset
+    assert 10 not in hashset
+    assert 1 not in hashset
+
+    hashset.remove(11)
+
+    assert 11 not in hashset
+
+
+def test_remove(hashset):
+    with pytest.raises(Exception):
+        hashset.remove(1)
+
+
+def test_many_keys(hashset):
+    for i in range(1000):
+        hashset.add(str(i))
+
+    for i in range(0, 1000, 2):
+        hashset.remove(str(i))
+
+    assert len(hashset) == 500
+    assert all((str(i) in hashset) == (i % 2 == 1) for i in range(1000))
+
+
+def test_tombstones_are_compacted():
+    hashset = HashSet(probing="linear")
+
+    for i in range(10000):
+        hashset.add(i)
+        hashset.remove(i)
+
+    assert len(hashset) == 0
+    assert hashset.capacity == 16
+    assert hashset.tombstones * 4 <= hashset.capacity
+
+
+def test_update(hashset):
+    hashset.add(1)
+    hashset.update([1, 2, 3, 2])
+    hashset.update(i for i in range(100))
+
+    assert len(hashset) == 100
+    assert all(i in hashset for i in range(100))
+
+
+@pytest.mark.parametrize("probing", [None, "linear", "quadratic"])
+def test_from_iterable(probing):
+    hashset = HashSet.from_iterable(range(500), probing=probing)
+
+    assert len(hashset) == 500
+    assert all(i in hashset for i in range(500))
+    assert 500 not in hashset
+
+
+def test_set_algebra(hashset):
+    hashset.update(range(10))
+    other = HashSet.from_iterable(range(5, 15), probing="linear")
+
+    assert sorted(hashset | other) == list(range(15))
+    assert sorted(hashset & other) == list(range(5, 10))
+    assert sorted(hashset - other) == list(range(5))
+    assert sorted(hashset ^ other) == list(range(5)) + list(range(10, 15))
+    assert sorted(hashset.union([20, 21])) == list(range(10)) + [20, 21]
+    assert sorted(hashset.intersection(range(8, 100))) == [8, 9]
+
+    assert hashset.intersection(range(3)).issubset(hashset)
+    assert hashset.issuperset([1, 2, 3])
+    assert not hashset.issubset(other)
+    assert hashset.isdisjoint(range(10, 20))
+    found = hashset.contains_many([0, 10, 9, -1])
+
+    assert type(found) is list
+    assert all(type(flag) is bool for flag in found)
+    assert found == [True, False, True, False]
+    assert hashset.contains_many(sorted(other)) == [True] * 5 + [False] * 5
+    assert hashset.contains_many([]) == []
+
+
+def test_set_algebra_in_place(hashset):
+    hashset.update(range(10))
+
+    hashset &= HashSet.from_iterable(range(5, 15))
+    assert sorted(hashset) == list(range(5, 10))
+
+    hashset |= HashSet.from_iterable([1, 2])
+    assert sorted(hashset) == [1, 2, 5, 6, 7, 8, 9]
+
+    hashset -= HashSet.from_iterable([5, 6, 100])
+    assert sorted(hashset) == [1, 2, 7, 8, 9]
+
+    hashset ^= HashSet.from_iterable([1, 3])
+    assert sorted(hashset) == [2, 3, 7, 8, 9]
+    assert len(hashset) == 5
+
+    hashset ^= hashset
+    assert len(hashset) == 0
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+from ..src.indexed_doubly_linked_list import IndexedDoublyLinkedList
+
+
+@pytest.fixture
+def linked_list():
+    return IndexedDoublyLinkedList()
+
+
+def assert_same(linked_list, expected):
+    assert len(linked_list) == len(expected)
+    assert list(linked_list) == expected
+    assert list(reversed(linked_list)) == expected[::-1]
+    assert [linked_list[i].item for i in range(len(expected))] == expected
+
+
+def test_append_and_getitem(linked_list):
+    for i in range(200):
+        linked_list.append(i)
+
+    assert_same(linked_list, list(range(200)))
+    assert linked_list[-1].item == 199
+    assert linked_list[200].item is None
+
+
+def test_insert(linked_list):
+    expected = []
+
+    for i in range(200):
+        pos = random.randint(0, len(expected))
+        linked_list.insert(i, pos)
+        expected.insert(pos, i)
+
+    assert_same(linked_list, expected)
+
+    with pytest.raises(Exception):
+        linked_list.insert(1, 202)
+
+
+def test_remove_at_both_ends(linked_list):
+    expected = list(range(100))
+    for i in expected:
+        linked_list.append(i)
+
+    for _ in range(30):
+        linked_list.remove(index=0)
+        expected.pop(0)
+        linked_list.remove(index=-1)
+        expected.pop()
+
+    assert_same(linked_list, expected)
+
+
+def test_random_operations(linked_list):
+    random.seed(7)
+    expected = []
+
+    for i in range(2000):
+        operation = random.random()
+
+        if operation < 0.3 or not expected:
+            linked_list.append(i)
+            expected.append(i)
+        elif operation < 0.55:
+            pos = random.randint(0, len(expected))
+            linked_list.insert(i, pos)
+            expected.insert(pos, i)
+        elif operation < 0.8:
+            index = random.randrange(len(expected))
+            linked_list.remove(index=index)
+            expected.pop(index)
+        elif operation < 0.9:
+            item = random.choice(expected)
+            linked_list.remove(item=item)
+            expected.remove(item)
+        else:
+            linked_list.insert(i, 0)
+            expected.insert(0, i)
+
+        if i % 97 == 0:
+            assert_same(linked_list, expected)
+
+    assert_same(linked_list, expected)
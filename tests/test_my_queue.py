@@ -0,0 +1,186 @@
+import pytest
+from ..src.my_queue import ArrayQueue, Queue, RingBufferQueue
+
+
+@pytest.mark.parametrize("engine", [None, "array"])
+def test_queue(engine):
+    queue = Queue(engine=engine)
+
+    with pytest.raises(Exception):
+        queue.dequeue()
+
+    for i in range(3):
+        queue.enqueue(i)
+
+    assert queue.dequeue().item == 0
+    assert len(queue) == 2
+    assert str(queue) == "| 1 | 2 |"
+
+
+
+def test_array_queue():
+    queue = Queue(engine="array")
+
+    assert isinstance(queue, ArrayQueue)
+    assert isinstance(Queue(), Queue)
+
+    with pytest.raises(Exception):
+        Queue(engine="ring")
+
+    for i in range(4):
+        queue.enqueue(i)
+
+    slots = len(queue.items)
+
+    for i in range(4, 100):
+        assert queue.dequeue().item == i - 4
+        queue.enqueue(i)
+
+    assert len(queue.items) == slots
+    assert queue[0].item == 96
+
+    batch = queue.dequeue_many(2)
+
+    assert isinstance(batch, ArrayQueue)
+    assert str(batch) == "| 96 | 97 |"
+    assert queue.drain() == [98, 99]
+
+    other = Queue()
+    other.enqueue_many("ab")
+    queue.enqueue_many(other)
+
+    assert len(other) == 2
+
+    queue.splice(other)
+
+    assert len(other) == 0
+    assert str(queue) == "| a | b | a | b |"
+
+    with pytest.raises(Exception):
+        queue.splice(queue)
+
+
+@pytest.fixture
+def ring_queue():
+    return RingBufferQueue(capacity=4)
+
+
+def test_ring_buffer_queue(ring_queue):
+    with pytest.raises(Exception):
+        ring_queue.dequeue()
+
+    assert str(ring_queue) == "| |"
+
+    for i in range(3):
+        ring_queue.enqueue(i)
+
+    assert ring_queue.dequeue() == 0
+    assert ring_queue.peek() == 1
+
+    ring_queue.enqueue(3)
+    ring_queue.enqueue(4)
+
+    # The last item wraps around the end of the buffer.
+    assert ring_queue.capacity == 4
+    assert ring_queue.items == [4, 1, 2, 3]
+    assert str(ring_queue) == "| 1 | 2 | 3 | 4 |"
+
+    ring_queue.enqueue(5)
+
+    assert ring_queue.capacity == 8
+    assert list(ring_queue) == [1, 2, 3, 4, 5]
+    assert [ring_queue.dequeue() for _ in range(5)] == [1, 2, 3, 4, 5]
+    assert len(ring_queue) == 0
+
+
+def test_ring_buffer_queue_grows_and_shrinks(ring_queue):
+    for i in range(1000):
+        ring_queue.enqueue(i)
+
+    assert ring_queue.capacity == 1024
+
+    for i in range(998):
+        assert ring_queue.dequeue() == i
+
+    assert ring_queue.capacity == 4
+    assert list(ring_queue) == [998, 999]
+    assert RingBufferQueue(capacity=5).capacity == 8
+
+
+def test_queue_batches():
+    queue = Queue()
+    queue.enqueue_many(range(10))
+
+    batch = queue.dequeue_many(3)
+
+    assert isinstance(batch, Queue)
+    assert str(batch) == "| 0 | 1 | 2 |"
+    assert queue.drain(2) == [3, 4]
+    assert len(queue) == 5
+
+    other = Queue()
+    other.enqueue_many(["a", "b"])
+    queue.enqueue_many(other)
+
+    assert str(other) == "| a | b |"
+    assert queue.drain(5) == [5, 6, 7, 8, 9]
+
+    queue.splice(Queue())
+    queue.splice(other)
+
+    assert len(other) == 0
+    assert list(other) == []
+    assert str(queue) == "| a | b | a | b |"
+
+    with pytest.raises(Exception):
+        queue.splice(queue)
+
+    queue.drain(2)
+    other.splice(queue)
+
+    assert len(queue) == 0
+    assert str(other) == "| a | b |"
+
+    queue.enqueue_many(range(5, 10))
+    queue.splice(other)
+
+    assert str(queue) == "| 5 | 6 | 7 | 8 | 9 | a | b |"
+    assert list(reversed(queue))[0] == "b"
+
+    batch.enqueue_many(batch)
+
+    assert list(batch) == [0, 1, 2, 0, 1, 2]
+    assert queue.drain() == [5, 6, 7, 8, 9, "a", "b"]
+    assert queue.drain(5) == []
+    assert len(queue.dequeue_many(5)) == 0
+
+    queue.enqueue(1)
+
+    assert queue.dequeue().item == 1
+
+
+def test_ring_buffer_queue_batches(ring_queue):
+    ring_queue.enqueue_many([0, 1, 2])
+    ring_queue.dequeue()
+    ring_queue.enqueue_many([3, 4])
+
+    assert ring_queue.items == [4, 1, 2, 3]
+
+    ring_queue.enqueue_many(range(5, 20))
+
+    assert ring_queue.capacity == 32
+    assert ring_queue.drain(3) == [1, 2, 3]
+
+    batch = ring_queue.dequeue_many(4)
+
+    assert isinstance(batch, RingBufferQueue)
+    assert list(batch) == [4, 5, 6, 7]
+    assert ring_queue.drain() == list(range(8, 20))
+    assert ring_queue.capacity == 4
+    assert ring_queue.drain() == []
+
+    ring_queue.enqueue_many([1, 2, 3])
+    ring_queue.drain(2)
+    ring_queue.enqueue_many([4, 5, 6])
+
+    assert ring_queue.drain(10) == [3, 4, 5, 6]
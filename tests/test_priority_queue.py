@@ -0,0 +1,105 @@
+import pytest
+from random import Random
+from ..src.priority_queue import PriorityQueue
+
+
+def check_heap(queue):
+    for index in range(1, len(queue)):
+        assert not queue.priorities[index] < queue.priorities[(index - 1) // queue.d]
+
+    assert all(queue.positions[item] == index for index, item in enumerate(queue.items))
+
+
+@pytest.mark.parametrize("d", [2, 3, 4, 8])
+def test_push_pop(d):
+    rng = Random(d)
+    values = rng.sample(range(10000), 500)
+    queue = PriorityQueue(d)
+
+    for value in values:
+        queue.push(value)
+
+    check_heap(queue)
+
+    assert queue.peek() == min(values)
+    assert [queue.pop() for _ in range(500)] == sorted(values)
+
+    with pytest.raises(Exception):
+        queue.pop()
+
+    with pytest.raises(Exception):
+        queue.peek()
+
+
+def test_priorities_and_aliases():
+    queue = PriorityQueue()
+    queue.enqueue("low", 10)
+    queue.enqueue("high", 1)
+    queue.enqueue("mid", 5)
+
+    assert "mid" in queue
+    assert queue.priority("mid") == 5
+    assert queue.peek_priority() == 1
+    assert queue.dequeue() == "high"
+    assert str(queue) == "| mid | low |"
+
+    with pytest.raises(Exception):
+        queue.push("low", 3)
+
+
+def test_heapify():
+    rng = Random(1)
+    values = rng.sample(range(1000), 300)
+    queue = PriorityQueue(3)
+    queue.push(-1)
+    queue.heapify(values[:200])
+    queue.heapify(values[200:], (-value for value in values[200:]))
+
+    check_heap(queue)
+
+    expected = sorted([(-1, -1)] + [(v, v) for v in values[:200]] + [(-v, v) for v in values[200:]])
+
+    assert [queue.pop() for _ in range(301)] == [item for _, item in expected]
+
+    with pytest.raises(Exception):
+        queue.heapify([1, 1])
+
+    with pytest.raises(Exception):
+        queue.heapify([1, 2], [1])
+
+    assert len(queue) == 0
+
+
+def test_decrease_key():
+    queue = PriorityQueue(2)
+    queue.heapify(["a", "b", "c", "d", "e"], [5, 4, 3, 2, 1])
+    queue.decrease_key("a", 0)
+
+    check_heap(queue)
+
+    assert queue.peek() == "a"
+
+    with pytest.raises(Exception):
+        queue.decrease_key("b", 10)
+
+    with pytest.raises(Exception):
+        queue.decrease_key("z", 0)
+
+    assert [queue.pop() for _ in range(5)] == ["a", "e", "d", "c", "b"]
+
+
+def test_pushpop():
+    queue = PriorityQueue()
+
+    assert queue.pushpop(5) == 5
+    assert len(queue) == 0
+
+    queue.heapify([3, 7, 9])
+
+    assert queue.pushpop(1) == 1
+    assert queue.pushpop(8) == 3
+    assert 3 not in queue
+
+    check_heap(queue)
+
+    assert [queue.pop() for _ in range(3)] == [7, 8, 9]
@@ -0,0 +1,91 @@
+import pytest
+from random import Random
+from ..src.sorted_list import SortedList
+
+
+@pytest.fixture
+def sorted_list():
+    return SortedList(load=4)
+
+
+def check_sublists(sorted_list):
+    lists = sorted_list._lists
+
+    assert sum(len(sublist) for sublist in lists) == len(sorted_list)
+    assert sorted_list._maxes == [sublist[-1] for sublist in lists]
+    assert all(0 < len(sublist) <= 2 * sorted_list.load for sublist in lists)
+
+
+def test_insert_and_search(sorted_list):
+    for value in (5, 1, -1, 2, 10, 7, 6):
+        sorted_list.insert(value)
+
+    assert str(sorted_list) == "[-1, 1, 2, 5, 6, 7, 10]"
+    assert sorted_list.inorder() == [-1, 1, 2, 5, 6, 7, 10]
+    assert sorted_list.search(7) == 5
+    assert sorted_list.search(3) is None
+    assert 6 in sorted_list and 11 not in sorted_list
+    check_sublists(sorted_list)
+
+
+def test_remove(sorted_list):
+    with pytest.raises(Exception):
+        sorted_list.remove(1)
+
+    rng = Random(1)
+    values = [rng.randrange(100) for _ in range(300)]
+
+    for value in values:
+        sorted_list.insert(value)
+
+    rng.shuffle(values)
+
+    for value in values[:250]:
+        sorted_list.remove(value)
+        check_sublists(sorted_list)
+
+    assert list(sorted_list) == sorted(values[250:])
+    assert list(reversed(sorted_list)) == sorted(values[250:], reverse=True)
+
+    with pytest.raises(Exception):
+        sorted_list.remove(100)
+
+
+def test_range_queries():
+    rng = Random(2)
+    values = sorted(rng.randrange(50) for _ in range(200))
+    sorted_list = SortedList(reversed(values), load=8)
+
+    assert list(sorted_list) == values
+    assert list(sorted_list.irange(10, 20)) == [v for v in values if 10 <= v <= 20]
+    assert list(sorted_list.irange(10, 20, inclusive=(False, False))) == [
+        v for v in values if 10 < v < 20
+    ]
+    assert list(sorted_list.irange(hi=5)) == [v for v in values if v <= 5]
+    assert list(sorted_list.irange(30, 20)) == []
+    assert [sorted_list.select(k) for k in range(200)] == values
+    assert sorted_list.median() == values[99]
+
+    for value in (-1, 10, 25, 60):
+        assert sorted_list.rank(value) == sum(v < value for v in values)
+        assert sorted_list.count_range(10, value) == sum(10 <= v <= value for v in values)
+
+    with pytest.raises(Exception):
+        sorted_list.select(200)
+
+
+def test_from_sorted():
+    sorted_list = SortedList.from_sorted(range(100), load=16)
+
+    assert len(sorted_list._lists) == 7
+    assert sorted_list.search(99) == 99
+
+    sorted_list.insert(50)
+
+    assert sorted_list.count_range(50, 50) == 2
+
+    with pytest.raises(Exception):
+        SortedList.from_sorted([2, 1])
+
+    with pytest.raises(Exception):
+        SortedList(load=2)
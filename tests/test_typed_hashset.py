@@ -0,0 +1,134 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ..src.typed_hashset import TypedHashSet  # noqa: E402
+
+
+@pytest.fixture
+def hashset():
+    return TypedHashSet()
+
+
+def test_size(hashset):
+    hashset.add(1)
+    hashset.add(2)
+    hashset.add(2)
+
+    assert len(hashset) == 2
+
+    hashset.remove(1)
+    hashset.remove(2)
+
+    assert len(hashset) == 0
+
+
+def test_remove(hashset):
+    with pytest.raises(Exception):
+        hashset.remove(1)
+
+    hashset.add_many([1, 2])
+
+    with pytest.raises(Exception):
+        hashset.remove_many([1, 3])
+
+    assert len(hashset) == 2
+
+
+def test_batch_operations(hashset):
+    keys = np.arange(0, 20000, 2, dtype=np.int64)
+
+    hashset.add_many(keys)
+    hashset.add_many(keys[:100])
+
+    assert len(hashset) == 10000
+    assert hashset.contains_many(np.arange(10)).tolist() == [True, False] * 5
+
+    hashset.remove_many(keys[:5000])
+
+    assert len(hashset) == 5000
+    assert not hashset.contains_many(keys[:5000]).any()
+    assert hashset.contains_many(keys[5000:]).all()
+    assert sorted(hashset) == keys[5000:].tolist()
+
+
+def test_churn_keeps_table_small(hashset):
+    for start in range(0, 10000, 100):
+        batch = np.arange(start, start + 100)
+        hashset.add_many(batch)
+        hashset.remove_many(batch)
+
+    assert len(hashset) == 0
+    assert hashset.capacity == hashset.initial_capacity
+
+
+def test_float_keys():
+    hashset = TypedHashSet(dtype=np.float64)
+    hashset.add_many([0.5, -0.0, 1.25])
+
+    assert 0.0 in hashset
+    assert 0.5 in hashset
+    assert 0.25 not in hashset
+    assert len(hashset) == 3
+
+    with pytest.raises(Exception):
+        hashset.add(float("nan"))
+
+
+def test_rejects_lossy_keys(hashset):
+    with pytest.raises(Exception):
+        hashset.add(1.5)
+
+
+def test_rejects_unsigned_keys_out_of_range(hashset):
+    hashset.add_many(np.array([1, 2**63 - 1], dtype=np.uint64))
+
+    assert 2**63 - 1 in hashset
+
+    with pytest.raises(Exception):
+        hashset.add_many(np.array([3, 2**63], dtype=np.uint64))
+
+    with pytest.raises(Exception):
+        hashset.add(2**64 - 1)
+
+    assert len(hashset) == 2
+    assert -1 not in hashset
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float64])
+def test_empty_batches(dtype):
+    hashset = TypedHashSet(dtype=dtype)
+    hashset.add_many([1, 2])
+
+    hashset.add_many([])
+    hashset.remove_many([])
+    found = hashset.contains_many([])
+
+    assert found.dtype == bool and found.size == 0
+    assert len(hashset) == 2
+
+
+def test_lookups_of_other_types(hashset):
+    hashset.add_many([1, 2, -5])
+
+    assert 1.0 in hashset and -5.0 in hashset
+    assert 1.5 not in hashset
+    assert "a" not in hashset
+    assert None not in hashset
+    assert (1, 2) not in hashset
+    assert float("nan") not in hashset
+    assert 2**64 - 1 not in hashset
+    assert list(hashset.contains_many([1.0, 1.5, 2.0, 3.0])) == [True, False, True, False]
+    assert not hashset.contains_many(["a", "b"]).any()
+
+    with pytest.raises(Exception):
+        hashset.add_many([1.5])
+
+    with pytest.raises(Exception):
+        hashset.remove_many(["a"])
+
+
+@pytest.mark.parametrize("load_factor_threshold", [0, 1, 1.5, -0.5])
+def test_rejects_bad_load_factor(load_factor_threshold):
+    with pytest.raises(Exception):
+        TypedHashSet(load_factor_threshold=load_factor_threshold)